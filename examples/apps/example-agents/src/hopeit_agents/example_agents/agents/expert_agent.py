@@ -9,6 +9,7 @@ from hopeit.dataobjects.payload import Payload
 
 from hopeit_agents.agent_toolkit.agents.agent_config import create_agent_config
 from hopeit_agents.agent_toolkit.agents.prompts import render_prompt
+from hopeit_agents.agent_toolkit.agents.templates import load_prompt_template
 from hopeit_agents.agent_toolkit.app.steps.agent_loop import (
     AgentLoopConfig,
     AgentLoopPayload,
@@ -54,10 +55,8 @@ async def init_conversation(payload: ExpertAgentRequest, context: EventContext)
     agent_settings = context.settings(key="expert_agent_llm", datatype=AgentSettings)
     mcp_settings = context.settings(key="mcp_client_example_tools", datatype=MCPClientConfig)
 
-    with open(agent_settings.system_prompt_template) as f:
-        system_prompt_template = f.read()
-    with open(agent_settings.tool_prompt_template) as f:
-        tool_prompt_template = f.read()
+    system_prompt_template = load_prompt_template(agent_settings.system_prompt_template)
+    tool_prompt_template = load_prompt_template(agent_settings.tool_prompt_template)
 
     agent_config = create_agent_config(
         name=agent_settings.agent_name,
@@ -83,7 +82,11 @@ async def init_conversation(payload: ExpertAgentRequest, context: EventContext)
             {
                 "expert_agent_result_schema": Payload.to_json(result_schema),
                 "tool_descriptions": tool_descriptions(
-                    tools, include_schemas=agent_settings.include_tool_schemas_in_prompt
+                    tools,
+                    include_schemas=agent_settings.include_tool_schemas_in_prompt,
+                    compact=agent_settings.compact_tool_rendering,
+                    schemas_in_tools=True,
+                    agent_name=agent_settings.agent_name,
                 ),
             },
             include_tools=agent_config.enable_tools,
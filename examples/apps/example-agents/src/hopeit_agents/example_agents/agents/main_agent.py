@@ -6,6 +6,7 @@ from hopeit.app.logger import app_extra_logger
 
 from hopeit_agents.agent_toolkit.agents.agent_config import create_agent_config
 from hopeit_agents.agent_toolkit.agents.prompts import render_prompt
+from hopeit_agents.agent_toolkit.agents.templates import load_prompt_template
 from hopeit_agents.agent_toolkit.app.steps.agent_loop import (
     AgentLoopConfig,
     AgentLoopPayload,
@@ -45,10 +46,8 @@ async def init_conversation(payload: AgentRequest, context: EventContext) -> Age
     assert agent_settings.system_prompt_template, "missing system_prompt_template"
     assert agent_settings.tool_prompt_template, "missing tool_prompt_template"
 
-    with open(agent_settings.system_prompt_template) as f:
-        system_prompt_template = f.read()
-    with open(agent_settings.tool_prompt_template) as f:
-        tool_prompt_template = f.read()
+    system_prompt_template = load_prompt_template(agent_settings.system_prompt_template)
+    tool_prompt_template = load_prompt_template(agent_settings.tool_prompt_template)
 
     agent_config = create_agent_config(
         name=agent_settings.agent_name,
@@ -72,7 +71,11 @@ async def init_conversation(payload: AgentRequest, context: EventContext) -> Age
             agent_config,
             {
                 "tool_descriptions": tool_descriptions(
-                    tools, include_schemas=agent_settings.include_tool_schemas_in_prompt
+                    tools,
+                    include_schemas=agent_settings.include_tool_schemas_in_prompt,
+                    compact=agent_settings.compact_tool_rendering,
+                    schemas_in_tools=True,
+                    agent_name=agent_settings.agent_name,
                 )
             },
             include_tools=agent_config.enable_tools,
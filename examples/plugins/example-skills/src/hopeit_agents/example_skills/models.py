@@ -51,3 +51,19 @@ class SumTwoNumberResponse:
     """Response for the sum two numbers skill."""
 
     result: int
+
+
+@dataobject
+@dataclass
+class CountPrimesRequest:
+    """Request payload for the count primes skill."""
+
+    limit: int
+
+
+@dataobject
+@dataclass
+class CountPrimesResponse:
+    """Response for the count primes skill."""
+
+    count: int
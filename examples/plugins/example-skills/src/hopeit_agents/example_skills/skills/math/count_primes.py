@@ -0,0 +1,33 @@
+"""Count prime numbers skill event."""
+
+from hopeit.app.context import EventContext
+from hopeit.app.logger import app_extra_logger
+
+from hopeit_agents.skills.api import agent_skill
+from hopeit_agents.skills.models import SkillExecutionBackend
+
+from ...models import CountPrimesRequest, CountPrimesResponse
+
+__steps__ = ["count_primes"]
+
+__skill__ = agent_skill(
+    summary="hopeit_agents example skill: count prime numbers",
+    description="Skill to count the prime numbers lower than a given limit",
+    payload=(CountPrimesRequest, "Count primes request"),
+    response=(CountPrimesResponse, "Count primes response"),
+    backend=SkillExecutionBackend.PROCESS,
+)
+
+logger, extra = app_extra_logger()
+
+
+async def count_primes(
+    payload: CountPrimesRequest,
+    context: EventContext,
+) -> CountPrimesResponse:
+    """Return how many primes are lower than limit, by trial division (CPU-bound)."""
+    count = 0
+    for n in range(2, payload.limit):
+        if all(n % d for d in range(2, int(n**0.5) + 1)):
+            count += 1
+    return CountPrimesResponse(count=count)
@@ -0,0 +1,83 @@
+"""Benchmark event loop lag while running a CPU-bound skill with each backend.
+
+A ticker coroutine sleeps for `TICK_MS` in a loop and records how late it wakes up
+while `CALLS` concurrent `count_primes` skill calls run. Inline execution blocks the
+event loop for the whole computation. The thread backend only shortens the stalls
+to the GIL switch interval for pure Python code, and the process backend keeps the
+event loop responsive.
+
+Run from the repository root with::
+
+    python examples/plugins/example-skills/test/benchmark/bench_skill_backends.py
+"""
+
+import asyncio
+from dataclasses import replace
+from time import perf_counter
+from typing import Any
+
+from hopeit.testing.apps import config, create_test_context, execute_event
+
+from hopeit_agents.example_skills.models import CountPrimesRequest
+from hopeit_agents.skills import executors
+from hopeit_agents.skills.api import extract_app_skill_specs
+from hopeit_agents.skills.models import SkillExecutionBackend, SkillsSettings
+
+APP_CONFIG = "examples/plugins/example-skills/config/plugin-config.json"
+EVENT_NAME = "skills.math.count_primes"
+LIMIT = 150_000
+CALLS = 4
+TICK_MS = 5.0
+
+
+async def _ticker(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = perf_counter()
+        await asyncio.sleep(TICK_MS / 1000.0)
+        lags.append((perf_counter() - started) * 1000.0 - TICK_MS)
+
+
+async def _measure(backend: SkillExecutionBackend) -> tuple[float, float, float]:
+    app_config = config(APP_CONFIG)
+    skill = next(
+        spec for spec in extract_app_skill_specs(app_config) if spec.event_name == EVENT_NAME
+    )
+    settings = SkillsSettings(thread_workers=CALLS, process_workers=CALLS)
+
+    async def call() -> Any:
+        if backend == SkillExecutionBackend.INLINE:
+            return await execute_event(app_config, EVENT_NAME, CountPrimesRequest(limit=LIMIT))
+        return await executors.execute_in_backend(
+            replace(skill, backend=backend),
+            app_config,
+            {"limit": LIMIT},
+            create_test_context(app_config, EVENT_NAME),
+            settings,
+        )
+
+    if backend != SkillExecutionBackend.INLINE:
+        await asyncio.gather(*(call() for _ in range(CALLS)))  # warm up workers
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    await asyncio.sleep(TICK_MS / 1000.0)
+    started = perf_counter()
+    await asyncio.gather(*(call() for _ in range(CALLS)))
+    elapsed_ms = (perf_counter() - started) * 1000.0
+    stop.set()
+    await ticker
+    executors.shutdown_executors()
+    lags.sort()
+    return elapsed_ms, lags[len(lags) * 99 // 100], lags[-1]
+
+
+async def main() -> None:
+    print(f"{'backend':>8} {'total ms':>10} {'p99 lag ms':>11} {'max lag ms':>11}")
+    for backend in SkillExecutionBackend:
+        elapsed_ms, p99, worst = await _measure(backend)
+        print(f"{backend.value:>8} {elapsed_ms:>10.1f} {p99:>11.1f} {worst:>11.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""Benchmark per-call overhead of executing a short skill with `runner.execute_skill`.
+
+The `sum_two_numbers` skill does almost no work, so the time per call is the cost of
+dispatching the skill. Before resolved handles, every call looked up the payload
+datatype, built a new `EventContext` and executed the event through the app engine,
+which runs it in a new task to apply the response timeout. With a `SkillHandle`
+resolved at startup the call validates the payload with a compiled validator, copies
+a template context and iterates the event handler directly.
+
+Run from the repository root with::
+
+    python examples/plugins/example-skills/test/benchmark/bench_skill_runner.py
+"""
+
+import asyncio
+from time import perf_counter
+from typing import Any
+
+from hopeit.app.context import EventContext
+from hopeit.dataobjects.payload import Payload
+from hopeit.server.engine import AppEngine
+from hopeit.server.steps import find_datatype_handler
+from hopeit.testing.apps import config, create_test_context
+
+from hopeit_agents.skills import runner
+from hopeit_agents.skills.api import SkillEventInfo, extract_app_skill_specs
+
+APP_CONFIG = "examples/plugins/example-skills/config/plugin-config.json"
+EVENT_NAME = "skills.math.sum_two_numbers"
+CALLS = 20_000
+PAYLOAD = {"a": 2, "b": 3}
+
+
+async def _execute_unresolved(
+    app_engine: AppEngine, skill_info: SkillEventInfo, payload: dict[str, Any], context: Any
+) -> Any:
+    """Skill execution as done before resolving skill handles."""
+    datatype = find_datatype_handler(
+        app_config=app_engine.app_config,
+        event_name=skill_info.event_name,
+        event_info=skill_info.event_info,
+    )
+    skill_context = EventContext(
+        app_config=app_engine.app_config,
+        plugin_config=app_engine.app_config,
+        event_name=skill_info.event_name,
+        settings=context.settings,
+        track_ids=context.track_ids,
+        auth_info=context.auth_info,
+    )
+    result = await app_engine.execute(
+        context=skill_context, query_args=None, payload=Payload.from_obj(payload, datatype=datatype)
+    )
+    return Payload.to_obj(result)
+
+
+async def _time_calls(call: Any) -> float:
+    for _ in range(100):
+        await call()
+    started = perf_counter()
+    for _ in range(CALLS):
+        await call()
+    return (perf_counter() - started) * 1_000_000 / CALLS
+
+
+async def main() -> None:
+    app_config = config(APP_CONFIG)
+    app_engine = AppEngine(
+        app_config=app_config, plugins=[], enabled_groups=[], streams_enabled=False
+    )
+    await app_engine.start()
+    skill = next(
+        spec for spec in extract_app_skill_specs(app_config) if spec.event_name == EVENT_NAME
+    )
+    runner.resolve_skill(skill, app_engine)
+    context = create_test_context(app_config, EVENT_NAME)
+
+    before = await _time_calls(lambda: _execute_unresolved(app_engine, skill, PAYLOAD, context))
+    after = await _time_calls(lambda: runner.execute_skill(skill, PAYLOAD, context))
+    await app_engine.stop()
+
+    print(f"{'execution':>12} {'us/call':>9}")
+    print(f"{'unresolved':>12} {before:>9.1f}")
+    print(f"{'handle':>12} {after:>9.1f}")
+    print(f"overhead reduced by {100.0 * (before - after) / before:.0f}%")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+"""Tests for the count-primes example skill and skill execution backends."""
+
+from dataclasses import replace
+
+import pytest
+from hopeit.testing.apps import config, create_test_context, execute_event
+
+from hopeit_agents.example_skills.models import CountPrimesRequest, CountPrimesResponse
+from hopeit_agents.skills import executors
+from hopeit_agents.skills.api import extract_app_skill_specs
+from hopeit_agents.skills.models import SkillExecutionBackend, SkillsSettings
+
+EVENT_NAME = "skills.math.count_primes"
+
+
+@pytest.mark.asyncio
+async def test_count_primes_basic() -> None:
+    """Verify the count-primes skill returns the number of primes below the limit."""
+    app_config = config("examples/plugins/example-skills/config/plugin-config.json")
+    response = await execute_event(app_config, EVENT_NAME, CountPrimesRequest(limit=100))
+
+    assert response == CountPrimesResponse(count=25)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", [SkillExecutionBackend.THREAD, SkillExecutionBackend.PROCESS])
+async def test_count_primes_runs_in_executor_backends(backend: SkillExecutionBackend) -> None:
+    """Skills declaring an executor backend run off the event loop with JSON payloads."""
+    app_config = config("examples/plugins/example-skills/config/plugin-config.json")
+    skill = next(
+        spec for spec in extract_app_skill_specs(app_config) if spec.event_name == EVENT_NAME
+    )
+    assert skill.backend == SkillExecutionBackend.PROCESS
+
+    try:
+        result = await executors.execute_in_backend(
+            replace(skill, backend=backend),
+            app_config,
+            {"limit": 100},
+            create_test_context(app_config, EVENT_NAME),
+            SkillsSettings(thread_workers=1, process_workers=1),
+        )
+    finally:
+        executors.shutdown_executors()
+
+    assert result == {"count": 25}
@@ -0,0 +1,71 @@
+"""Tests for executing example skills through resolved skill handles."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from hopeit.app.context import EventContext
+from hopeit.server.engine import AppEngine
+from hopeit.testing.apps import config, create_test_context
+
+from hopeit_agents.skills import runner
+from hopeit_agents.skills.api import SkillEventInfo, extract_app_skill_specs
+
+EVENT_NAME = "skills.math.sum_two_numbers"
+
+
+@pytest.fixture
+async def app_engine() -> AsyncIterator[AppEngine]:
+    app_config = config("examples/plugins/example-skills/config/plugin-config.json")
+    engine = AppEngine(app_config=app_config, plugins=[], enabled_groups=[], streams_enabled=False)
+    await engine.start()
+    yield engine
+    runner.clear_skill_handles()
+    await engine.stop()
+
+
+def _skill(app_engine: AppEngine) -> SkillEventInfo:
+    return next(
+        spec
+        for spec in extract_app_skill_specs(app_engine.app_config)
+        if spec.event_name == EVENT_NAME
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_skill_uses_resolved_handle(app_engine: AppEngine) -> None:
+    """Resolved skills execute directly on the event handler of their app engine."""
+    skill = _skill(app_engine)
+    handle = runner.resolve_skill(skill, app_engine)
+    context = create_test_context(app_engine.app_config, EVENT_NAME)
+
+    result = await runner.execute_skill(skill, {"a": 2, "b": 3}, context)
+
+    assert handle.direct
+    assert result == {"result": 5}
+
+
+def test_skill_context_matches_event_context(app_engine: AppEngine) -> None:
+    """Skill contexts built from the handle template match a new EventContext."""
+    skill = _skill(app_engine)
+    handle = runner.resolve_skill(skill, app_engine)
+    caller = create_test_context(
+        app_engine.app_config,
+        EVENT_NAME,
+        track_ids={"track.operation_id": "op-1", "track.request_id": "req-1", "other": "x"},
+    )
+
+    skill_context = handle.context(caller)
+    expected = EventContext(
+        app_config=app_engine.app_config,
+        plugin_config=app_engine.app_config,
+        event_name=EVENT_NAME,
+        settings=caller.settings,
+        track_ids=caller.track_ids,
+        auth_info=caller.auth_info,
+    )
+
+    assert skill_context.track_ids == expected.track_ids
+    assert skill_context.settings is caller.settings
+    assert skill_context.event_info == expected.event_info
+    assert skill_context.env == expected.env
+    assert skill_context.creation_ts >= handle._context.creation_ts
@@ -4,6 +4,7 @@ import hashlib
 import json
 import re
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 from hopeit.dataobjects import dataclass, dataobject
@@ -43,7 +44,7 @@ def create_agent_config(
     """Create an :class:`AgentConfig` for the provided template and variables."""
 
     normalized_variables = _normalize_variables(variables)
-    version = _compute_agent_config_version(prompt_template, normalized_variables)
+    version = _agent_config_version(prompt_template, tuple(sorted(normalized_variables.items())))
 
     return AgentConfig(
         name=name,
@@ -76,6 +77,13 @@ def _compute_agent_config_version(
     return f"{digest[:12]}"
 
 
+@lru_cache(maxsize=256)
+def _agent_config_version(prompt_template: str, variables: tuple[tuple[str, str], ...]) -> str:
+    """Memoized version of a prompt template with sorted variable items."""
+
+    return _compute_agent_config_version(prompt_template, dict(variables))
+
+
 def _normalize_variables(variables: Mapping[str, Any]) -> dict[str, str]:
     normalized: dict[str, str] = {}
     for key, value in variables.items():
@@ -0,0 +1,72 @@
+"""Cache of compiled prompt templates.
+
+Prompt templates are markdown files with `{{name}}` placeholders, read on every
+agent request. `load_prompt_template` keeps the text of each file in memory and
+reads it again only when the file modification time or size changes.
+`compile_template` splits a template once into literal segments and placeholder
+names, so rendering is a single join of segments and values.
+"""
+
+import os
+import re
+from collections.abc import Mapping
+from functools import lru_cache
+
+__all__ = ["CompiledTemplate", "compile_template", "load_prompt_template"]
+
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{([A-Za-z0-9_]+)\}\}")
+
+
+class CompiledTemplate:
+    """Template split into literal `segments` around its `placeholders`.
+
+    `segments` has one more item than `placeholders`: placeholder `i` goes between
+    segments `i` and `i + 1`.
+    """
+
+    def __init__(self, template: str) -> None:
+        parts = _PLACEHOLDER_PATTERN.split(template)
+        self.segments: tuple[str, ...] = tuple(parts[0::2])
+        self.placeholders: tuple[str, ...] = tuple(parts[1::2])
+        self.names: frozenset[str] = frozenset(self.placeholders)
+
+    def missing(self, variables: Mapping[str, str]) -> set[str]:
+        """Return placeholder names without a value in `variables`."""
+        return {name for name in self.names if name not in variables}
+
+    def render(self, variables: Mapping[str, str]) -> str:
+        """Replace every placeholder with its value in `variables`.
+
+        Values are inserted as they are, placeholders in values are not rendered.
+        Raises `ValueError` when a placeholder has no value.
+        """
+        missing = self.missing(variables)
+        if missing:
+            raise ValueError(f"Missing values for placeholders: {', '.join(sorted(missing))}")
+        parts = [self.segments[0]]
+        for name, segment in zip(self.placeholders, self.segments[1:], strict=True):
+            parts.append(variables[name])
+            parts.append(segment)
+        return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def compile_template(template: str) -> CompiledTemplate:
+    """Return `template` compiled, memoized by template text."""
+    return CompiledTemplate(template)
+
+
+_templates: dict[str, tuple[int, int, str]] = {}
+
+
+def load_prompt_template(path: str | os.PathLike[str]) -> str:
+    """Return the text of the template file at `path`, read again when it changes."""
+    key = os.fspath(path)
+    stat = os.stat(key)
+    entry = _templates.get(key)
+    if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        return entry[2]
+    with open(key, encoding="utf-8") as f:
+        text = f.read()
+    _templates[key] = (stat.st_mtime_ns, stat.st_size, text)
+    return text
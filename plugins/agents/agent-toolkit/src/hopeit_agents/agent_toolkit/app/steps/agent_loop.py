@@ -1,5 +1,6 @@
 """Hopeit event step that runs an agent loop capable of executing MCP tools."""
 
+from dataclasses import replace
 from typing import Any
 
 from hopeit.app.context import EventContext
@@ -9,11 +10,18 @@ from hopeit.dataobjects.payload import Payload
 from hopeit_agents.agent_toolkit.mcp.agent_tools import (
     execute_tool_calls,
 )
-from hopeit_agents.agent_toolkit.settings import AgentSettings
+from hopeit_agents.agent_toolkit.mcp.tool_outputs import (
+    READ_TOOL_OUTPUT,
+    ToolOutputStore,
+    limit_tool_output,
+    read_tool_output,
+    read_tool_output_descriptor,
+)
+from hopeit_agents.agent_toolkit.rendering import log_token_savings, render_tool_result
+from hopeit_agents.agent_toolkit.settings import AgentSettings, ToolOutputSettings
 from hopeit_agents.mcp_client.models import (
     MCPClientConfig,
     ToolCallRecord,
-    ToolExecutionResult,
     ToolInvocation,
 )
 from hopeit_agents.model_client.api import generate as model_generate
@@ -46,7 +54,7 @@ class AgentLoopPayload:
     completion_config: CompletionConfig
     loop_config: AgentLoopConfig
     agent_settings: AgentSettings
-    mcp_settings: MCPClientConfig
+    mcp_settings: dict[str, MCPClientConfig] | MCPClientConfig
     metadata: dict[str, str] = field(default_factory=dict)
 
 
@@ -71,7 +79,9 @@ async def agent_with_tools_loop(
     iterations. When the model returns tool calls and tools are enabled, the
     calls are executed using the MCP client and the results appended to the
     conversation, allowing the model to observe tool responses in subsequent
-    turns.
+    turns. Tool results are limited to the budgets in `agent_settings.tool_output`;
+    once the session has truncated outputs saved as artifacts, the model is also
+    offered the `read_tool_output` tool to page through them.
 
     Args:
         payload: Aggregated configuration, conversation state, and MCP settings.
@@ -86,10 +96,28 @@ async def agent_with_tools_loop(
     loop_config = payload.loop_config
     agent_settings = payload.agent_settings
     mcp_settings = payload.mcp_settings
+    tool_output = agent_settings.tool_output
+    paging = tool_output.artifacts_path is not None
+    artifacts = (
+        ToolOutputStore(tool_output.artifacts_path, ttl_seconds=tool_output.artifact_ttl_seconds)
+        if tool_output.artifacts_path is not None and completion_config.available_tools
+        else None
+    )
+    paging_offered = False
 
     tool_call_log: list[ToolCallRecord] = []
 
     for _ in range(0, loop_config.max_iterations):
+        if artifacts is not None and not paging_offered:
+            paging_offered = await artifacts.has_artifacts(conversation.conversation_id)
+            if paging_offered:
+                completion_config = replace(
+                    completion_config,
+                    available_tools=[
+                        *(completion_config.available_tools or []),
+                        read_tool_output_descriptor(),
+                    ],
+                )
         model_request = CompletionRequest(conversation=conversation, config=completion_config)
 
         try:
@@ -97,28 +125,55 @@ async def agent_with_tools_loop(
             conversation = completion.conversation
 
             if agent_settings.enable_tools and completion.tool_calls:
-                tool_call_records = await execute_tool_calls(
-                    mcp_settings,
-                    context,
-                    tool_calls=[
-                        ToolInvocation(
-                            tool_name=tc.function.name,
-                            payload=Payload.from_json(
-                                tc.function.arguments, datatype=dict[str, Any]
-                            ),
-                            call_id=tc.id,
-                            session_id=conversation.conversation_id,  # TODO: session_id?
-                        )
-                        for tc in completion.tool_calls
-                    ],
-                    session_id=conversation.conversation_id,  # TODO: session_id?
+                invocations = [
+                    ToolInvocation(
+                        tool_name=tc.function.name,
+                        payload=Payload.from_json(tc.function.arguments, datatype=dict[str, Any]),
+                        call_id=tc.id,
+                        session_id=conversation.conversation_id,  # TODO: session_id?
+                    )
+                    for tc in completion.tool_calls
+                ]
+                mcp_calls = [
+                    invocation
+                    for invocation in invocations
+                    if not (paging and invocation.tool_name == READ_TOOL_OUTPUT)
+                ]
+                tool_call_records = (
+                    await execute_tool_calls(
+                        mcp_settings,
+                        context,
+                        tool_calls=mcp_calls,
+                        session_id=conversation.conversation_id,  # TODO: session_id?
+                        tools=completion_config.available_tools,
+                        max_concurrency=agent_settings.max_parallel_tool_calls,
+                        sequential_unsafe_tools=agent_settings.sequential_unsafe_tool_calls,
+                    )
+                    if mcp_calls
+                    else []
                 )
+                if len(mcp_calls) < len(invocations):
+                    tool_call_records = await _with_read_tool_output_records(
+                        invocations,
+                        tool_call_records,
+                        tool_output,
+                        session_id=conversation.conversation_id,
+                    )
 
                 for record in tool_call_records:
                     conversation = conversation.with_message(
                         Message(
                             role=Role.TOOL,
-                            content=_format_tool_result(record.response),
+                            content=await limit_tool_output(
+                                render_tool_result(
+                                    record.response,
+                                    compact=agent_settings.compact_tool_rendering,
+                                    agent_name=agent_settings.agent_name,
+                                ),
+                                record.response,
+                                tool_output,
+                                session_id=conversation.conversation_id,
+                            ),
                             tool_call_id=record.request.tool_call_id,
                             name=record.request.tool_name,
                         ),
@@ -143,6 +198,8 @@ async def agent_with_tools_loop(
                 Message(role=Role.SYSTEM, content=f"Error parsing response: {e}")
             )
     # end loop
+    if agent_settings.compact_tool_rendering:
+        log_token_savings(context, agent_settings.agent_name)
     return AgentLoopResult(
         conversation=conversation,
         user_context=payload.user_context,
@@ -151,9 +208,18 @@ async def agent_with_tools_loop(
     )
 
 
-def _format_tool_result(result: ToolExecutionResult) -> str:
-    """Return a JSON-formatted string for tool execution results."""
-
-    if result.structured_content is not None:
-        return Payload.to_json(result.structured_content, indent=2)
-    return Payload.to_json(result.content, indent=2)
+async def _with_read_tool_output_records(
+    invocations: list[ToolInvocation],
+    mcp_records: list[ToolCallRecord],
+    settings: ToolOutputSettings,
+    *,
+    session_id: str,
+) -> list[ToolCallRecord]:
+    """Serve `read_tool_output` calls locally, merged with MCP records in call order."""
+    pending = iter(mcp_records)
+    return [
+        await read_tool_output(settings, invocation, session_id=session_id)
+        if invocation.tool_name == READ_TOOL_OUTPUT
+        else next(pending)
+        for invocation in invocations
+    ]
@@ -6,6 +6,7 @@ from hopeit.app.context import EventContext
 from hopeit.dataobjects import dataclass, dataobject, field
 from hopeit.dataobjects.payload import Payload
 
+from hopeit_agents.agent_toolkit.rendering import log_token_savings, render_tool_result
 from hopeit_agents.agent_toolkit.settings import AgentSettings
 from hopeit_agents.agent_toolkit.skills.agent_skills import execute_skill_calls
 from hopeit_agents.model_client.api import generate as model_generate
@@ -19,7 +20,6 @@ from hopeit_agents.model_client.models import (
 )
 from hopeit_agents.skills.models import (
     SkillCallRecord,
-    SkillExecutionResult,
     SkillInvocation,
     SkillsSettings,
 )
@@ -110,13 +110,19 @@ async def agent_with_skills_loop(
                         for tc in completion.tool_calls
                     ],
                     session_id=conversation.conversation_id,  # TODO: session_id?
+                    max_concurrency=agent_settings.max_parallel_tool_calls,
+                    skills=completion_config.available_skills,
                 )
 
                 for record in tool_call_records:
                     conversation = conversation.with_message(
                         Message(
                             role=Role.TOOL,
-                            content=_format_tool_result(record.response),
+                            content=render_tool_result(
+                                record.response,
+                                compact=agent_settings.compact_tool_rendering,
+                                agent_name=agent_settings.agent_name,
+                            ),
                             tool_call_id=record.request.skill_call_id,
                             name=record.request.skill_name,
                         ),
@@ -141,17 +147,11 @@ async def agent_with_skills_loop(
                 Message(role=Role.SYSTEM, content=f"Error parsing response: {e}")
             )
     # end loop
+    if agent_settings.compact_tool_rendering:
+        log_token_savings(context, agent_settings.agent_name)
     return AgentLoopResult(
         conversation=conversation,
         user_context=payload.user_context,
         tool_call_log=tool_call_log,
         metadata=payload.metadata,
     )
-
-
-def _format_tool_result(result: SkillExecutionResult) -> str:
-    """Return a JSON-formatted string for skill execution results."""
-
-    if result.structured_content is not None:
-        return Payload.to_json(result.structured_content, indent=2)
-    return Payload.to_json(result.content, indent=2)
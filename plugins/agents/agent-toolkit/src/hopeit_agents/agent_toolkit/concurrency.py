@@ -0,0 +1,57 @@
+"""Concurrent execution of the tool and skill calls requested by a model."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
+from typing import Any, TypeVar
+
+__all__ = ["run_calls"]
+
+CallT = TypeVar("CallT")
+ResultT = TypeVar("ResultT")
+
+
+async def run_calls(
+    calls: Sequence[CallT],
+    execute: Callable[[CallT], Awaitable[ResultT]],
+    *,
+    max_concurrency: int,
+    parallel_safe: Callable[[CallT], bool],
+) -> list[ResultT]:
+    """Run `execute` for every call returning the results in the order of `calls`.
+
+    Up to `max_concurrency` calls run at the same time. Calls not `parallel_safe` run
+    alone, after every previous call finished and before any later call starts.
+    """
+    if max_concurrency <= 1:
+        return [await execute(call) for call in calls]
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def limited(call: CallT) -> ResultT:
+        async with semaphore:
+            return await execute(call)
+
+    results: list[ResultT] = []
+    batch: list[Coroutine[Any, Any, ResultT]] = []
+    for call in calls:
+        if parallel_safe(call):
+            batch.append(limited(call))
+        else:
+            results.extend(await _gather(batch))
+            batch = []
+            results.append(await execute(call))
+    results.extend(await _gather(batch))
+    return results
+
+
+async def _gather(calls: list[Coroutine[Any, Any, ResultT]]) -> list[ResultT]:
+    """Run `calls` concurrently, cancelling the rest when one of them fails."""
+    tasks = [asyncio.create_task(call) for call in calls]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
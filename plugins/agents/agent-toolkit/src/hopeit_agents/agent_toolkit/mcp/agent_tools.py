@@ -1,17 +1,29 @@
-"""Utilities to help agents describe and invoke MCP tools."""
+"""Utilities to help agents describe and invoke MCP tools.
+
+Agents reach their MCP servers through a shared `FederatedMCPClient`, configured
+with a single `MCPClientConfig` or with several servers by name. Tools of every
+server are listed as one catalog and tool calls are routed to the server exposing
+the tool.
+"""
 
 from __future__ import annotations
 
 import json
 import uuid
+from collections.abc import Mapping
 from typing import Any
 
 from hopeit.app.context import EventContext
 from hopeit.app.logger import app_extra_logger
+from hopeit.dataobjects.payload import Payload
 
+from hopeit_agents.agent_toolkit.concurrency import run_calls
+from hopeit_agents.agent_toolkit.rendering import record_token_savings, render_schema
 from hopeit_agents.mcp_client.client import MCPClient, MCPClientError
+from hopeit_agents.mcp_client.federation import FederatedMCPClient, get_federated_client
 from hopeit_agents.mcp_client.models import (
     MCPClientConfig,
+    ToolAnnotations,
     ToolCallRecord,
     ToolCallRequestLog,
     ToolDescriptor,
@@ -23,6 +35,7 @@ from hopeit_agents.mcp_client.settings import build_environment
 logger, extra = app_extra_logger()
 
 __all__ = [
+    "MCPServers",
     "resolve_tools",
     "tool_descriptions",
     "call_tool",
@@ -31,28 +44,51 @@ __all__ = [
 ]
 
 
+MCPServers = MCPClientConfig | Mapping[str, MCPClientConfig]
+"""A single MCP server configuration, or several by server name."""
+
+_DEFAULT_SERVER = "default"
+
+
+def _federated_client(config: MCPServers, context: EventContext) -> FederatedMCPClient:
+    """Return the shared federated client of the servers in `config`."""
+    servers = {_DEFAULT_SERVER: config} if isinstance(config, MCPClientConfig) else config
+    key = json.dumps(
+        [
+            [
+                name,
+                Payload.to_obj(server),
+                MCPClient(config=server, env=build_environment(server, context.env)).server_key(),
+            ]
+            for name, server in servers.items()
+        ]
+    )
+    return get_federated_client(key, servers, context.env)
+
+
 async def resolve_tools(
-    config: MCPClientConfig,
+    config: MCPServers,
     context: EventContext,
     *,
     agent_id: str,
     allowed_tools: list[str] | None = None,
 ) -> list[ToolDescriptor]:
-    """Return a tool-aware prompt based on the MCP tool inventory."""
-    env = build_environment(config, context.env)
-    client = MCPClient(config=config, env=env)
+    """Return the tools of every MCP server in `config`, limited to `allowed_tools`.
+
+    Servers failing to list their tools are logged and only their tools are missing.
+    """
+    client = _federated_client(config, context)
     try:
         tools = await client.list_tools()
+        for server, exc in client.errors.items():
+            logger.warning(
+                context,
+                "agent_tool_prompt_list_failed",
+                extra=extra(agent_id=agent_id, server=server, error=str(exc), details=exc.details),
+            )
         if allowed_tools:
             return [tool for tool in tools if tool.name in allowed_tools]
         return tools
-    except MCPClientError as exc:
-        logger.warning(
-            context,
-            "agent_tool_prompt_list_failed",
-            extra=extra(agent_id=agent_id, error=str(exc), details=exc.details),
-        )
-        return []
     except Exception as exc:  # pragma: no cover - defensive guardrail
         logger.error(
             context,
@@ -66,22 +102,38 @@ def tool_descriptions(
     tools: list[ToolDescriptor],
     *,
     include_schemas: bool,
+    compact: bool = False,
+    schemas_in_tools: bool = False,
+    agent_name: str | None = None,
 ) -> str:
-    """Render tool metadata as bullet points for LLM consumption."""
+    """Render tool metadata as bullet points for LLM consumption.
+
+    With `compact`, schemas are rendered minified by `render_schema`, and left out
+    when `schemas_in_tools` since the model receives them in the request `tools`.
+    Estimated token savings are recorded for `agent_name` when given.
+    """
     lines: list[str] = []
     lines.append("\nAvailable tools:")
     for tool in tools:
         description = (tool.description or "No description provided.").strip()
         lines.append(f"- {tool.name}: {description}")
-        if include_schemas and tool.input_schema:
-            schema = json.dumps(tool.input_schema, indent=2, sort_keys=True)
-            lines.append("  JSON schema:")
-            lines.extend(f"    {schema_line}" for schema_line in schema.splitlines())
-    return "\n".join(lines).strip()
+        if include_schemas and not (compact and schemas_in_tools) and tool.input_schema:
+            schema = render_schema(tool.input_schema, compact=compact)
+            if compact:
+                lines.append(f"  JSON schema: {schema}")
+            else:
+                lines.append("  JSON schema:")
+                lines.extend(f"    {schema_line}" for schema_line in schema.splitlines())
+    rendered = "\n".join(lines).strip()
+    if compact and agent_name is not None:
+        record_token_savings(
+            agent_name, lambda: tool_descriptions(tools, include_schemas=include_schemas), rendered
+        )
+    return rendered
 
 
 async def call_tool(
-    config: MCPClientConfig,
+    config: MCPServers,
     context: EventContext,
     *,
     call_id: str,
@@ -89,9 +141,8 @@ async def call_tool(
     payload: dict[str, Any],
     session_id: str | None = None,
 ) -> ToolExecutionResult:
-    """Execute an MCP tool through the client using the provided payload."""
-    env = build_environment(config, context.env)
-    client = MCPClient(config=config, env=env)
+    """Execute an MCP tool on the server of `config` exposing it, with `payload`."""
+    client = _federated_client(config, context)
     args = ToolInvocation(
         call_id=call_id,
         tool_name=tool_name,
@@ -112,19 +163,31 @@ async def call_tool(
 
 
 async def execute_tool_calls(
-    config: MCPClientConfig,
+    config: MCPServers,
     context: EventContext,
     *,
     tool_calls: list[ToolInvocation],
     session_id: str | None = None,
+    tools: list[ToolDescriptor] | None = None,
+    max_concurrency: int = 1,
+    sequential_unsafe_tools: bool = True,
 ) -> list[ToolCallRecord]:
-    """Execute multiple tool calls capturing request and response data."""
-    records: list[ToolCallRecord] = []
-    for tool_call in tool_calls:
+    """Execute multiple tool calls capturing request and response data.
+
+    Up to `max_concurrency` calls run at the same time. With `sequential_unsafe_tools`,
+    calls to tools not annotated as read-only in `tools` run alone,
+    after every previous call finished and before any later call starts.
+    Records are returned in the order of `tool_calls`.
+    """
+    call_ids = [tool_call.call_id or f"call_{uuid.uuid4().hex[-10:]}" for tool_call in tool_calls]
+    annotations = {tool.name: tool.annotations for tool in tools or []}
+
+    async def execute(call: tuple[ToolInvocation, str]) -> ToolCallRecord:
+        tool_call, call_id = call
         result = await call_tool(
             config,
             context,
-            call_id=tool_call.call_id or f"call_{uuid.uuid4().hex[-10:]}",
+            call_id=call_id,
             tool_name=tool_call.tool_name,
             payload=tool_call.payload,
             session_id=session_id,
@@ -134,5 +197,21 @@ async def execute_tool_calls(
             tool_name=tool_call.tool_name,
             payload=tool_call.payload,
         )
-        records.append(ToolCallRecord(request=request_log, response=result))
-    return records
+        return ToolCallRecord(request=request_log, response=result)
+
+    return await run_calls(
+        list(zip(tool_calls, call_ids, strict=True)),
+        execute,
+        max_concurrency=max_concurrency,
+        parallel_safe=lambda call: (
+            not sequential_unsafe_tools or _parallel_safe(annotations.get(call[0].tool_name))
+        ),
+    )
+
+
+def _parallel_safe(annotations: ToolAnnotations | None) -> bool:
+    """Whether a tool can run concurrently with other calls according to its hints.
+
+    Only read-only tools qualify: idempotent writes can still conflict with each other.
+    """
+    return annotations is not None and bool(annotations.readOnlyHint)
@@ -0,0 +1,299 @@
+"""Budgets for tool outputs added to agent conversations.
+
+A large tool result pasted into the conversation fills the context window and is
+sent again on every later iteration of the agent loop. `limit_tool_output` keeps
+results within the budget configured in `ToolOutputSettings`: oversized results are
+truncated to their head plus a note summarizing the output. When an artifacts path
+is configured the full output is saved to disk, and the note tells the model how to
+read the rest with the `read_tool_output` tool, which the agent loop serves locally.
+Saved outputs can only be read from the session that produced them, and are
+deleted once `artifact_ttl_seconds` old.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import re
+import secrets
+import time
+from pathlib import Path
+from typing import Any
+
+from hopeit.dataobjects import dataclass, dataobject
+
+from hopeit_agents.agent_toolkit.settings import ToolOutputSettings
+from hopeit_agents.mcp_client.models import (
+    ToolAnnotations,
+    ToolCallRecord,
+    ToolCallRequestLog,
+    ToolDescriptor,
+    ToolExecutionResult,
+    ToolExecutionStatus,
+    ToolInvocation,
+)
+
+__all__ = [
+    "READ_TOOL_OUTPUT",
+    "ToolOutputPage",
+    "ToolOutputStore",
+    "output_budget_bytes",
+    "limit_tool_output",
+    "read_tool_output_descriptor",
+    "read_tool_output",
+]
+
+READ_TOOL_OUTPUT = "read_tool_output"
+
+_ARTIFACT_ID = re.compile(r"[A-Za-z0-9_-]+")
+
+# Expired artifacts are looked for at most once a minute per artifacts path
+_CLEANUP_SECONDS = 60.0
+_cleanups: dict[Path, float] = {}
+
+
+@dataobject
+@dataclass
+class ToolOutputPage:
+    """A chunk of a saved tool output, `next_offset` is None on the last page."""
+
+    artifact_id: str
+    offset: int
+    next_offset: int | None
+    total_bytes: int
+    content: str
+
+
+class ToolOutputStore:
+    """Saves full tool outputs as UTF-8 text files under `path`, in a folder per session.
+
+    Artifacts get random ids and are only found in the folder of the session that
+    saved them, so a conversation cannot read the outputs of another one. Artifacts
+    older than `ttl_seconds` cannot be read anymore and are deleted on later saves.
+    """
+
+    def __init__(self, path: str | Path, *, ttl_seconds: float) -> None:
+        self._path = Path(path)
+        self._ttl_seconds = ttl_seconds
+
+    async def save(self, text: str, *, session_id: str | None) -> str:
+        """Save `text` and return the artifact id to read it back from `session_id`."""
+        artifact_id = secrets.token_urlsafe(16)
+        await asyncio.to_thread(self._save, self._file(session_id, artifact_id), text)
+        return artifact_id
+
+    async def read(
+        self, artifact_id: str, *, session_id: str | None, offset: int, limit: int
+    ) -> ToolOutputPage:
+        """Read up to `limit` bytes of a saved output starting at byte `offset`.
+
+        Raises `FileNotFoundError` for unknown or expired artifacts, and for artifacts
+        saved by another session.
+        """
+        data = await asyncio.to_thread(self._read, self._file(session_id, artifact_id))
+        offset = min(max(0, offset), len(data))
+        # Drop a multi-byte character cut at the end of the page, it starts the next one
+        content = data[offset : offset + max(1, limit)].decode("utf-8", errors="ignore")
+        next_offset = offset + len(content.encode("utf-8"))
+        return ToolOutputPage(
+            artifact_id=artifact_id,
+            offset=offset,
+            next_offset=next_offset if next_offset < len(data) else None,
+            total_bytes=len(data),
+            content=content,
+        )
+
+    async def has_artifacts(self, session_id: str | None) -> bool:
+        """Return whether `session_id` has saved outputs that did not expire."""
+        return await asyncio.to_thread(self._has_artifacts, self._session_path(session_id))
+
+    def _session_path(self, session_id: str | None) -> Path:
+        # Hashed, so any session id maps to a distinct and valid folder name
+        return self._path / hashlib.sha256((session_id or "").encode("utf-8")).hexdigest()[:32]
+
+    def _file(self, session_id: str | None, artifact_id: str) -> Path:
+        if not _ARTIFACT_ID.fullmatch(artifact_id):
+            raise FileNotFoundError(artifact_id)
+        return self._session_path(session_id) / f"{artifact_id}.txt"
+
+    def _expired(self, file: Path) -> bool:
+        return file.stat().st_mtime < time.time() - self._ttl_seconds
+
+    def _read(self, file: Path) -> bytes:
+        if self._expired(file):
+            raise FileNotFoundError(file.stem)
+        return file.read_bytes()
+
+    def _has_artifacts(self, session_path: Path) -> bool:
+        try:
+            return any(not self._expired(file) for file in session_path.glob("*.txt"))
+        except FileNotFoundError:
+            return False
+
+    def _save(self, file: Path, text: str) -> None:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            file.write_text(text, encoding="utf-8")
+        except FileNotFoundError:  # empty session folder removed by a concurrent cleanup
+            file.parent.mkdir(parents=True, exist_ok=True)
+            file.write_text(text, encoding="utf-8")
+        now = time.monotonic()
+        if now - _cleanups.get(self._path, -math.inf) >= min(self._ttl_seconds, _CLEANUP_SECONDS):
+            _cleanups[self._path] = now
+            self._remove_expired()
+
+    def _remove_expired(self) -> None:
+        """Delete expired artifacts, and session folders left empty."""
+        for session_path in self._path.iterdir():
+            if not session_path.is_dir():
+                continue
+            for file in session_path.glob("*.txt"):
+                try:
+                    if self._expired(file):
+                        file.unlink()
+                except FileNotFoundError:
+                    pass  # removed by another cleanup
+            try:
+                session_path.rmdir()
+            except OSError:
+                pass  # not empty
+
+
+def output_budget_bytes(settings: ToolOutputSettings, tool_name: str) -> int | None:
+    """Return the output budget of `tool_name` in bytes, or None when unlimited."""
+    budget = settings.tool_budgets.get(tool_name, settings.default_budget)
+    limits = [
+        limit
+        for limit in (
+            budget.max_bytes,
+            None
+            if budget.max_tokens is None
+            else int(budget.max_tokens * settings.bytes_per_token),
+        )
+        if limit is not None
+    ]
+    return min(limits) if limits else None
+
+
+async def limit_tool_output(
+    text: str,
+    result: ToolExecutionResult,
+    settings: ToolOutputSettings,
+    *,
+    session_id: str | None,
+) -> str:
+    """Return `text`, the rendered `result`, truncated to the budget of the tool."""
+    if result.tool_name == READ_TOOL_OUTPUT:
+        return text  # pages are already bounded by `page_bytes`
+    budget = output_budget_bytes(settings, result.tool_name)
+    data = text.encode("utf-8")
+    if budget is None or len(data) <= budget:
+        return text
+
+    head = data[:budget].decode("utf-8", errors="ignore")
+    shown = len(head.encode("utf-8"))
+    note = f"Output truncated: showing {shown} of {len(data)} bytes."
+    summary = _summary(result.structured_content)
+    if summary:
+        note += f" Full output is {summary}."
+    if settings.artifacts_path is not None:
+        artifact_id = await ToolOutputStore(
+            settings.artifacts_path, ttl_seconds=settings.artifact_ttl_seconds
+        ).save(text, session_id=session_id)
+        arguments = json.dumps({"artifact_id": artifact_id, "offset": shown})
+        note += f" To read more, call `{READ_TOOL_OUTPUT}` with {arguments}."
+    return f"{head}\n[{note}]"
+
+
+def read_tool_output_descriptor() -> ToolDescriptor:
+    """Return the definition of the tool paging through saved tool outputs."""
+    return ToolDescriptor(
+        name=READ_TOOL_OUTPUT,
+        title="Read tool output",
+        description=(
+            "Read a chunk of a tool output that was truncated. "
+            "Use the artifact_id and offset given in the truncation note, "
+            "then next_offset from the response to continue."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "artifact_id": {"type": "string"},
+                "offset": {"type": "integer", "minimum": 0},
+                "limit": {"type": "integer", "minimum": 1},
+            },
+            "required": ["artifact_id"],
+        },
+        output_schema=None,
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+
+
+async def read_tool_output(
+    settings: ToolOutputSettings, tool_call: ToolInvocation, *, session_id: str | None
+) -> ToolCallRecord:
+    """Serve a `read_tool_output` call from the artifact store."""
+    payload = tool_call.payload or {}
+    call_id = tool_call.call_id or ""
+    result: ToolExecutionResult
+    try:
+        if settings.artifacts_path is None:
+            raise FileNotFoundError("tool output artifacts are disabled")
+        page = await ToolOutputStore(
+            settings.artifacts_path, ttl_seconds=settings.artifact_ttl_seconds
+        ).read(
+            str(payload.get("artifact_id", "")),
+            session_id=session_id,
+            offset=int(payload.get("offset", 0)),
+            limit=min(int(payload.get("limit", settings.page_bytes)), settings.page_bytes),
+        )
+        result = ToolExecutionResult(
+            call_id=call_id,
+            tool_name=READ_TOOL_OUTPUT,
+            status=ToolExecutionStatus.SUCCESS,
+            structured_content={
+                "artifact_id": page.artifact_id,
+                "offset": page.offset,
+                "next_offset": page.next_offset,
+                "total_bytes": page.total_bytes,
+                "content": page.content,
+            },
+            session_id=session_id,
+        )
+    except (FileNotFoundError, TypeError, ValueError) as exc:
+        message = f"Cannot read tool output: {exc}"
+        result = ToolExecutionResult(
+            call_id=call_id,
+            tool_name=READ_TOOL_OUTPUT,
+            status=ToolExecutionStatus.ERROR,
+            content=[{"type": "text", "text": message}],
+            error_message=message,
+            session_id=session_id,
+        )
+    return ToolCallRecord(
+        request=ToolCallRequestLog(
+            tool_call_id=call_id, tool_name=READ_TOOL_OUTPUT, payload=payload
+        ),
+        response=result,
+    )
+
+
+def _summary(value: Any) -> str | None:
+    """Describe the top-level shape of structured content, e.g. `object {rows: list[500]}`."""
+    if isinstance(value, dict):
+        fields = ", ".join(f"{key}: {_kind(item)}" for key, item in list(value.items())[:20])
+        more = ", ..." if len(value) > 20 else ""
+        return f"object {{{fields}{more}}}"
+    if isinstance(value, list):
+        return _kind(value)
+    return None
+
+
+def _kind(value: Any) -> str:
+    if isinstance(value, list):
+        return f"list[{len(value)}]"
+    if isinstance(value, dict):
+        return f"object[{len(value)} keys]"
+    if isinstance(value, str):
+        return f"string[{len(value)}]"
+    return type(value).__name__
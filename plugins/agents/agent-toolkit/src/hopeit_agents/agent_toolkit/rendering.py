@@ -0,0 +1,232 @@
+"""Compact rendering of tool results and schemas for prompts.
+
+Tool results and schemas added to prompts are paid for in tokens on every agent
+loop iteration. The compact mode renders minified JSON and strips schema keys that
+carry no information for the model: `title` annotations, and `$defs` once their
+references are inlined. Savings against the indented rendering are estimated per
+agent and reported by `token_savings_report`. To keep the estimate cheap, only one
+in 16 compact renderings of an agent is also rendered indented, and the indented
+size of the others is extrapolated from the sampled ones.
+"""
+
+import json
+import math
+from collections.abc import Callable
+from typing import Any
+
+from hopeit.app.context import EventContext
+from hopeit.app.logger import app_extra_logger
+from hopeit.dataobjects import dataclass, dataobject
+from hopeit.dataobjects.payload import Payload
+
+from hopeit_agents.mcp_client.models import ToolExecutionResult
+from hopeit_agents.skills.models import SkillExecutionResult
+
+__all__ = [
+    "TokenSavings",
+    "render_json",
+    "render_schema",
+    "render_tool_result",
+    "compact_schema",
+    "record_token_savings",
+    "token_savings_report",
+    "log_token_savings",
+    "clear_token_savings",
+]
+
+logger, extra = app_extra_logger()
+
+_BYTES_PER_TOKEN = 4.0
+_SAMPLE_EVERY = 16
+_DEFS_REF = "#/$defs/"
+# Keys whose values are data, not subschemas
+_DATA_KEYS = {"default", "const", "enum", "examples"}
+
+
+@dataobject
+@dataclass
+class TokenSavings:
+    """Estimated prompt tokens of indented and compact renderings for an agent."""
+
+    renders: int = 0
+    verbose_tokens: int = 0
+    compact_tokens: int = 0
+    saved_tokens: int = 0
+
+
+def render_json(value: Any, *, compact: bool) -> str:
+    """Render `value` as minified JSON when `compact`, otherwise indented."""
+    if compact:
+        return Payload.to_json(value)
+    return Payload.to_json(value, indent=2)
+
+
+def render_tool_result(
+    result: ToolExecutionResult | SkillExecutionResult,
+    *,
+    compact: bool = False,
+    agent_name: str | None = None,
+) -> str:
+    """Render the structured content of a tool or skill result, or else its content.
+
+    Estimated token savings of the `compact` rendering are recorded for `agent_name`
+    when given.
+    """
+    value = result.structured_content if result.structured_content is not None else result.content
+    rendered = render_json(value, compact=compact)
+    if compact and agent_name is not None:
+        record_token_savings(agent_name, lambda: render_json(value, compact=False), rendered)
+    return rendered
+
+
+def render_schema(schema: dict[str, Any], *, compact: bool) -> str:
+    """Render a JSON schema, minified and stripped with `compact_schema` when `compact`."""
+    if compact:
+        return json.dumps(compact_schema(schema), separators=(",", ":"), sort_keys=True)
+    return json.dumps(schema, indent=2, sort_keys=True)
+
+
+def compact_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Return `schema` without `title` keys and with single-use `$defs` inlined.
+
+    Definitions referenced more than once, or referencing themselves, are kept in
+    `$defs`, compacted, so they are not repeated at every reference.
+    """
+    defs = schema.get("$defs")
+    defs = defs if isinstance(defs, dict) else {}
+    counts: dict[str, int] = {}
+    _count_refs(schema, counts)
+    inline = {name for name, count in counts.items() if count == 1 and name in defs}
+    kept: set[str] = set()
+    compacted: dict[str, Any] = _compact(schema, defs, inline, frozenset(), kept)
+    kept_defs: dict[str, Any] = {}
+    while pending := kept - kept_defs.keys():
+        for name in sorted(pending):
+            kept_defs[name] = _compact(defs[name], defs, inline, frozenset({name}), kept)
+    if kept_defs:
+        compacted["$defs"] = kept_defs
+    return compacted
+
+
+def _count_refs(node: Any, counts: dict[str, int]) -> None:
+    """Count the references to each definition in `node`, skipping data values."""
+    if isinstance(node, list):
+        for item in node:
+            _count_refs(item, counts)
+    elif isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith(_DEFS_REF):
+            name = ref[len(_DEFS_REF) :]
+            counts[name] = counts.get(name, 0) + 1
+        for key, value in node.items():
+            if key not in _DATA_KEYS:
+                _count_refs(value, counts)
+
+
+def _compact(
+    node: Any, defs: dict[str, Any], inline: set[str], resolving: frozenset[str], kept: set[str]
+) -> Any:
+    if isinstance(node, list):
+        return [_compact(item, defs, inline, resolving, kept) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    ref = node.get("$ref")
+    if isinstance(ref, str) and ref.startswith(_DEFS_REF):
+        name = ref[len(_DEFS_REF) :]
+        if name in inline and name not in resolving:
+            siblings = {key: value for key, value in node.items() if key != "$ref"}
+            return {
+                **_compact(defs[name], defs, inline, resolving | {name}, kept),
+                **_compact(siblings, defs, inline, resolving, kept),
+            }
+        if name in defs:
+            kept.add(name)
+
+    compacted: dict[str, Any] = {}
+    for key, value in node.items():
+        if key == "$defs" or (key == "title" and isinstance(value, str)):
+            continue
+        if key in _DATA_KEYS:
+            compacted[key] = value
+        elif key in ("properties", "patternProperties") and isinstance(value, dict):
+            compacted[key] = {
+                name: _compact(item, defs, inline, resolving, kept) for name, item in value.items()
+            }
+        else:
+            compacted[key] = _compact(value, defs, inline, resolving, kept)
+    return compacted
+
+
+class _AgentSavings:
+    """Compact tokens of every rendering, and both sizes of the sampled ones."""
+
+    def __init__(self) -> None:
+        self.renders = 0
+        self.compact_tokens = 0
+        self.sampled_verbose_tokens = 0
+        self.sampled_compact_tokens = 0
+
+    def report(self) -> TokenSavings:
+        verbose_tokens = self.compact_tokens
+        if self.sampled_compact_tokens:
+            verbose_tokens = round(
+                self.compact_tokens * self.sampled_verbose_tokens / self.sampled_compact_tokens
+            )
+        return TokenSavings(
+            renders=self.renders,
+            verbose_tokens=verbose_tokens,
+            compact_tokens=self.compact_tokens,
+            saved_tokens=verbose_tokens - self.compact_tokens,
+        )
+
+
+_savings: dict[str, _AgentSavings] = {}
+
+
+def record_token_savings(agent_name: str, verbose: Callable[[], str], compact: str) -> None:
+    """Add the estimated tokens saved by rendering `compact` instead of its indented form.
+
+    `verbose` returns the indented rendering. It is only called for one in
+    `_SAMPLE_EVERY` renderings of each agent, starting with the first one.
+    """
+    compact_tokens = _estimate_tokens(compact)
+    savings = _savings.setdefault(agent_name, _AgentSavings())
+    if savings.renders % _SAMPLE_EVERY == 0:
+        savings.sampled_verbose_tokens += _estimate_tokens(verbose())
+        savings.sampled_compact_tokens += compact_tokens
+    savings.renders += 1
+    savings.compact_tokens += compact_tokens
+
+
+def token_savings_report() -> dict[str, TokenSavings]:
+    """Return a snapshot of estimated token savings by agent name."""
+    return {agent_name: savings.report() for agent_name, savings in _savings.items()}
+
+
+def log_token_savings(context: EventContext, agent_name: str) -> None:
+    """Log the estimated token savings of `agent_name`, when it rendered compact text."""
+    savings = _savings.get(agent_name)
+    if savings is None:
+        return
+    report = savings.report()
+    logger.info(
+        context,
+        "agent_token_savings",
+        extra=extra(
+            agent_name=agent_name,
+            renders=report.renders,
+            verbose_tokens=report.verbose_tokens,
+            compact_tokens=report.compact_tokens,
+            saved_tokens=report.saved_tokens,
+        ),
+    )
+
+
+def clear_token_savings() -> None:
+    """Reset token savings of every agent."""
+    _savings.clear()
+
+
+def _estimate_tokens(text: str) -> int:
+    return math.ceil(len(text.encode("utf-8")) / _BYTES_PER_TOKEN)
@@ -3,10 +3,49 @@
 from hopeit.dataobjects import dataclass, dataobject, field
 
 
+@dataobject
+@dataclass
+class ToolOutputBudget:
+    """Maximum size of a tool result added to the conversation.
+
+    When both limits are set the smaller one applies. `None` means no limit.
+    """
+
+    max_bytes: int | None = None
+    max_tokens: int | None = None
+
+
+@dataobject
+@dataclass
+class ToolOutputSettings:
+    """Limits on tool results added to the conversation.
+
+    Results exceeding the budget of the tool, or `default_budget` when the tool has no
+    budget in `tool_budgets`, are truncated. When `artifacts_path` is set the full
+    output is saved there and the model can page through it with the
+    `read_tool_output` tool, reading up to `page_bytes` per call. Saved outputs
+    expire after `artifact_ttl_seconds`.
+    Tokens are estimated as `bytes_per_token` bytes of UTF-8 text.
+    """
+
+    default_budget: ToolOutputBudget = field(default_factory=ToolOutputBudget)
+    tool_budgets: dict[str, ToolOutputBudget] = field(default_factory=dict)
+    artifacts_path: str | None = None
+    page_bytes: int = 8192
+    artifact_ttl_seconds: int = 3600
+    bytes_per_token: float = 4.0
+
+
 @dataobject
 @dataclass
 class AgentSettings:
-    """Configurable defaults for the example agent."""
+    """Configurable defaults for the example agent.
+
+    `max_parallel_tool_calls` caps the tool or skill calls of a model turn running
+    at the same time.
+    `compact_tool_rendering` renders tool results and schemas as minified JSON, and
+    leaves out of the system prompt tool schemas already sent in the request `tools`.
+    """
 
     agent_name: str
     system_prompt_template: str
@@ -15,3 +54,7 @@ class AgentSettings:
     enable_tools: bool = False
     allowed_tools: list[str] = field(default_factory=list)
     include_tool_schemas_in_prompt: bool = True
+    compact_tool_rendering: bool = False
+    max_parallel_tool_calls: int = 4
+    sequential_unsafe_tool_calls: bool = True
+    tool_output: ToolOutputSettings = field(default_factory=ToolOutputSettings)
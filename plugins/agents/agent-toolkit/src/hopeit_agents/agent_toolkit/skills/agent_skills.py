@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import uuid
 from typing import Any
 
 from hopeit.app.context import EventContext
 from hopeit.app.logger import app_extra_logger
 
+from hopeit_agents.agent_toolkit.concurrency import run_calls
+from hopeit_agents.agent_toolkit.rendering import record_token_savings, render_schema
 from hopeit_agents.skills import registry, runner
 from hopeit_agents.skills.api import SkillEventInfo
 from hopeit_agents.skills.models import (
@@ -19,6 +20,7 @@ from hopeit_agents.skills.models import (
     SkillInvocation,
     SkillsSettings,
 )
+from hopeit_agents.skills.registry import RegisteredSkill
 
 logger, extra = app_extra_logger()
 
@@ -29,28 +31,81 @@ async def resolve_skills(
     agent_id: str,
     allowed_skills: list[str] | None = None,
 ) -> list[SkillEventInfo]:
-    """Return a skill-aware prompt based on the MCP skill inventory."""
-    skills = registry.list_skills()
-    if allowed_skills:
-        return [skill for skill in skills if skill.skill_name in allowed_skills]
-    return skills
+    """Return registered skills, restricted to `allowed_skills` when given."""
+    return list(registry.snapshot().select(tuple(allowed_skills) if allowed_skills else None))
+
+
+_descriptions: dict[tuple[Any, ...], str] = {}
+_MAX_DESCRIPTIONS = 256
 
 
 def skill_descriptions(
     skills: list[SkillEventInfo],
     *,
     include_schemas: bool,
+    compact: bool = False,
+    agent_name: str | None = None,
+) -> str:
+    """Render skill metadata as bullet points for LLM consumption.
+
+    With `compact`, schemas are rendered minified by `render_schema`. Estimated
+    token savings are recorded for `agent_name` when given. Renderings of registered
+    skills are memoized until the skills registry changes.
+    """
+    snapshot = registry.snapshot()
+    entries = [snapshot.find(skill.skill_name, app_key=skill.app_key) for skill in skills]
+    if all(
+        entry is not None and entry.info is skill
+        for entry, skill in zip(entries, skills, strict=True)
+    ):
+        key = (
+            snapshot.version,
+            tuple(entry.key for entry in entries if entry is not None),
+            include_schemas,
+            compact,
+        )
+        rendered = _descriptions.get(key)
+        if rendered is None:
+            if len(_descriptions) >= _MAX_DESCRIPTIONS:
+                _descriptions.clear()
+            rendered = _descriptions[key] = _render_skill_descriptions(
+                skills, entries, include_schemas=include_schemas, compact=compact
+            )
+    else:
+        rendered = _render_skill_descriptions(
+            skills, [None] * len(skills), include_schemas=include_schemas, compact=compact
+        )
+    if compact and agent_name is not None:
+        record_token_savings(
+            agent_name,
+            lambda: skill_descriptions(skills, include_schemas=include_schemas),
+            rendered,
+        )
+    return rendered
+
+
+def _render_skill_descriptions(
+    skills: list[SkillEventInfo],
+    entries: list[RegisteredSkill | None],
+    *,
+    include_schemas: bool,
+    compact: bool,
 ) -> str:
-    """Render skill metadata as bullet points for LLM consumption."""
     lines: list[str] = []
     lines.append("\nAvailable skills:")
-    for skill in skills:
-        description = (skill.description or "No description provided.").strip()
-        lines.append(f"- {skill.skill_name}: {description}")
+    for skill, entry in zip(skills, entries, strict=True):
+        if entry is not None:
+            lines.append(entry.prompt_description)
+        else:
+            description = (skill.description or "No description provided.").strip()
+            lines.append(f"- {skill.skill_name}: {description}")
         if include_schemas and skill.input_schema:
-            schema = json.dumps(skill.input_schema, indent=2, sort_keys=True)
-            lines.append("  JSON schema:")
-            lines.extend(f"    {schema_line}" for schema_line in schema.splitlines())
+            schema = render_schema(skill.input_schema, compact=compact)
+            if compact:
+                lines.append(f"  JSON schema: {schema}")
+            else:
+                lines.append("  JSON schema:")
+                lines.extend(f"    {schema_line}" for schema_line in schema.splitlines())
     return "\n".join(lines).strip()
 
 
@@ -62,18 +117,22 @@ async def call_skill(
     skill_name: str,
     payload: dict[str, Any],
     session_id: str | None = None,
+    app_key: str | None = None,
 ) -> SkillExecutionResult:
-    """Execute a skill through the skills plugin runner using the provided payload."""
-    skill = registry.find_skill(skill_name)
+    """Execute a skill through the skills plugin runner using the provided payload.
+
+    The skill is looked up in the app `app_key` when given.
+    """
+    skill = registry.find_skill(skill_name, app_key=app_key)
     if skill is None:
         logger.error(
             context,
             "call_skill_error",
-            extra=extra(skill_name=skill_name),
+            extra=extra(skill_name=skill_name, app_key=app_key),
         )
         raise RuntimeError(f"Skill not found: {skill_name}")
 
-    result = await runner.execute_skill(skill, payload, context)
+    result = await runner.execute_skill(skill, payload, context, config)
     return SkillExecutionResult(
         call_id=call_id,
         skill_name=skill_name,
@@ -89,22 +148,49 @@ async def execute_skill_calls(
     *,
     skill_calls: list[SkillInvocation],
     session_id: str | None = None,
+    max_concurrency: int = 1,
+    skills: list[SkillEventInfo] | None = None,
 ) -> list[SkillCallRecord]:
-    """Execute multiple skill calls capturing request and response data."""
-    records: list[SkillCallRecord] = []
-    for skill_call in skill_calls:
+    """Execute multiple skill calls capturing request and response data.
+
+    Skills are looked up in the app of the skill with the same name in `skills`, the
+    skills offered to the model, so skill names registered by several apps resolve
+    to the offered one. Up to `max_concurrency` calls run at the same time. Skills
+    declared with `parallel=False` in their `__skill__` spec run alone, after every
+    previous call finished and before any later call starts. Records are returned in
+    the order of `skill_calls`.
+    """
+    call_ids = [
+        skill_call.call_id or f"call_{uuid.uuid4().hex[-10:]}" for skill_call in skill_calls
+    ]
+    app_keys = {skill.skill_name: skill.app_key for skill in skills or []}
+
+    async def execute(call: tuple[SkillInvocation, str]) -> SkillCallRecord:
+        skill_call, call_id = call
         result = await call_skill(
             config,
             context,
-            call_id=skill_call.call_id or f"call_{uuid.uuid4().hex[-10:]}",
+            call_id=call_id,
             skill_name=skill_call.skill_name,
             payload=skill_call.payload,
             session_id=session_id,
+            app_key=app_keys.get(skill_call.skill_name),
         )
         request_log = SkillCallRequestLog(
             skill_call_id=result.call_id,
             skill_name=skill_call.skill_name,
             payload=skill_call.payload,
         )
-        records.append(SkillCallRecord(request=request_log, response=result))
-    return records
+        return SkillCallRecord(request=request_log, response=result)
+
+    def parallel_safe(call: tuple[SkillInvocation, str]) -> bool:
+        skill_name = call[0].skill_name
+        skill = registry.find_skill(skill_name, app_key=app_keys.get(skill_name))
+        return skill is not None and skill.parallel
+
+    return await run_calls(
+        list(zip(skill_calls, call_ids, strict=True)),
+        execute,
+        max_concurrency=max_concurrency,
+        parallel_safe=parallel_safe,
+    )
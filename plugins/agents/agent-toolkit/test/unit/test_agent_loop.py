@@ -1,7 +1,9 @@
 """Unit tests for the agent loop step."""
 
+import json
 from collections.abc import Mapping
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -11,11 +13,18 @@ from pytest import MonkeyPatch
 
 from hopeit_agents.agent_toolkit.app.steps import agent_loop
 from hopeit_agents.agent_toolkit.app.steps.agent_loop import AgentLoopConfig, AgentLoopPayload
-from hopeit_agents.agent_toolkit.settings import AgentSettings
+from hopeit_agents.agent_toolkit.mcp.tool_outputs import READ_TOOL_OUTPUT, ToolOutputStore
+from hopeit_agents.agent_toolkit.rendering import render_tool_result
+from hopeit_agents.agent_toolkit.settings import (
+    AgentSettings,
+    ToolOutputBudget,
+    ToolOutputSettings,
+)
 from hopeit_agents.mcp_client.models import (
     MCPClientConfig,
     ToolCallRecord,
     ToolCallRequestLog,
+    ToolDescriptor,
     ToolExecutionResult,
     ToolExecutionStatus,
 )
@@ -172,34 +181,99 @@ async def test_agent_loop_returns_assistant_message(monkeypatch: MonkeyPatch) ->
     assert result.user_context == payload.user_context
 
 
-def test_format_tool_result_prefers_structured_content() -> None:
-    """Structured content should be rendered before raw content."""
+@pytest.mark.asyncio
+async def test_agent_loop_serves_read_tool_output_locally(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Truncated outputs are paged by the loop without calling the MCP server."""
 
-    result = ToolExecutionResult(
-        call_id="call-structured",
-        tool_name="demo",
-        status=ToolExecutionStatus.SUCCESS,
-        structured_content={"foo": "bar"},
-        content=[{"type": "text", "text": "fallback"}],
+    initial_conversation = Conversation(
+        conversation_id="conv-2",
+        messages=[Message(role=Role.USER, content="help")],
     )
-
-    formatted = agent_loop._format_tool_result(result)
-
-    assert formatted == Payload.to_json(result.structured_content, indent=2)
-
-
-def test_format_tool_result_falls_back_to_content() -> None:
-    """When no structured content is present, fall back to raw content."""
-
-    content_payload = [{"type": "text", "text": "value"}]
-    result = ToolExecutionResult(
-        call_id="call-content",
-        tool_name="demo",
-        status=ToolExecutionStatus.SUCCESS,
-        structured_content=None,
-        content=content_payload,
+    store = ToolOutputStore(tmp_path, ttl_seconds=60)
+    artifact_id = await store.save("saved output", session_id="conv-2")
+    tool_calls = [
+        ToolCall(
+            id="call-1",
+            type="function",
+            function=ToolFunctionCall(
+                name=READ_TOOL_OUTPUT, arguments=json.dumps({"artifact_id": artifact_id})
+            ),
+        ),
+        ToolCall(
+            id="call-2",
+            type="function",
+            function=ToolFunctionCall(name="demo_tool", arguments="{}"),
+        ),
+    ]
+    assistant_message = Message(role=Role.ASSISTANT, content="", tool_calls=tool_calls)
+    generate_mock = AsyncMock(
+        return_value=CompletionResponse(
+            response_id="resp-3",
+            model="test-model",
+            created_at=datetime.now(UTC),
+            message=assistant_message,
+            tool_calls=tool_calls,
+            conversation=initial_conversation.with_message(assistant_message),
+            usage=None,
+            finish_reason="tool_calls",
+        )
+    )
+    monkeypatch.setattr(
+        "hopeit_agents.agent_toolkit.app.steps.agent_loop.model_generate.generate",
+        generate_mock,
+    )
+    record = ToolCallRecord(
+        request=ToolCallRequestLog(tool_call_id="call-2", tool_name="demo_tool", payload={}),
+        response=ToolExecutionResult(
+            call_id="call-2",
+            tool_name="demo_tool",
+            status=ToolExecutionStatus.SUCCESS,
+            structured_content={"rows": list(range(100))},
+        ),
     )
+    execute_mock = AsyncMock(return_value=[record])
+    monkeypatch.setattr(agent_loop, "execute_tool_calls", execute_mock)
 
-    formatted = agent_loop._format_tool_result(result)
+    payload = AgentLoopPayload(
+        conversation=initial_conversation,
+        user_context={},
+        completion_config=CompletionConfig(available_tools=[_tool("demo_tool")]),
+        loop_config=AgentLoopConfig(max_iterations=1),
+        agent_settings=AgentSettings(
+            agent_name="test-agent",
+            system_prompt_template="test-template.md",
+            enable_tools=True,
+            tool_output=ToolOutputSettings(
+                default_budget=ToolOutputBudget(max_bytes=20), artifacts_path=str(tmp_path)
+            ),
+        ),
+        mcp_settings=MCPClientConfig(command="demo"),
+    )
 
-    assert formatted == Payload.to_json(content_payload, indent=2)
+    result = await agent_loop.agent_with_tools_loop(payload, MagicMock())
+
+    request = generate_mock.await_args_list[0].args[0]
+    assert [tool.name for tool in request.config.available_tools] == [
+        "demo_tool",
+        READ_TOOL_OUTPUT,
+    ]
+    assert [call.tool_name for call in execute_mock.await_args_list[0].kwargs["tool_calls"]] == [
+        "demo_tool"
+    ]
+    assert [entry.request.tool_call_id for entry in result.tool_call_log] == ["call-1", "call-2"]
+    paged, truncated = result.conversation.messages[-2:]
+    assert paged.content is not None and "saved output" in paged.content
+    assert truncated.content is not None
+    saved_id = json.loads(truncated.content[truncated.content.index("with {") + 5 : -2])[
+        "artifact_id"
+    ]
+    page = await store.read(saved_id, session_id="conv-2", offset=0, limit=1000)
+    assert page.content == render_tool_result(record.response)
+
+
+def _tool(name: str) -> ToolDescriptor:
+    return ToolDescriptor(
+        name=name, title=None, description=None, input_schema={}, output_schema=None
+    )
@@ -0,0 +1,137 @@
+"""Unit tests for agent skill helpers."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+from hopeit.app.config import EventDescriptor, EventType
+from hopeit.app.context import EventContext
+
+from hopeit_agents.agent_toolkit.skills import agent_skills
+from hopeit_agents.skills import registry, runner
+from hopeit_agents.skills.api import SkillEventInfo
+from hopeit_agents.skills.models import SkillInvocation, SkillsSettings
+
+
+@pytest.mark.asyncio
+async def test_execute_skill_calls_runs_parallel_skills_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Parallel skills run concurrently up to the cap, others alone, keeping call order."""
+
+    events: list[str] = []
+    running: list[int] = [0, 0]
+    skills = {
+        "lookup": SimpleNamespace(skill_name="lookup", parallel=True),
+        "charge": SimpleNamespace(skill_name="charge", parallel=False),
+    }
+
+    async def fake_execute_skill(
+        skill: Any, payload: dict[str, Any], context: EventContext, settings: SkillsSettings
+    ) -> dict[str, Any]:
+        running[0] += 1
+        running[1] = max(running[1], running[0])
+        events.append(f"start {payload['id']}")
+        # later calls finish first
+        await asyncio.sleep(0.01 * payload["delay"])
+        events.append(f"end {payload['id']}")
+        running[0] -= 1
+        return {"id": payload["id"]}
+
+    monkeypatch.setattr(registry, "find_skill", lambda name, app_key=None: skills.get(name))
+    monkeypatch.setattr(runner, "execute_skill", fake_execute_skill)
+
+    skill_calls = [
+        SkillInvocation(skill_name=name, payload={"id": i, "delay": delay}, call_id=f"c{i}")
+        for i, (name, delay) in enumerate(
+            [("lookup", 3), ("lookup", 2), ("lookup", 1), ("charge", 1), ("lookup", 1)]
+        )
+    ]
+
+    records = await agent_skills.execute_skill_calls(
+        SkillsSettings(),
+        cast(EventContext, SimpleNamespace()),
+        skill_calls=skill_calls,
+        max_concurrency=2,
+    )
+
+    assert [record.request.skill_call_id for record in records] == ["c0", "c1", "c2", "c3", "c4"]
+    assert [record.response.structured_content for record in records] == [
+        {"id": i} for i in range(5)
+    ]
+    assert running[1] == 2
+    # the non-parallel skill waits for previous calls and runs before later ones
+    assert events.index("start 3") > max(events.index(f"end {i}") for i in range(3))
+    assert events.index("start 4") > events.index("end 3")
+
+
+@pytest.mark.asyncio
+async def test_execute_skill_calls_resolve_offered_skills_by_app(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Skill names registered by several apps run the skill of the app offered to the model."""
+
+    def skill(app_key: str) -> SkillEventInfo:
+        return SkillEventInfo(
+            app_key=app_key,
+            event_name="skills.sum",
+            event_info=EventDescriptor(type=EventType.POST),
+            skill_name="sum",
+            title="sum",
+            summary=None,
+            description="Adds numbers.",
+            input_schema={"type": "object"},
+        )
+
+    async def fake_execute_skill(
+        skill: SkillEventInfo, payload: dict[str, Any], context: EventContext, settings: Any
+    ) -> dict[str, Any]:
+        return {"app_key": skill.app_key}
+
+    monkeypatch.setattr(runner, "execute_skill", fake_execute_skill)
+    registry.clear_skills()
+    registry.register_skill(skill("app-a"))
+    registry.register_skill(skill("app-b"))
+
+    records = await agent_skills.execute_skill_calls(
+        SkillsSettings(),
+        cast(EventContext, SimpleNamespace()),
+        skill_calls=[SkillInvocation(skill_name="sum", call_id="c0")],
+        skills=[skill("app-b")],
+    )
+    registry.clear_skills()
+
+    assert records[0].response.structured_content == {"app_key": "app-b"}
+
+
+def test_skill_descriptions_are_memoized_until_registry_changes() -> None:
+    """Descriptions of registered skills are reused until a skill is registered again."""
+
+    def skill(description: str) -> SkillEventInfo:
+        return SkillEventInfo(
+            app_key="app",
+            event_name="skills.sum",
+            event_info=EventDescriptor(type=EventType.POST),
+            skill_name="sum",
+            title="sum",
+            summary=None,
+            description=description,
+            input_schema={"type": "object", "title": "SumRequest"},
+        )
+
+    registry.clear_skills()
+    registry.register_skill(skill("Adds numbers."))
+    skills = registry.list_skills()
+    first = agent_skills.skill_descriptions(list(skills), include_schemas=True, compact=True)
+    again = agent_skills.skill_descriptions(list(skills), include_schemas=True, compact=True)
+
+    registry.register_skill(skill("Adds two numbers."))
+    updated = agent_skills.skill_descriptions(
+        list(registry.list_skills()), include_schemas=True, compact=True
+    )
+    registry.clear_skills()
+
+    assert again is first
+    assert first == 'Available skills:\n- sum: Adds numbers.\n  JSON schema: {"type":"object"}'
+    assert "- sum: Adds two numbers." in updated
@@ -1,24 +1,36 @@
 """Unit tests for MCP agent tool helpers."""
 
+import asyncio
 import uuid
+from collections.abc import Iterator
 from types import SimpleNamespace
 from typing import Any, cast
 
 import pytest
 from hopeit.app.context import EventContext
 
+from hopeit_agents.agent_toolkit import rendering
 from hopeit_agents.agent_toolkit.mcp import agent_tools
+from hopeit_agents.mcp_client import federation
 from hopeit_agents.mcp_client.client import MCPClientError
 from hopeit_agents.mcp_client.models import (
     MCPClientConfig,
+    ToolAnnotations,
     ToolCallRecord,
     ToolDescriptor,
     ToolExecutionResult,
     ToolExecutionStatus,
     ToolInvocation,
+    Transport,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_federations() -> Iterator[None]:
+    yield
+    federation.clear_federated_clients()
+
+
 def _stub_context(env: dict[str, Any] | None = None) -> tuple[EventContext, SimpleNamespace]:
     namespace = SimpleNamespace(env=env or {})
     return cast(EventContext, namespace), namespace
@@ -53,8 +65,8 @@ async def test_resolve_tools_returns_inventory(monkeypatch: pytest.MonkeyPatch)
             captured["list_tools_called"] = True
             return tools
 
-    monkeypatch.setattr(agent_tools, "build_environment", fake_build_environment)
-    monkeypatch.setattr(agent_tools, "MCPClient", DummyClient)
+    monkeypatch.setattr(federation, "build_environment", fake_build_environment)
+    monkeypatch.setattr(federation, "MCPClient", DummyClient)
 
     context, raw_context = _stub_context({"TOKEN": "from-context"})
     config = MCPClientConfig(command="demo")
@@ -93,8 +105,8 @@ async def test_resolve_tools_filters_allowed(monkeypatch: pytest.MonkeyPatch) ->
         async def list_tools(self) -> list[ToolDescriptor]:
             return tools
 
-    monkeypatch.setattr(agent_tools, "build_environment", lambda config, ctx_env: ctx_env)
-    monkeypatch.setattr(agent_tools, "MCPClient", DummyClient)
+    monkeypatch.setattr(federation, "build_environment", lambda config, ctx_env: ctx_env)
+    monkeypatch.setattr(federation, "MCPClient", DummyClient)
 
     context, _ = _stub_context({})
     config = MCPClientConfig()
@@ -125,8 +137,8 @@ async def test_resolve_tools_handles_errors(monkeypatch: pytest.MonkeyPatch) ->
         async def list_tools(self) -> list[ToolDescriptor]:
             raise MCPClientError("boom", details={"error": "failure"})
 
-    monkeypatch.setattr(agent_tools, "build_environment", lambda config, ctx_env: {})
-    monkeypatch.setattr(agent_tools, "MCPClient", FailingClient)
+    monkeypatch.setattr(federation, "build_environment", lambda config, ctx_env: {})
+    monkeypatch.setattr(federation, "MCPClient", FailingClient)
     monkeypatch.setattr(agent_tools, "logger", stub_logger)
 
     context, _ = _stub_context({})
@@ -163,6 +175,38 @@ def test_tool_descriptions_renders_schemas() -> None:
     assert "JSON schema" not in rendered_no_schema
 
 
+def test_tool_descriptions_compact_mode() -> None:
+    """Compact descriptions minify schemas and skip those sent in `tools`."""
+
+    tool = ToolDescriptor(
+        name="alpha",
+        title="Alpha",
+        description="Example tool",
+        input_schema={
+            "title": "AlphaInput",
+            "type": "object",
+            "properties": {"foo": {"title": "Foo", "type": "string"}},
+        },
+        output_schema=None,
+    )
+
+    rendered = agent_tools.tool_descriptions(
+        [tool], include_schemas=True, compact=True, agent_name="agent-1"
+    )
+    rendered_in_tools = agent_tools.tool_descriptions(
+        [tool], include_schemas=True, compact=True, schemas_in_tools=True
+    )
+
+    assert rendered.endswith(
+        '  JSON schema: {"properties":{"foo":{"type":"string"}},"type":"object"}'
+    )
+    assert rendered_in_tools == "Available tools:\n- alpha: Example tool"
+    savings = rendering.token_savings_report()["agent-1"]
+    assert savings.renders == 1
+    assert savings.saved_tokens == savings.verbose_tokens - savings.compact_tokens > 0
+    rendering.clear_token_savings()
+
+
 @pytest.mark.asyncio
 async def test_call_tool_invokes_client(monkeypatch: pytest.MonkeyPatch) -> None:
     """call_tool should delegate invocation to the MCP client and return its result."""
@@ -201,8 +245,8 @@ async def test_call_tool_invokes_client(monkeypatch: pytest.MonkeyPatch) -> None
             }
             return expected_result
 
-    monkeypatch.setattr(agent_tools, "build_environment", fake_build_environment)
-    monkeypatch.setattr(agent_tools, "MCPClient", DummyClient)
+    monkeypatch.setattr(federation, "build_environment", fake_build_environment)
+    monkeypatch.setattr(federation, "MCPClient", DummyClient)
 
     context, raw_context = _stub_context({"TOKEN": "from-context"})
     config = MCPClientConfig(command="demo")
@@ -250,8 +294,8 @@ async def test_call_tool_propagates_client_errors(monkeypatch: pytest.MonkeyPatc
         ) -> ToolExecutionResult:
             raise MCPClientError("failed")
 
-    monkeypatch.setattr(agent_tools, "build_environment", lambda config, ctx_env: {})
-    monkeypatch.setattr(agent_tools, "MCPClient", FailingClient)
+    monkeypatch.setattr(federation, "build_environment", lambda config, ctx_env: {})
+    monkeypatch.setattr(federation, "MCPClient", FailingClient)
     monkeypatch.setattr(agent_tools, "logger", stub_logger)
 
     context, _ = _stub_context({})
@@ -267,6 +311,79 @@ async def test_call_tool_propagates_client_errors(monkeypatch: pytest.MonkeyPatc
         )
 
 
+@pytest.mark.asyncio
+async def test_tools_of_several_servers_are_federated(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tools of every server are listed together and calls go to the server exposing them."""
+
+    catalogs = {"http://agents/mcp": ["ask_expert"], "http://tools/mcp": ["sum"]}
+    calls: list[tuple[str | None, str]] = []
+    warnings: list[dict[str, Any]] = []
+
+    class DummyClient:
+        def __init__(self, config: MCPClientConfig, env: dict[str, str]) -> None:
+            self.url = config.url
+
+        async def list_tools(self) -> list[ToolDescriptor]:
+            if self.url not in catalogs:
+                raise MCPClientError("unreachable")
+            return [
+                ToolDescriptor(
+                    name=name, title=None, description=None, input_schema={}, output_schema=None
+                )
+                for name in catalogs[self.url]
+            ]
+
+        async def call_tool(
+            self, tool_name: str, payload: dict[str, Any], **kwargs: Any
+        ) -> ToolExecutionResult:
+            calls.append((self.url, tool_name))
+            return ToolExecutionResult(
+                call_id=kwargs["call_id"], tool_name=tool_name, status=ToolExecutionStatus.SUCCESS
+            )
+
+    monkeypatch.setattr(federation, "MCPClient", DummyClient)
+    monkeypatch.setattr(
+        agent_tools,
+        "logger",
+        SimpleNamespace(warning=lambda *args, **kwargs: warnings.append(kwargs["extra"])),
+    )
+    monkeypatch.setattr(agent_tools, "extra", lambda **kwargs: kwargs)
+    context, _ = _stub_context({})
+    servers = {
+        name: MCPClientConfig(transport=Transport.HTTP, url=f"http://{name}/mcp")
+        for name in ("agents", "down", "tools")
+    }
+
+    tools = await agent_tools.resolve_tools(servers, context, agent_id="agent-1")
+    await agent_tools.call_tool(
+        servers, context, call_id="call-1", tool_name="sum", payload={"a": 1}
+    )
+
+    assert [tool.name for tool in tools] == ["ask_expert", "sum"]
+    assert [warning["server"] for warning in warnings] == ["down"]
+    assert calls == [("http://tools/mcp", "sum")]
+
+
+def test_servers_differing_in_any_setting_get_their_own_client() -> None:
+    """Servers configured by host and port, or by env, are not mixed up."""
+
+    context, _ = _stub_context({})
+    configs = [
+        MCPClientConfig(transport=Transport.HTTP, host="localhost", port=port)
+        for port in (8001, 8002)
+    ]
+    stdio = MCPClientConfig(transport=Transport.STDIO, command="server", env={"TOKEN": "${TOKEN}"})
+
+    first, second = (agent_tools._federated_client(config, context) for config in configs)
+    tenant_a = agent_tools._federated_client(stdio, _stub_context({"TOKEN": "a"})[0])
+    tenant_b = agent_tools._federated_client(stdio, _stub_context({"TOKEN": "b"})[0])
+
+    assert first is not second
+    assert agent_tools._federated_client(configs[0], context) is first
+    assert tenant_a is not tenant_b
+    assert agent_tools._federated_client(stdio, _stub_context({"TOKEN": "a"})[0]) is tenant_a
+
+
 @pytest.mark.asyncio
 async def test_execute_tool_calls_invokes_each_call(monkeypatch: pytest.MonkeyPatch) -> None:
     """execute_tool_calls should invoke call_tool for each ToolInvocation."""
@@ -335,3 +452,89 @@ async def test_execute_tool_calls_invokes_each_call(monkeypatch: pytest.MonkeyPa
     assert calls[1]["tool_name"] == "beta"
     assert records[1].request.tool_call_id == generated_call_id
     assert records[1].request.payload == {"baz": "qux"}
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_calls_runs_safe_tools_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Read-only tools run concurrently, others alone, keeping call order."""
+
+    events: list[str] = []
+    running: list[int] = [0, 0]
+
+    async def fake_call_tool(
+        config: MCPClientConfig,
+        context: EventContext,
+        *,
+        call_id: str,
+        tool_name: str,
+        payload: dict[str, Any],
+        session_id: str | None,
+    ) -> ToolExecutionResult:
+        running[0] += 1
+        running[1] = max(running[1], running[0])
+        events.append(f"start {call_id}")
+        # later calls finish first
+        await asyncio.sleep(0.01 * payload["delay"])
+        events.append(f"end {call_id}")
+        running[0] -= 1
+        return ToolExecutionResult(
+            call_id=call_id, tool_name=tool_name, status=ToolExecutionStatus.SUCCESS
+        )
+
+    monkeypatch.setattr(agent_tools, "call_tool", fake_call_tool)
+
+    def descriptor(name: str, annotations: ToolAnnotations | None) -> ToolDescriptor:
+        return ToolDescriptor(
+            name=name,
+            title=None,
+            description=None,
+            input_schema={},
+            output_schema=None,
+            annotations=annotations,
+        )
+
+    tools = [
+        descriptor("search", ToolAnnotations(readOnlyHint=True)),
+        descriptor("upsert", ToolAnnotations(readOnlyHint=False, idempotentHint=True)),
+        descriptor("send", ToolAnnotations(readOnlyHint=False, idempotentHint=False)),
+    ]
+    tool_calls = [
+        ToolInvocation(tool_name="search", payload={"delay": 3}, call_id="c1"),
+        ToolInvocation(tool_name="upsert", payload={"delay": 2}, call_id="c2"),
+        ToolInvocation(tool_name="search", payload={"delay": 1}, call_id="c3"),
+        ToolInvocation(tool_name="send", payload={"delay": 1}, call_id="c4"),
+        ToolInvocation(tool_name="unknown", payload={"delay": 1}, call_id="c5"),
+        ToolInvocation(tool_name="search", payload={"delay": 2}, call_id="c6"),
+        ToolInvocation(tool_name="search", payload={"delay": 1}, call_id="c7"),
+    ]
+    context, _ = _stub_context({})
+
+    records = await agent_tools.execute_tool_calls(
+        MCPClientConfig(),
+        context,
+        tool_calls=tool_calls,
+        tools=tools,
+        max_concurrency=2,
+    )
+
+    assert [record.response.call_id for record in records] == [f"c{i}" for i in range(1, 8)]
+    assert running[1] == 2
+    # idempotent writes are not enough to run concurrently
+    assert events.index("start c2") > events.index("end c1")
+    assert events.index("end c2") < events.index("start c3")
+    assert events.index("start c4") > events.index("end c3")
+    assert events.index("end c4") < events.index("start c5")
+    assert events.index("end c5") < events.index("start c6")
+    assert events.index("start c7") < events.index("end c6")
+
+    events.clear()
+    await agent_tools.execute_tool_calls(
+        MCPClientConfig(),
+        context,
+        tool_calls=tool_calls[:3],
+        tools=tools,
+        max_concurrency=1,
+    )
+    assert events == ["start c1", "end c1", "start c2", "end c2", "start c3", "end c3"]
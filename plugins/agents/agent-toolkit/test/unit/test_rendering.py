@@ -0,0 +1,176 @@
+"""Unit tests for compact rendering of tool results and schemas."""
+
+from collections.abc import Callable
+
+from hopeit.dataobjects.payload import Payload
+
+from hopeit_agents.agent_toolkit.rendering import (
+    clear_token_savings,
+    compact_schema,
+    record_token_savings,
+    render_json,
+    render_tool_result,
+    token_savings_report,
+)
+from hopeit_agents.mcp_client.models import ToolExecutionResult, ToolExecutionStatus
+
+
+def test_render_json_minifies_in_compact_mode() -> None:
+    value = {"rows": [1, 2], "name": "ñ"}
+
+    assert render_json(value, compact=True) == '{"rows":[1,2],"name":"ñ"}'
+    assert render_json(value, compact=False).startswith('{\n  "rows": [')
+
+
+def test_render_tool_result_prefers_structured_content() -> None:
+    """Structured content should be rendered before raw content."""
+
+    result = ToolExecutionResult(
+        call_id="call-structured",
+        tool_name="demo",
+        status=ToolExecutionStatus.SUCCESS,
+        structured_content={"foo": "bar"},
+        content=[{"type": "text", "text": "fallback"}],
+    )
+
+    assert render_tool_result(result) == Payload.to_json(result.structured_content, indent=2)
+
+
+def test_render_tool_result_falls_back_to_content() -> None:
+    """When no structured content is present, fall back to raw content."""
+
+    content_payload = [{"type": "text", "text": "value"}]
+    result = ToolExecutionResult(
+        call_id="call-content",
+        tool_name="demo",
+        status=ToolExecutionStatus.SUCCESS,
+        structured_content=None,
+        content=content_payload,
+    )
+
+    assert render_tool_result(result) == Payload.to_json(content_payload, indent=2)
+
+
+def test_render_tool_result_compact_mode() -> None:
+    """Compact rendering minifies results and records token savings per agent."""
+
+    result = ToolExecutionResult(
+        call_id="call-compact",
+        tool_name="demo",
+        status=ToolExecutionStatus.SUCCESS,
+        structured_content={"rows": [1, 2, 3]},
+    )
+
+    rendered = render_tool_result(result, compact=True, agent_name="compact-agent")
+    savings = token_savings_report()["compact-agent"]
+    clear_token_savings()
+
+    assert rendered == '{"rows":[1,2,3]}'
+    assert savings.saved_tokens > 0
+
+
+def test_compact_schema_strips_titles_and_inlines_defs() -> None:
+    schema = {
+        "title": "SearchRequest",
+        "type": "object",
+        "properties": {
+            "title": {"title": "Title", "type": "string", "default": {"title": "kept"}},
+            "filter": {"$ref": "#/$defs/Filter", "description": "Optional filter"},
+        },
+        "$defs": {
+            "Filter": {
+                "title": "Filter",
+                "type": "object",
+                "properties": {"tag": {"title": "Tag", "type": "string"}},
+            }
+        },
+    }
+
+    assert compact_schema(schema) == {
+        "type": "object",
+        "properties": {
+            "title": {"type": "string", "default": {"title": "kept"}},
+            "filter": {
+                "type": "object",
+                "properties": {"tag": {"type": "string"}},
+                "description": "Optional filter",
+            },
+        },
+    }
+
+
+def test_compact_schema_keeps_recursive_defs() -> None:
+    schema = {
+        "$ref": "#/$defs/Node",
+        "$defs": {
+            "Node": {
+                "title": "Node",
+                "type": "object",
+                "properties": {"children": {"type": "array", "items": {"$ref": "#/$defs/Node"}}},
+            }
+        },
+    }
+
+    node = {
+        "type": "object",
+        "properties": {"children": {"type": "array", "items": {"$ref": "#/$defs/Node"}}},
+    }
+    assert compact_schema(schema) == {"$ref": "#/$defs/Node", "$defs": {"Node": node}}
+
+
+def test_compact_schema_keeps_shared_defs() -> None:
+    schema = {
+        "type": "object",
+        "properties": {
+            "billing": {"$ref": "#/$defs/Address"},
+            "shipping": {"$ref": "#/$defs/Address"},
+            "owner": {"$ref": "#/$defs/Person"},
+        },
+        "$defs": {
+            "Address": {"title": "Address", "type": "object", "properties": {"city": {}}},
+            "Person": {
+                "title": "Person",
+                "type": "object",
+                "properties": {"home": {"$ref": "#/$defs/Address"}},
+            },
+            "Unused": {"type": "string"},
+        },
+    }
+
+    address = {"$ref": "#/$defs/Address"}
+    assert compact_schema(schema) == {
+        "type": "object",
+        "properties": {
+            "billing": address,
+            "shipping": address,
+            "owner": {"type": "object", "properties": {"home": address}},
+        },
+        "$defs": {"Address": {"type": "object", "properties": {"city": {}}}},
+    }
+
+
+def test_token_savings_are_reported_per_agent() -> None:
+    """Indented sizes are sampled and extrapolated to the other renderings."""
+    verbose_calls: list[str] = []
+
+    def verbose(text: str) -> Callable[[], str]:
+        def render() -> str:
+            verbose_calls.append(text)
+            return text
+
+        return render
+
+    record_token_savings("agent-1", verbose("x" * 400), "x" * 100)
+    record_token_savings("agent-1", verbose("x" * 40), "x" * 40)
+    record_token_savings("agent-2", verbose("x" * 8), "x" * 4)
+
+    report = token_savings_report()
+    clear_token_savings()
+
+    assert verbose_calls == ["x" * 400, "x" * 8]
+    assert report["agent-1"].renders == 2
+    assert report["agent-1"].verbose_tokens == 140
+    assert report["agent-1"].compact_tokens == 35
+    assert report["agent-1"].saved_tokens == 105
+    assert report["agent-2"].saved_tokens == 1
+    assert token_savings_report() == {}
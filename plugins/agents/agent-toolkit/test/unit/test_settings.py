@@ -15,6 +15,12 @@ def test_agent_settings_defaults() -> None:
     assert settings.enable_tools is False
     assert settings.allowed_tools == []
     assert settings.include_tool_schemas_in_prompt is True
+    assert settings.compact_tool_rendering is False
+    assert settings.max_parallel_tool_calls == 4
+    assert settings.sequential_unsafe_tool_calls is True
+    assert settings.tool_output.default_budget.max_bytes is None
+    assert settings.tool_output.artifacts_path is None
+    assert settings.tool_output.artifact_ttl_seconds == 3600
 
 
 def test_agent_settings_custom_allowed_tools() -> None:
@@ -0,0 +1,50 @@
+"""Unit tests for compiled prompt templates and the template file cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from hopeit_agents.agent_toolkit.agents.templates import (
+    CompiledTemplate,
+    compile_template,
+    load_prompt_template,
+)
+
+
+def test_compiled_template_renders_in_one_pass() -> None:
+    """Values are inserted as they are, without rendering placeholders they contain."""
+
+    template = compile_template("Hi {{user}}, use {{tools}}. {{ user }} is literal.")
+
+    assert template.segments == ("Hi ", ", use ", ". {{ user }} is literal.")
+    assert template.placeholders == ("user", "tools")
+    assert compile_template("Hi {{user}}, use {{tools}}. {{ user }} is literal.") is template
+    assert (
+        template.render({"user": "Ada", "tools": "{{user}}", "unused": "x"})
+        == "Hi Ada, use {{user}}. {{ user }} is literal."
+    )
+
+
+def test_compiled_template_reports_missing_placeholders() -> None:
+    template = CompiledTemplate("{{b}} {{a}} {{b}}")
+
+    with pytest.raises(ValueError, match="Missing values for placeholders: a, b"):
+        template.render({})
+
+
+def test_load_prompt_template_reloads_when_file_changes(tmp_path: Path) -> None:
+    """Template files are read once and again only after they are modified."""
+
+    path = tmp_path / "prompt.md"
+    path.write_text("first", encoding="utf-8")
+
+    assert load_prompt_template(path) == "first"
+    stat = path.stat()
+    path.write_text("later", encoding="utf-8")
+    # Same size and modification time: the cached text is returned
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert load_prompt_template(path) == "first"
+
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_prompt_template(path) == "later"
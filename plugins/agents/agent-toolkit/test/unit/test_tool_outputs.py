@@ -0,0 +1,153 @@
+"""Unit tests for tool output budgets and the artifact store."""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from hopeit_agents.agent_toolkit.mcp import tool_outputs
+from hopeit_agents.agent_toolkit.mcp.tool_outputs import (
+    READ_TOOL_OUTPUT,
+    ToolOutputStore,
+    limit_tool_output,
+    output_budget_bytes,
+    read_tool_output,
+)
+from hopeit_agents.agent_toolkit.settings import ToolOutputBudget, ToolOutputSettings
+from hopeit_agents.mcp_client.models import (
+    ToolExecutionResult,
+    ToolExecutionStatus,
+    ToolInvocation,
+)
+
+
+def _result(structured: dict[str, Any]) -> ToolExecutionResult:
+    return ToolExecutionResult(
+        call_id="call-1",
+        tool_name="search",
+        status=ToolExecutionStatus.SUCCESS,
+        structured_content=structured,
+    )
+
+
+def test_output_budget_uses_tool_budget_and_smallest_limit() -> None:
+    settings = ToolOutputSettings(
+        default_budget=ToolOutputBudget(max_bytes=1000, max_tokens=100),
+        tool_budgets={"search": ToolOutputBudget(max_tokens=1000)},
+    )
+
+    assert output_budget_bytes(settings, "other") == 400
+    assert output_budget_bytes(settings, "search") == 4000
+    assert output_budget_bytes(ToolOutputSettings(), "other") is None
+
+
+async def test_output_within_budget_is_unchanged() -> None:
+    text = json.dumps({"rows": [1, 2, 3]})
+    settings = ToolOutputSettings(default_budget=ToolOutputBudget(max_bytes=len(text)))
+
+    assert await limit_tool_output(text, _result({}), settings, session_id="conv-1") == text
+
+
+async def test_oversized_output_is_truncated_and_summarized() -> None:
+    structured = {"rows": list(range(1000)), "total": 1000}
+    text = json.dumps(structured)
+    settings = ToolOutputSettings(default_budget=ToolOutputBudget(max_bytes=50))
+
+    limited = await limit_tool_output(text, _result(structured), settings, session_id="conv-1")
+
+    assert limited.startswith(text[:50])
+    assert f"showing 50 of {len(text)} bytes" in limited
+    assert "object {rows: list[1000], total: int}" in limited
+    assert READ_TOOL_OUTPUT not in limited
+
+
+async def test_oversized_output_can_be_paged_from_artifacts(tmp_path: Path) -> None:
+    structured = {"rows": [f"row ñ {i}" for i in range(200)]}
+    text = json.dumps(structured, ensure_ascii=False)
+    settings = ToolOutputSettings(
+        default_budget=ToolOutputBudget(max_bytes=100),
+        artifacts_path=str(tmp_path),
+        page_bytes=999,
+    )
+
+    limited = await limit_tool_output(text, _result(structured), settings, session_id="conv/1")
+    head = limited[: limited.index("\n[")]
+    arguments = json.loads(limited[limited.index("with {") + 5 : -2])
+    assert arguments["offset"] == len(head.encode("utf-8"))
+
+    pages = [head]
+    offset: int | None = arguments["offset"]
+    while offset is not None:
+        record = await read_tool_output(
+            settings,
+            ToolInvocation(
+                tool_name=READ_TOOL_OUTPUT,
+                payload={**arguments, "offset": offset, "limit": 5000},
+                call_id=f"page-{offset}",
+            ),
+            session_id="conv/1",
+        )
+        page = record.response.structured_content
+        assert isinstance(page, dict)
+        assert len(page["content"].encode("utf-8")) <= 999
+        pages.append(page["content"])
+        offset = page["next_offset"]
+
+    assert "".join(pages) == text
+
+
+async def test_unknown_artifacts_are_reported_as_errors(tmp_path: Path) -> None:
+    settings = ToolOutputSettings(artifacts_path=str(tmp_path))
+
+    for artifact_id in ("missing", "../secrets"):
+        record = await read_tool_output(
+            settings,
+            ToolInvocation(
+                tool_name=READ_TOOL_OUTPUT, payload={"artifact_id": artifact_id}, call_id="c1"
+            ),
+            session_id=None,
+        )
+        assert record.response.status is ToolExecutionStatus.ERROR
+
+
+async def test_store_pages_end_on_character_boundaries(tmp_path: Path) -> None:
+    store = ToolOutputStore(tmp_path, ttl_seconds=60)
+    artifact_id = await store.save("ñññ", session_id=None)
+
+    page = await store.read(artifact_id, session_id=None, offset=0, limit=3)
+
+    assert page.content == "ñ"
+    assert page.next_offset == 2
+    assert page.total_bytes == 6
+
+
+async def test_artifacts_are_only_readable_by_their_session(tmp_path: Path) -> None:
+    store = ToolOutputStore(tmp_path, ttl_seconds=60)
+    first = await store.save("first", session_id="conv-1")
+    second = await store.save("second", session_id="conv-1")
+
+    assert first != second
+    assert await store.has_artifacts("conv-1")
+    assert not await store.has_artifacts("conv-2")
+    with pytest.raises(FileNotFoundError):
+        await store.read(first, session_id="conv-2", offset=0, limit=10)
+
+
+async def test_expired_artifacts_are_not_read_and_removed(tmp_path: Path) -> None:
+    store = ToolOutputStore(tmp_path, ttl_seconds=60)
+    expired = await store.save("old", session_id="conv-1")
+    for file in tmp_path.glob("*/*.txt"):
+        os.utime(file, (time.time() - 120, time.time() - 120))
+
+    assert not await store.has_artifacts("conv-1")
+    with pytest.raises(FileNotFoundError):
+        await store.read(expired, session_id="conv-1", offset=0, limit=10)
+
+    tool_outputs._cleanups.clear()
+    kept = await store.save("new", session_id="conv-2")
+
+    assert [file.stem for file in tmp_path.glob("*/*.txt")] == [kept]
+    assert len(list(tmp_path.iterdir())) == 1
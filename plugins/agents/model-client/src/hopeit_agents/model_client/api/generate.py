@@ -1,12 +1,15 @@
 """Generate completions using an OpenAI-compatible model endpoint."""
 
+from typing import Any
+
 from hopeit.app.api import event_api
 from hopeit.app.context import EventContext
 from hopeit.app.logger import app_extra_logger
 
-from hopeit_agents.model_client.client import AsyncModelClient, ModelClientError
+from hopeit_agents.model_client import registry
+from hopeit_agents.model_client.client import ModelClientError
 from hopeit_agents.model_client.models import CompletionRequest, CompletionResponse
-from hopeit_agents.model_client.settings import ModelClientSettings, merge_config
+from hopeit_agents.model_client.settings import SETTINGS_KEY, ModelClientSettings, merge_config
 
 __steps__ = ["generate"]
 
@@ -27,21 +30,17 @@ async def generate(
     payload: CompletionRequest, context: EventContext, *, model_client_settings_key: str = ""
 ) -> CompletionResponse:
     """Call the provider using defaults from settings and request overrides."""
-    settings = context.settings(
-        key=model_client_settings_key if model_client_settings_key else "model_client",
-        datatype=ModelClientSettings,
-    )
+    settings_key = model_client_settings_key if model_client_settings_key else SETTINGS_KEY
+    settings = context.settings(key=settings_key, datatype=ModelClientSettings)
 
     config = merge_config(settings, payload.config)
     api_key = settings.resolve_api_key(context.env)
 
-    client = AsyncModelClient(
-        base_url=settings.api_base,
-        api_key=api_key,
-        timeout_seconds=settings.timeout_seconds,
-        default_headers=settings.extra_headers,
-        deployment_name=settings.deployment_name,
-        api_version=settings.api_version,
+    client = registry.get_client(
+        f"{context.app_key}.{settings_key}",
+        settings,
+        api_key,
+        settings.resolve_endpoint_api_keys(context.env),
     )
 
     try:
@@ -52,9 +51,21 @@ async def generate(
         )
         raise
 
+    metrics_extra: dict[str, Any] = {}
+    if client.cache is not None:
+        cache_stats = client.cache.stats
+        metrics_extra.update(cache_hits=cache_stats.hits, cache_misses=cache_stats.misses)
+    endpoint_stats = client.balancer.stats()
+    if len(endpoint_stats) > 1:
+        metrics_extra["endpoints_selected"] = {
+            stats.url: stats.selected for stats in endpoint_stats
+        }
+        metrics_extra["endpoints_unhealthy"] = [
+            stats.url for stats in endpoint_stats if not stats.healthy
+        ]
     logger.info(
         context,
         "model_client_completion",
-        extra=extra(model=response.model, finish_reason=response.finish_reason),
+        extra=extra(model=response.model, finish_reason=response.finish_reason, **metrics_extra),
     )
     return response
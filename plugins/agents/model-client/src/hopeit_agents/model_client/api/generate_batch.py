@@ -0,0 +1,86 @@
+"""Generate a batch of independent completions using an OpenAI-compatible model endpoint.
+
+Completions run concurrently over the pooled connections of the model client, up to
+the configured concurrency. Results are returned in request order; failed items
+carry an error instead of failing the whole batch.
+"""
+
+from time import monotonic
+
+from hopeit.app.api import event_api
+from hopeit.app.context import EventContext
+from hopeit.app.logger import app_extra_logger
+
+from hopeit_agents.model_client import registry
+from hopeit_agents.model_client.client import ModelClientError
+from hopeit_agents.model_client.models import (
+    CompletionBatchItem,
+    CompletionBatchRequest,
+    CompletionBatchResponse,
+    CompletionError,
+)
+from hopeit_agents.model_client.settings import SETTINGS_KEY, ModelClientSettings, merge_config
+
+__steps__ = ["generate_batch"]
+
+__api__ = event_api(
+    summary="hopeit_agents model client generate batch",
+    query_args=[("model_client_settings_key", str | None)],
+    payload=(CompletionBatchRequest, "Completion requests and concurrency override"),
+    responses={
+        200: (CompletionBatchResponse, "Completion results in request order"),
+    },
+)
+
+logger, extra = app_extra_logger()
+
+
+async def generate_batch(
+    payload: CompletionBatchRequest, context: EventContext, *, model_client_settings_key: str = ""
+) -> CompletionBatchResponse:
+    """Run every completion request using defaults from settings and request overrides."""
+    settings_key = model_client_settings_key if model_client_settings_key else SETTINGS_KEY
+    settings = context.settings(key=settings_key, datatype=ModelClientSettings)
+
+    api_key = settings.resolve_api_key(context.env)
+    client = registry.get_client(
+        f"{context.app_key}.{settings_key}",
+        settings,
+        api_key,
+        settings.resolve_endpoint_api_keys(context.env),
+    )
+
+    max_concurrency = payload.max_concurrency or settings.batch.max_concurrency
+    started = monotonic()
+    results = await client.complete_batch(
+        [(request, merge_config(settings, request.config)) for request in payload.requests],
+        max_concurrency=max_concurrency,
+    )
+
+    items: list[CompletionBatchItem] = []
+    for index, result in enumerate(results):
+        if isinstance(result, ModelClientError):
+            items.append(
+                CompletionBatchItem(
+                    index=index,
+                    error=CompletionError(
+                        status=result.status,
+                        message=result.message,
+                        details=dict(result.details) if result.details else None,
+                    ),
+                )
+            )
+        else:
+            items.append(CompletionBatchItem(index=index, response=result))
+
+    logger.info(
+        context,
+        "model_client_batch",
+        extra=extra(
+            requests=len(items),
+            errors=sum(1 for item in items if item.error is not None),
+            max_concurrency=max_concurrency,
+            total_ms=round((monotonic() - started) * 1000.0, 3),
+        ),
+    )
+    return CompletionBatchResponse(items=items)
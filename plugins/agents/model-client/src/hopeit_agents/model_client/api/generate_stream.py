@@ -0,0 +1,78 @@
+"""Stream completions from an OpenAI-compatible model endpoint.
+
+Steps yield `CompletionChunk` items as they arrive from the provider: text deltas,
+tool calls as soon as their arguments are complete and a final chunk with the
+normalized completion response. When invoked through HTTP, the last chunk is returned.
+"""
+
+from time import monotonic
+
+from hopeit.app.api import event_api
+from hopeit.app.context import EventContext
+from hopeit.app.events import Spawn
+from hopeit.app.logger import app_extra_logger
+
+from hopeit_agents.model_client import registry
+from hopeit_agents.model_client.client import ModelClientError
+from hopeit_agents.model_client.models import (
+    CompletionChunk,
+    CompletionChunkType,
+    CompletionRequest,
+)
+from hopeit_agents.model_client.settings import SETTINGS_KEY, ModelClientSettings, merge_config
+
+__steps__ = ["generate_stream"]
+
+__api__ = event_api(
+    summary="hopeit_agents model client generate stream",
+    query_args=[("model_client_settings_key", str | None)],
+    payload=(CompletionRequest, "Conversation and overrides"),
+    responses={
+        200: (CompletionChunk, "Final chunk including the completion result"),
+        500: (str, "Provider error"),
+    },
+)
+
+logger, extra = app_extra_logger()
+
+
+async def generate_stream(
+    payload: CompletionRequest, context: EventContext, *, model_client_settings_key: str = ""
+) -> Spawn[CompletionChunk]:
+    """Stream completion chunks using defaults from settings and request overrides."""
+    settings_key = model_client_settings_key if model_client_settings_key else SETTINGS_KEY
+    settings = context.settings(key=settings_key, datatype=ModelClientSettings)
+
+    config = merge_config(settings, payload.config)
+    api_key = settings.resolve_api_key(context.env)
+
+    client = registry.get_client(
+        f"{context.app_key}.{settings_key}",
+        settings,
+        api_key,
+        settings.resolve_endpoint_api_keys(context.env),
+    )
+
+    started = monotonic()
+    first_chunk_ms: float | None = None
+    try:
+        async for chunk in client.complete_stream(payload, config):
+            if first_chunk_ms is None:
+                first_chunk_ms = round((monotonic() - started) * 1000.0, 3)
+            if chunk.type is CompletionChunkType.DONE and chunk.response is not None:
+                logger.info(
+                    context,
+                    "model_client_completion",
+                    extra=extra(
+                        model=chunk.response.model,
+                        finish_reason=chunk.response.finish_reason,
+                        first_chunk_ms=first_chunk_ms,
+                        total_ms=round((monotonic() - started) * 1000.0, 3),
+                    ),
+                )
+            yield chunk
+    except ModelClientError as exc:
+        logger.error(
+            context, "model_client_error", extra=extra(status=exc.status, details=exc.details)
+        )
+        raise
@@ -0,0 +1,145 @@
+"""Latency-aware routing of completion requests across equivalent model endpoints.
+
+Each request is sent to the available endpoint with the lowest score, computed as
+the exponentially weighted moving average (EWMA) of its latency multiplied by the
+number of requests in flight to it plus one. Endpoints not yet used score zero, so
+every endpoint is tried early. Failed requests count at least twice the average
+latency of the slowest other endpoint, so an endpoint failing fast does not attract
+more traffic than the healthy ones. An endpoint failing repeatedly is ejected by its
+circuit breaker and receives a single probe request once the reset timeout elapses.
+"""
+
+from hopeit.dataobjects import dataclass, dataobject
+
+from hopeit_agents.model_client.resilience import CircuitBreaker
+from hopeit_agents.model_client.settings import CircuitBreakerSettings, LoadBalancingSettings
+
+__all__ = ["EndpointStats", "LoadBalancer", "ModelEndpoint"]
+
+# Failed requests count at least this factor of the slowest other endpoint latency
+_FAILURE_PENALTY = 2.0
+
+
+@dataobject
+@dataclass
+class ModelEndpoint:
+    """Resolved chat completions URL and credentials of a model deployment."""
+
+    url: str
+    api_key: str | None = None
+
+
+@dataobject
+@dataclass
+class EndpointStats:
+    """Routing metrics of a single endpoint."""
+
+    url: str
+    selected: int
+    failures: int
+    in_flight: int
+    ewma_latency_ms: float | None
+    healthy: bool
+
+
+class _EndpointState:
+    def __init__(
+        self, endpoint: ModelEndpoint, circuit_breaker: CircuitBreakerSettings | None
+    ) -> None:
+        self.endpoint = endpoint
+        self.circuit_breaker = (
+            CircuitBreaker(circuit_breaker)
+            if circuit_breaker is not None and circuit_breaker.failure_threshold > 0
+            else None
+        )
+        self.ewma_latency_ms: float | None = None
+        self.in_flight = 0
+        self.selected = 0
+        self.failures = 0
+
+    def score(self) -> tuple[float, int, int]:
+        return ((self.ewma_latency_ms or 0.0) * (self.in_flight + 1), self.in_flight, self.selected)
+
+
+class LoadBalancer:
+    """Select endpoints by EWMA latency and in-flight requests, tracking their health."""
+
+    def __init__(
+        self,
+        endpoints: list[ModelEndpoint],
+        settings: LoadBalancingSettings | None = None,
+        circuit_breaker: CircuitBreakerSettings | None = None,
+    ) -> None:
+        if not endpoints:
+            raise ValueError("At least one model endpoint is required")
+        self._ewma_alpha = (settings or LoadBalancingSettings()).ewma_alpha
+        self._states = [_EndpointState(endpoint, circuit_breaker) for endpoint in endpoints]
+        self._by_url = {state.endpoint.url: state for state in self._states}
+
+    @property
+    def primary(self) -> ModelEndpoint:
+        """First configured endpoint, identifying the deployment group."""
+        return self._states[0].endpoint
+
+    def select(self) -> ModelEndpoint | None:
+        """Return the best available endpoint and count the request as in flight.
+
+        Every selected request must end with `record` or `release`. Returns None when
+        every endpoint is ejected by its circuit breaker.
+        """
+        for state in sorted(self._states, key=_EndpointState.score):
+            if state.circuit_breaker is None or state.circuit_breaker.allow_request():
+                state.selected += 1
+                state.in_flight += 1
+                return state.endpoint
+        return None
+
+    def record(self, endpoint: ModelEndpoint, *, latency_ms: float, failed: bool) -> None:
+        """Record the outcome of a request sent to `endpoint`.
+
+        `failed` should only be set for transient failures that indicate the endpoint
+        is degraded, not for invalid requests.
+        """
+        state = self._by_url[endpoint.url]
+        state.in_flight = max(0, state.in_flight - 1)
+        if failed:
+            slowest = max(
+                (other.ewma_latency_ms or 0.0 for other in self._states if other is not state),
+                default=0.0,
+            )
+            latency_ms = max(latency_ms, _FAILURE_PENALTY * slowest)
+        if state.ewma_latency_ms is None:
+            state.ewma_latency_ms = latency_ms
+        else:
+            state.ewma_latency_ms += self._ewma_alpha * (latency_ms - state.ewma_latency_ms)
+        if failed:
+            state.failures += 1
+            if state.circuit_breaker is not None:
+                state.circuit_breaker.record_failure()
+        elif state.circuit_breaker is not None:
+            state.circuit_breaker.record_success()
+
+    def release(self, endpoint: ModelEndpoint) -> None:
+        """Release a request to `endpoint` abandoned before its outcome was known.
+
+        The request no longer counts as in flight, and when it was the circuit breaker
+        probe a new probe is allowed.
+        """
+        state = self._by_url[endpoint.url]
+        state.in_flight = max(0, state.in_flight - 1)
+        if state.circuit_breaker is not None:
+            state.circuit_breaker.release_probe()
+
+    def stats(self) -> list[EndpointStats]:
+        """Return routing metrics of every endpoint."""
+        return [
+            EndpointStats(
+                url=state.endpoint.url,
+                selected=state.selected,
+                failures=state.failures,
+                in_flight=state.in_flight,
+                ewma_latency_ms=state.ewma_latency_ms,
+                healthy=state.circuit_breaker is None or not state.circuit_breaker.is_open,
+            )
+            for state in self._states
+        ]
@@ -0,0 +1,137 @@
+"""Deterministic cache of provider completion responses.
+
+Responses are keyed by a canonical hash of the endpoint URL and the request payload
+sent to the provider, so identical requests (same model, messages, tools and
+parameters) are served without calling the provider again. The raw provider
+response is cached and normalized again on every hit, which makes cached results
+indistinguishable from live calls for the requesting conversation.
+"""
+
+import asyncio
+import hashlib
+import json
+import uuid
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from time import monotonic, time
+from typing import Any
+
+from hopeit.dataobjects import dataclass, dataobject
+
+from hopeit_agents.model_client.settings import CompletionCacheSettings
+
+__all__ = ["CompletionCache", "CompletionCacheStats", "cache_key"]
+
+
+@dataobject
+@dataclass
+class CompletionCacheStats:
+    """Hit and miss counters of a completion cache."""
+
+    hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    stores: int = 0
+    evictions: int = 0
+    entries: int = 0
+
+
+def cache_key(url: str, payload: Mapping[str, Any]) -> str:
+    """Return the canonical hash identifying a provider request."""
+    canonical_json = json.dumps(
+        {"url": url, "payload": payload},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    """In-memory LRU cache with TTL and an optional on-disk tier."""
+
+    def __init__(self, settings: CompletionCacheSettings) -> None:
+        self._max_entries = settings.max_entries
+        self._ttl_seconds = settings.ttl_seconds
+        self._disk_path = Path(settings.disk_path) if settings.disk_path else None
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._stats = CompletionCacheStats()
+
+    @property
+    def stats(self) -> CompletionCacheStats:
+        """Return a snapshot of cache counters."""
+        return CompletionCacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            memory_hits=self._stats.memory_hits,
+            disk_hits=self._stats.disk_hits,
+            stores=self._stats.stores,
+            evictions=self._stats.evictions,
+            entries=len(self._entries),
+        )
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached provider response for `key` if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, response = entry
+            if monotonic() - stored_at < self._ttl_seconds:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                self._stats.memory_hits += 1
+                return response
+            del self._entries[key]
+
+        if self._disk_path is not None:
+            stored = await asyncio.to_thread(self._read_disk, key)
+            if stored is not None:
+                self._remember(key, stored)
+                self._stats.hits += 1
+                self._stats.disk_hits += 1
+                return stored
+
+        self._stats.misses += 1
+        return None
+
+    async def put(self, key: str, response: Mapping[str, Any]) -> None:
+        """Store a successful provider response."""
+        data = dict(response)
+        self._remember(key, data)
+        self._stats.stores += 1
+        if self._disk_path is not None:
+            await asyncio.to_thread(self._write_disk, key, data)
+
+    def _remember(self, key: str, response: dict[str, Any]) -> None:
+        self._entries[key] = (monotonic(), response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def _disk_file(self, key: str) -> Path:
+        assert self._disk_path is not None
+        return self._disk_path / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> dict[str, Any] | None:
+        path = self._disk_file(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if time() - float(entry.get("stored_at", 0.0)) >= self._ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        response = entry.get("response")
+        return response if isinstance(response, dict) else None
+
+    def _write_disk(self, key: str, response: dict[str, Any]) -> None:
+        path = self._disk_file(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(
+            json.dumps({"stored_at": time(), "response": response}), encoding="utf-8"
+        )
+        tmp_path.replace(path)
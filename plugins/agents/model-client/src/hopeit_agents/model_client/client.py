@@ -1,19 +1,30 @@
 """Async client to call OpenAI-compatible chat completion endpoints."""
 
-from collections.abc import Mapping
+import asyncio
+import json
+from collections.abc import AsyncIterator, Iterable, Mapping
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from time import monotonic
+from types import TracebackType
 from typing import Any
+from urllib.parse import urlsplit
 
 import aiohttp
 from aiohttp import ClientError, ClientResponse
 
+from hopeit_agents.model_client.balancer import LoadBalancer, ModelEndpoint
+from hopeit_agents.model_client.cache import CompletionCache, cache_key
 from hopeit_agents.model_client.models import (
+    CompletionChunk,
+    CompletionChunkType,
     CompletionConfig,
     CompletionRequest,
     CompletionResponse,
     Conversation,
     Message,
+    Role,
     ToolCall,
     Usage,
     message_from_openai_dict,
@@ -21,6 +32,17 @@ from hopeit_agents.model_client.models import (
     messages_from_tool_calls,
     tool_call_from_openai_dict,
 )
+from hopeit_agents.model_client.rate_limit import RateLimiter, estimate_tokens
+from hopeit_agents.model_client.resilience import backoff_delay, parse_retry_after
+from hopeit_agents.model_client.settings import (
+    CircuitBreakerSettings,
+    ConnectionPoolSettings,
+    LoadBalancingSettings,
+    RetrySettings,
+)
+from hopeit_agents.model_client.tool_specs import openai_tools_spec
+
+_DEFAULT_RETRY = RetrySettings()
 
 
 @dataclass
@@ -35,8 +57,22 @@ class ModelClientError(RuntimeError):
         return f"ModelClientError(status={self.status}, message={self.message})"
 
 
+# Keeps a reference to close tasks of retired clients until they finish
+_closing: set[asyncio.Task[None]] = set()
+
+
 class AsyncModelClient:
-    """Minimal OpenAI-compatible async client."""
+    """Minimal OpenAI-compatible async client.
+
+    HTTP connections are kept in a pooled session that is created on first use and
+    reused by subsequent completions until `close()` is called. When a `CompletionCache`
+    is provided, non-streaming completions with an identical provider payload are
+    served from the cache. When a `RateLimiter` is provided, requests wait for
+    available budget before being sent to the provider. Transient provider errors are
+    retried according to `retry` settings, and a circuit breaker per endpoint fails
+    fast while the provider keeps failing. When additional `endpoints` serving the same
+    model are given, each attempt is routed by a latency-aware `LoadBalancer`.
+    """
 
     def __init__(
         self,
@@ -47,22 +83,126 @@ class AsyncModelClient:
         api_key: str | None,
         timeout_seconds: float,
         default_headers: Mapping[str, str] | None = None,
+        connection_pool: ConnectionPoolSettings | None = None,
+        cache: CompletionCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetrySettings | None = None,
+        circuit_breaker: CircuitBreakerSettings | None = None,
+        endpoints: list[ModelEndpoint] | None = None,
+        load_balancing: LoadBalancingSettings | None = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
-        self._api_key = api_key
         self._timeout_seconds = timeout_seconds
         self._default_headers = dict(default_headers or {})
         self._api_version = api_version
         self._deployment_name = deployment_name
+        self._connection_pool = connection_pool or ConnectionPoolSettings()
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        self._active_requests = 0
+        self._retired = False
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._retry = retry
+        self._balancer = LoadBalancer(
+            [ModelEndpoint(url=self._build_url(), api_key=api_key), *(endpoints or [])],
+            load_balancing,
+            circuit_breaker,
+        )
+
+    @property
+    def cache(self) -> CompletionCache | None:
+        """Completion cache used by this client, if enabled."""
+        return self._cache
+
+    @property
+    def balancer(self) -> LoadBalancer:
+        """Endpoint selection and routing metrics of this client."""
+        return self._balancer
+
+    async def __aenter__(self) -> "AsyncModelClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it on first use or when the loop changed."""
+        loop = asyncio.get_running_loop()
+        session = self._session
+        if session is None or session.closed or self._session_loop is not loop:
+            pool = self._connection_pool
+            connector = aiohttp.TCPConnector(
+                limit=pool.limit,
+                limit_per_host=pool.limit_per_host,
+                keepalive_timeout=pool.keepalive_timeout_seconds,
+                use_dns_cache=pool.dns_cache_ttl_seconds is not None,
+                ttl_dns_cache=pool.dns_cache_ttl_seconds,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self._timeout_seconds),
+            )
+            self._session = session
+            self._session_loop = loop
+        return session
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session releasing all open connections."""
+        session, self._session = self._session, None
+        loop, self._session_loop = self._session_loop, None
+        if session is None or session.closed:
+            return
+        if loop is asyncio.get_running_loop():
+            await session.close()
+
+    @property
+    def drained(self) -> bool:
+        """Whether the client was retired and has no requests in flight."""
+        return self._retired and self._active_requests == 0
+
+    def retire(self) -> None:
+        """Close the pooled session once the requests in flight finish.
+
+        Used when the client is replaced: no new requests are expected, and the
+        session is closed right away when the client is idle.
+        """
+        self._retired = True
+        if self._active_requests == 0:
+            self._close_when_retired()
+
+    @asynccontextmanager
+    async def _track_request(self) -> AsyncIterator[None]:
+        """Count a request in flight, closing a retired client after its last request."""
+        self._active_requests += 1
+        try:
+            yield
+        finally:
+            self._active_requests -= 1
+            if self.drained:
+                self._close_when_retired()
+
+    def _close_when_retired(self) -> None:
+        session = self._session
+        if session is None or session.closed:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if loop is self._session_loop:
+            task = loop.create_task(self.close())
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
 
     def _build_url(self) -> str:
         """Return the chat completions endpoint URL including optional deployment params."""
-        url = f"{self._base_url.strip('/')}/chat/completions"
-        if self._deployment_name:
-            url = url.replace("{DEPLOYMENT_NAME}", self._deployment_name)
-        if self._api_version:
-            url = url + f"?api-version={self._api_version}"
-        return url
+        return build_url(self._base_url, self._deployment_name, self._api_version)
 
     async def complete(
         self,
@@ -70,30 +210,286 @@ class AsyncModelClient:
         config: CompletionConfig,
     ) -> CompletionResponse:
         """Execute a completion call and normalize the response."""
+        async with self._track_request():
+            return await self._complete(request, config)
+
+    async def _complete(
+        self,
+        request: CompletionRequest,
+        config: CompletionConfig,
+    ) -> CompletionResponse:
         payload = self._build_payload(request.conversation, config)
-        headers = self._build_headers()
-        url = self._build_url()
-        timeout = aiohttp.ClientTimeout(total=self._timeout_seconds)
-        print()
-        print("URL", url)
-        print()
-
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(url, json=payload, headers=headers) as response:
-                print()
-                print("REQUEST", request)
-                print()
-                print("RESPONSE", await response.text())
-                print()
-
-                return await self._parse_response(request.conversation, response, config)
-
-    def _build_headers(self) -> Mapping[str, str]:
+
+        cache, key = self._cache, ""
+        if cache is not None:
+            key = cache_key(self._balancer.primary.url, payload)
+            cached = await cache.get(key)
+            if cached is not None:
+                return self._normalize_response(request.conversation, 200, cached, config)
+
+        estimated_tokens = self._estimate_tokens(payload)
+        async with self._post(payload, estimated_tokens) as response:
+            response_payload = await self._read_json(response)
+            completion = self._normalize_response(
+                request.conversation, response.status, response_payload, config
+            )
+        self._reconcile_budget(estimated_tokens, completion)
+
+        if cache is not None:
+            await cache.put(key, response_payload)
+        return completion
+
+    async def complete_stream(
+        self,
+        request: CompletionRequest,
+        config: CompletionConfig,
+    ) -> AsyncIterator[CompletionChunk]:
+        """Execute a streaming completion yielding content deltas and assembled tool calls.
+
+        Tool calls are yielded as soon as all their argument fragments were received,
+        that is when the provider starts streaming the next tool call or finishes the
+        choice. The last chunk carries the normalized `CompletionResponse`.
+        """
+        async with self._track_request():
+            async for chunk in self._complete_stream(request, config):
+                yield chunk
+
+    async def _complete_stream(
+        self,
+        request: CompletionRequest,
+        config: CompletionConfig,
+    ) -> AsyncIterator[CompletionChunk]:
+        payload = self._build_payload(request.conversation, config)
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
+
+        estimated_tokens = self._estimate_tokens(payload)
+        async with self._post(payload, estimated_tokens) as response:
+            assembler = _StreamAssembler(config)
+            async for event in _read_sse_events(response):
+                for chunk in assembler.feed(event):
+                    yield chunk
+            for chunk in assembler.finish():
+                yield chunk
+
+        completion = self._completion_response(
+            request.conversation,
+            assembler.metadata,
+            message=Message(role=Role.ASSISTANT, content="".join(assembler.content_parts)),
+            tool_calls=assembler.tool_calls,
+            finish_reason=assembler.finish_reason,
+            config=config,
+        )
+        self._reconcile_budget(estimated_tokens, completion)
+        yield CompletionChunk(type=CompletionChunkType.DONE, response=completion)
+
+    async def complete_batch(
+        self,
+        requests: list[tuple[CompletionRequest, CompletionConfig]],
+        *,
+        max_concurrency: int,
+    ) -> list[CompletionResponse | ModelClientError]:
+        """Execute independent completions concurrently, returning results in request order.
+
+        At most `max_concurrency` completions are in flight at the same time, sharing the
+        pooled HTTP session. Failed completions are returned as `ModelClientError`
+        instead of being raised.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(
+            request: CompletionRequest, config: CompletionConfig
+        ) -> CompletionResponse | ModelClientError:
+            async with semaphore:
+                try:
+                    return await self.complete(request, config)
+                except ModelClientError as exc:
+                    return exc
+
+        return list(await asyncio.gather(*(run(request, config) for request, config in requests)))
+
+    def to_batch_jsonl(self, requests: list[tuple[CompletionRequest, CompletionConfig]]) -> str:
+        """Render completions as an OpenAI Batch API input file (JSON lines).
+
+        Each line is identified by `custom_id` `request-<index>`, so results can be
+        matched back with `from_batch_jsonl`, and targets the path of the configured
+        chat completions endpoint.
+        """
+        endpoint = urlsplit(self._balancer.primary.url)
+        url = f"{endpoint.path}?{endpoint.query}" if endpoint.query else endpoint.path
+        return "".join(
+            json.dumps(
+                {
+                    "custom_id": f"request-{index}",
+                    "method": "POST",
+                    "url": url,
+                    "body": self._build_payload(request.conversation, config),
+                }
+            )
+            + "\n"
+            for index, (request, config) in enumerate(requests)
+        )
+
+    def from_batch_jsonl(
+        self,
+        requests: list[tuple[CompletionRequest, CompletionConfig]],
+        lines: Iterable[str],
+    ) -> list[CompletionResponse | ModelClientError]:
+        """Map an OpenAI Batch API output file to results in request order.
+
+        `requests` must be the same list used to create the input file with
+        `to_batch_jsonl`. Requests without a result line are returned as errors. Lines
+        that are not valid JSON or have an unknown `custom_id` cannot be matched to a
+        request, and are reported as errors after the request results.
+        """
+        results: list[CompletionResponse | ModelClientError] = [
+            ModelClientError(status=404, message="Missing batch result") for _ in requests
+        ]
+        invalid_lines: list[CompletionResponse | ModelClientError] = []
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+                custom_id = str(item.get("custom_id", ""))
+            except (AttributeError, ValueError):
+                invalid_lines.append(
+                    ModelClientError(
+                        status=400,
+                        message="Invalid batch result line",
+                        details={"line": line_number},
+                    )
+                )
+                continue
+            index_text = custom_id.removeprefix("request-")
+            if (
+                index_text == custom_id
+                or not index_text.isdecimal()
+                or int(index_text) >= len(requests)
+            ):
+                invalid_lines.append(
+                    ModelClientError(
+                        status=400,
+                        message="Unknown batch result custom_id",
+                        details={"line": line_number, "custom_id": custom_id},
+                    )
+                )
+                continue
+            index = int(index_text)
+            request, config = requests[index]
+            response = item.get("response") or {}
+            if item.get("error") or not response:
+                error = item.get("error") or {}
+                results[index] = ModelClientError(
+                    status=500, message=error.get("message") or "Batch request failed", details=item
+                )
+                continue
+            try:
+                results[index] = self._normalize_response(
+                    request.conversation,
+                    int(response.get("status_code", 200)),
+                    response.get("body"),
+                    config,
+                )
+            except ModelClientError as exc:
+                results[index] = exc
+        return results + invalid_lines
+
+    @asynccontextmanager
+    async def _post(
+        self, payload: Mapping[str, Any], estimated_tokens: int
+    ) -> AsyncIterator[ClientResponse]:
+        """Send the request retrying transient failures, yielding a successful response.
+
+        Each attempt waits for rate limit budget, taking `estimated_tokens`, and is
+        routed to the endpoint selected by the load balancer. Error
+        responses are released and raised as `ModelClientError`. The request counts as
+        in flight to the endpoint until the response body was consumed, and is released
+        from the balancer when cancelled or failing with an unexpected error.
+        """
+        attempt = 1
+        while True:
+            await self._acquire_budget(estimated_tokens)
+            endpoint = self._balancer.select()
+            if endpoint is None:
+                raise ModelClientError(
+                    status=503,
+                    message="Model endpoint circuit breaker is open",
+                    details={"endpoints": [stats.url for stats in self._balancer.stats()]},
+                )
+            retry_after: float | None = None
+            started = monotonic()
+            outcome: tuple[float, bool] | None = None
+            try:
+                try:
+                    response = await self._get_session().post(
+                        endpoint.url, json=payload, headers=self._build_headers(endpoint.api_key)
+                    )
+                except (ClientError, TimeoutError) as exc:
+                    error = ModelClientError(
+                        status=503,
+                        message="Model provider unreachable",
+                        details={"url": endpoint.url, "error": repr(exc)},
+                    )
+                    error.__cause__ = exc
+                else:
+                    # Latency to response headers, a streamed body would skew the average
+                    latency_ms = (monotonic() - started) * 1000.0
+                    if response.status < 400:
+                        async with response:
+                            yield response
+                        outcome = (latency_ms, False)
+                        return
+                    async with response:
+                        error = self._provider_error(
+                            response.status, await self._read_json(response)
+                        )
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+                retryable = error.status in (self._retry or _DEFAULT_RETRY).retryable_statuses
+                outcome = ((monotonic() - started) * 1000.0, retryable)
+            finally:
+                if outcome is None:
+                    self._balancer.release(endpoint)
+                else:
+                    self._balancer.record(endpoint, latency_ms=outcome[0], failed=outcome[1])
+
+            retry = self._retry
+            if retry is None or not retryable or attempt >= retry.max_attempts:
+                raise error
+            if retry_after is not None and retry_after > retry.max_backoff_seconds:
+                raise error
+            await asyncio.sleep(backoff_delay(retry, attempt, retry_after))
+            attempt += 1
+
+    def _estimate_tokens(self, payload: Mapping[str, Any]) -> int:
+        """Return the estimated token cost of the request, 0 without a rate limiter."""
+        return 0 if self._rate_limiter is None else estimate_tokens(payload)
+
+    async def _acquire_budget(self, estimated_tokens: int) -> None:
+        """Wait for rate limit budget to send a request costing `estimated_tokens`."""
+        if self._rate_limiter is None:
+            return
+        try:
+            await self._rate_limiter.acquire(estimated_tokens)
+        except TimeoutError as exc:
+            raise ModelClientError(
+                status=429,
+                message="Client rate limit budget exhausted",
+                details={"estimated_tokens": estimated_tokens},
+            ) from exc
+
+    def _reconcile_budget(self, estimated_tokens: int, completion: CompletionResponse) -> None:
+        """Replace the estimated token cost with the usage reported by the provider."""
+        if self._rate_limiter is not None and completion.usage is not None:
+            self._rate_limiter.reconcile(estimated_tokens, completion.usage.total_tokens)
+
+    def _build_headers(self, api_key: str | None) -> Mapping[str, str]:
         """Compose the HTTP headers required by the target provider."""
         headers = {"Content-Type": "application/json"}
-        if self._api_key:
-            headers["api-key"] = self._api_key
-            headers["Authorization"] = f"Bearer {self._api_key}"
+        if api_key:
+            headers["api-key"] = api_key
+            headers["Authorization"] = f"Bearer {api_key}"
         headers.update(self._default_headers)
         return headers
 
@@ -117,9 +513,7 @@ class AsyncModelClient:
             body["response_format"] = config.response_format
 
         # Tools payload (OpenAI requires tools to be present)
-        tools_spec: list[dict[str, Any]] = []
-        for tool in config.available_tools or []:
-            tools_spec.append(tool.to_openai_dict())
+        tools_spec = openai_tools_spec(config.available_tools or [])
 
         if tools_spec:
             body["tools"] = tools_spec
@@ -133,29 +527,44 @@ class AsyncModelClient:
 
         return body
 
-    async def _parse_response(
+    @staticmethod
+    async def _read_json(response: ClientResponse) -> Any:
+        """Return the decoded JSON body of the provider response.
+
+        Error responses without a JSON body (i.e. gateway error pages) return None
+        so the original status is preserved.
+        """
+        try:
+            return await response.json()
+        except (ClientError, ValueError) as exc:
+            if response.status >= 400:
+                return None
+            raise ModelClientError(status=500, message="Invalid JSON response") from exc
+
+    @staticmethod
+    def _provider_error(status: int, payload: Any) -> ModelClientError:
+        """Map an error payload returned by the provider into a ModelClientError."""
+        message = payload.get("error", {}).get("message") if isinstance(payload, dict) else None
+        return ModelClientError(
+            status=status,
+            message=message or "Model provider returned an error",
+            details=payload if isinstance(payload, Mapping) else None,
+        )
+
+    def _normalize_response(
         self,
         conversation: Conversation,
-        response: ClientResponse,
+        status: int,
+        payload: Any,
         config: CompletionConfig,
     ) -> CompletionResponse:
-        """Validate the HTTP response and map it to internal completion objects."""
-        try:
-            payload = await response.json()
-        except ClientError as exc:  # pragma: no cover - network issues mapped once
-            raise ModelClientError(status=500, message="Invalid JSON response") from exc
-
-        if response.status >= 400:
-            message = payload.get("error", {}).get("message") if isinstance(payload, dict) else None
-            raise ModelClientError(
-                status=response.status,
-                message=message or "Model provider returned an error",
-                details=payload if isinstance(payload, Mapping) else None,
-            )
+        """Validate the provider response payload and map it to internal completion objects."""
+        if status >= 400:
+            raise self._provider_error(status, payload)
 
         if not isinstance(payload, Mapping):
             raise ModelClientError(
-                status=response.status,
+                status=status,
                 message="Unexpected response payload type",
                 details={"payload": payload},
             )
@@ -163,20 +572,18 @@ class AsyncModelClient:
         choices = payload.get("choices")
         if not choices:
             raise ModelClientError(
-                status=response.status,
+                status=status,
                 message="Missing choices in completion response",
                 details=payload,
             )
 
         used_choice = {}
         message = Message.empty()
-        updated_conversation = conversation
         for choice in choices:
             message_data = choice.get("message", {})
             message = message_from_openai_dict(message_data)
             used_choice = choice
             if message.content:
-                updated_conversation = updated_conversation.with_message(message)
                 break
 
         tool_calls_raw = message_data.get("tool_calls") or []
@@ -187,6 +594,31 @@ class AsyncModelClient:
                 for item in tool_calls_raw
                 if isinstance(item, dict)
             ]
+
+        return self._completion_response(
+            conversation,
+            payload,
+            message=message,
+            tool_calls=tool_calls,
+            finish_reason=used_choice.get("finish_reason"),
+            config=config,
+        )
+
+    @staticmethod
+    def _completion_response(
+        conversation: Conversation,
+        payload: Mapping[str, Any],
+        *,
+        message: Message,
+        tool_calls: list[ToolCall],
+        finish_reason: str | None,
+        config: CompletionConfig,
+    ) -> CompletionResponse:
+        """Append the assistant turn to the conversation and build the normalized response."""
+        updated_conversation = conversation
+        if message.content:
+            updated_conversation = updated_conversation.with_message(message)
+        if tool_calls:
             for tool_call_msg in messages_from_tool_calls(tool_calls):
                 updated_conversation = updated_conversation.with_message(tool_call_msg)
 
@@ -214,5 +646,108 @@ class AsyncModelClient:
             tool_calls=tool_calls,
             conversation=updated_conversation,
             usage=usage,
-            finish_reason=used_choice.get("finish_reason"),
+            finish_reason=finish_reason,
         )
+
+
+def build_url(base_url: str, deployment_name: str | None, api_version: str | None) -> str:
+    """Return the chat completions endpoint URL including optional deployment params."""
+    url = f"{base_url.strip('/')}/chat/completions"
+    if deployment_name:
+        url = url.replace("{DEPLOYMENT_NAME}", deployment_name)
+    if api_version:
+        url = url + f"?api-version={api_version}"
+    return url
+
+
+class _StreamAssembler:
+    """Accumulate streamed deltas into content and complete tool calls."""
+
+    def __init__(self, config: CompletionConfig) -> None:
+        self.metadata: dict[str, Any] = {}
+        self.content_parts: list[str] = []
+        self.tool_calls: list[ToolCall] = []
+        self.finish_reason: str | None = None
+        self._available_tools = config.available_tools
+        self._pending: dict[int, dict[str, Any]] = {}
+
+    def feed(self, event: Mapping[str, Any]) -> list[CompletionChunk]:
+        """Process a stream event returning the chunks it completes."""
+        if "error" in event:
+            raise AsyncModelClient._provider_error(500, event)
+        for key in ("id", "model", "created"):
+            if key in event:
+                self.metadata.setdefault(key, event[key])
+        if isinstance(event.get("usage"), Mapping):
+            self.metadata["usage"] = event["usage"]
+
+        chunks: list[CompletionChunk] = []
+        for choice in event.get("choices") or []:
+            if choice.get("index", 0) != 0:
+                continue
+            delta = choice.get("delta") or {}
+            content = delta.get("content")
+            if content:
+                self.content_parts.append(content)
+                chunks.append(CompletionChunk(type=CompletionChunkType.CONTENT, content=content))
+            for fragment in delta.get("tool_calls") or []:
+                index = int(fragment.get("index", 0))
+                # Providers stream tool calls in order: a new index completes previous ones
+                chunks.extend(self._complete_tool_calls(before=index))
+                pending = self._pending.setdefault(index, {"id": "", "name": [], "arguments": []})
+                if fragment.get("id"):
+                    pending["id"] = fragment["id"]
+                function = fragment.get("function") or {}
+                if function.get("name"):
+                    pending["name"].append(function["name"])
+                if function.get("arguments"):
+                    pending["arguments"].append(function["arguments"])
+            if choice.get("finish_reason"):
+                self.finish_reason = choice["finish_reason"]
+                chunks.extend(self._complete_tool_calls())
+        return chunks
+
+    def finish(self) -> list[CompletionChunk]:
+        """Complete tool calls still pending when the stream ends."""
+        return self._complete_tool_calls()
+
+    def _complete_tool_calls(self, before: int | None = None) -> list[CompletionChunk]:
+        chunks: list[CompletionChunk] = []
+        for index in sorted(self._pending):
+            if before is not None and index >= before:
+                break
+            pending = self._pending.pop(index)
+            tool_call = tool_call_from_openai_dict(
+                {
+                    "id": pending["id"],
+                    "type": "function",
+                    "function": {
+                        "name": "".join(pending["name"]),
+                        "arguments": "".join(pending["arguments"]),
+                    },
+                },
+                self._available_tools,
+            )
+            self.tool_calls.append(tool_call)
+            chunks.append(CompletionChunk(type=CompletionChunkType.TOOL_CALL, tool_call=tool_call))
+        return chunks
+
+
+async def _read_sse_events(response: ClientResponse) -> AsyncIterator[dict[str, Any]]:
+    """Yield decoded JSON `data` payloads from a `text/event-stream` response."""
+    data_lines: list[str] = []
+    async for raw_line in response.content:
+        line = raw_line.decode("utf-8").rstrip("\r\n")
+        if line.startswith("data:"):
+            data_lines.append(line[5:].removeprefix(" "))
+        if line or not data_lines:
+            continue
+        data, data_lines = "\n".join(data_lines), []
+        if data == "[DONE]":
+            return
+        try:
+            yield json.loads(data)
+        except json.JSONDecodeError as exc:
+            raise ModelClientError(
+                status=500, message="Invalid stream event", details={"data": data}
+            ) from exc
@@ -2,13 +2,16 @@
 
 import json
 import uuid
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import UTC, datetime
 from enum import StrEnum
-from typing import Any
+from typing import Annotated, Any, overload
 
 from hopeit.dataobjects import dataclass, dataobject, field
 from hopeit.dataobjects.payload import Payload
 from hopeit.server.names import spinalcase
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
 
 from hopeit_agents.mcp_client.models import ToolDescriptor
 from hopeit_agents.skills.api import SkillEventInfo
@@ -23,6 +26,10 @@ class Role(StrEnum):
     TOOL = "tool"
 
 
+# Instance attribute holding the memoized OpenAI-compatible form of a Message
+_OPENAI_DICT_ATTR = "_openai_dict"
+
+
 @dataobject
 @dataclass
 class ToolSpec:
@@ -74,19 +81,116 @@ class Message:
     tool_calls: list[ToolCall] | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Assigning a field drops the serialized form memoized by `message_to_openai_dict`
+        self.__dict__.pop(_OPENAI_DICT_ATTR, None)
+        super().__setattr__(name, value)
+
     @classmethod
     def empty(cls) -> "Message":
         """Return a placeholder system message used for initialisation."""
         return cls(role=Role.SYSTEM, content="")
 
 
+class MessageHistory(Sequence[Message]):
+    """Append-only sequence of messages sharing storage between snapshots.
+
+    Each snapshot is a view over the first `len(snapshot)` items of a backing list.
+    Appending to the latest snapshot extends the shared list in place and returns a
+    new, longer view, so building a conversation message by message takes O(1) per
+    message and older snapshots reuse the same list. Appending to an older snapshot
+    copies its prefix first, leaving longer snapshots untouched.
+
+    Serializes and validates as a plain list of messages.
+    """
+
+    __slots__ = ("_items", "_length")
+
+    def __init__(self, messages: Iterable[Message] = ()) -> None:
+        self._items = list(messages)
+        self._length = len(self._items)
+
+    def appended(self, message: Message) -> "MessageHistory":
+        """Return a new snapshot with `message` added at the end."""
+        items = self._items
+        if len(items) != self._length:
+            items = items[: self._length]
+        items.append(message)
+        return self._view(items, self._length + 1)
+
+    def dropped_last(self) -> "MessageHistory":
+        """Return a snapshot without the last message."""
+        return self._view(self._items, max(0, self._length - 1))
+
+    @classmethod
+    def _view(cls, items: list[Message], length: int) -> "MessageHistory":
+        history = cls.__new__(cls)
+        history._items = items
+        history._length = length
+        return history
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Message: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Message]: ...
+
+    def __getitem__(self, index: int | slice) -> Message | list[Message]:
+        if isinstance(index, slice):
+            return self._items[: self._length][index]
+        position = index + self._length if index < 0 else index
+        if not 0 <= position < self._length:
+            raise IndexError("message index out of range")
+        return self._items[position]
+
+    def __iter__(self) -> Iterator[Message]:
+        items = self._items
+        for position in range(self._length):
+            yield items[position]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str | bytes):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __reduce__(self) -> tuple[type["MessageHistory"], tuple[list[Message]]]:
+        return (MessageHistory, (list(self),))
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        list_schema = handler.generate_schema(list[Message])
+        from_list = core_schema.no_info_after_validator_function(cls, list_schema)
+        return core_schema.json_or_python_schema(
+            json_schema=from_list,
+            # Existing histories are reused as is, without copying or revalidating messages
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), from_list]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                list, return_schema=list_schema
+            ),
+        )
+
+
 @dataobject
 @dataclass
 class Conversation:
-    """Ordered list of messages forming the conversation context."""
+    """Ordered list of messages forming the conversation context.
+
+    Messages are stored in a `MessageHistory`: adding messages with `with_message`
+    is O(1) and conversation snapshots share their common messages.
+    """
 
     conversation_id: str
-    messages: list[Message]
+    messages: Annotated[Sequence[Message], MessageHistory]
     session_id: str | None = None
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
@@ -94,7 +198,7 @@ class Conversation:
         """Return a new conversation with an additional message."""
         return Conversation(
             conversation_id=self.conversation_id,
-            messages=[*self.messages, message],
+            messages=self._history().appended(message),
             session_id=self.session_id,
             created_at=self.created_at,
         )
@@ -102,11 +206,15 @@ class Conversation:
     def drop_last_message(self) -> "Conversation":
         return Conversation(
             conversation_id=self.conversation_id,
-            messages=self.messages[:-1],
+            messages=self._history().dropped_last(),
             session_id=self.session_id,
             created_at=self.created_at,
         )
 
+    def _history(self) -> MessageHistory:
+        messages = self.messages
+        return messages if isinstance(messages, MessageHistory) else MessageHistory(messages)
+
 
 @dataobject
 @dataclass
@@ -157,9 +265,84 @@ class CompletionResponse:
     finish_reason: str | None = None
 
 
+class CompletionChunkType(StrEnum):
+    """Kinds of incremental events produced by a streaming completion."""
+
+    CONTENT = "content"
+    TOOL_CALL = "tool_call"
+    DONE = "done"
+
+
+@dataobject
+@dataclass
+class CompletionChunk:
+    """Incremental event produced by a streaming completion.
+
+    `CONTENT` chunks carry a text delta, `TOOL_CALL` chunks carry a tool call whose
+    arguments were fully received and the final `DONE` chunk carries the normalized
+    completion response.
+    """
+
+    type: CompletionChunkType
+    content: str | None = None
+    tool_call: ToolCall | None = None
+    response: CompletionResponse | None = None
+
+
+@dataobject
+@dataclass
+class CompletionError:
+    """Error returned by the provider for a single completion."""
+
+    status: int
+    message: str
+    details: dict[str, Any] | None = None
+
+
+@dataobject
+@dataclass
+class CompletionBatchRequest:
+    """Input payload for the generate_batch event.
+
+    `max_concurrency` overrides the number of completions sent at the same time
+    configured in settings.
+    """
+
+    requests: list[CompletionRequest]
+    max_concurrency: int | None = None
+
+
+@dataobject
+@dataclass
+class CompletionBatchItem:
+    """Result of a single completion in a batch, either a response or an error."""
+
+    index: int
+    response: CompletionResponse | None = None
+    error: CompletionError | None = None
+
+
+@dataobject
+@dataclass
+class CompletionBatchResponse:
+    """Results of a batch of completions, in the same order as the requests."""
+
+    items: list[CompletionBatchItem]
+
+
 def message_to_openai_dict(message: Message) -> dict[str, Any]:
-    """Convert a Message into the OpenAI-compatible dict structure."""
-    return Payload.to_obj(message, exclude_none=True)  # type: ignore[return-value]
+    """Convert a Message into the OpenAI-compatible dict structure.
+
+    The serialized form is memoized on the message instance, so conversations sharing
+    messages only serialize each message once. Assigning a message field, also on a
+    copy, drops the memo; values nested in fields must not be modified in place. The
+    returned dict must not be modified.
+    """
+    serialized: dict[str, Any] | None = message.__dict__.get(_OPENAI_DICT_ATTR)
+    if serialized is None:
+        serialized = Payload.to_obj(message, exclude_none=True)  # type: ignore[assignment]
+        object.__setattr__(message, _OPENAI_DICT_ATTR, serialized)
+    return serialized  # type: ignore[return-value]
 
 
 def messages_from_tool_calls(tool_calls: list[ToolCall]) -> list[Message]:
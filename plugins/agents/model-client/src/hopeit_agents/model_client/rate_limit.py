@@ -0,0 +1,106 @@
+"""Client-side rate limiting of requests sent to a model deployment.
+
+`RateLimiter` enforces requests-per-minute and tokens-per-minute budgets using two
+token buckets refilled continuously. Callers are served in arrival order and wait
+until both buckets can afford the request, up to a maximum waiting time. Token
+cost is estimated from the request payload before sending and reconciled with the
+usage reported by the provider once the response arrives.
+"""
+
+import asyncio
+import json
+from collections.abc import Mapping
+from time import monotonic
+from typing import Any
+
+from hopeit_agents.model_client.settings import RateLimitSettings
+
+__all__ = ["RateLimiter", "estimate_tokens"]
+
+# Rough average for OpenAI tokenizers on English text and JSON
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(payload: Mapping[str, Any]) -> int:
+    """Estimate the tokens a completion request will consume, prompt and output."""
+    prompt_chars = len(
+        json.dumps(payload.get("messages", []), separators=(",", ":"), default=str)
+    ) + len(json.dumps(payload.get("tools", []), separators=(",", ":"), default=str))
+    max_tokens = payload.get("max_tokens")
+    output_tokens = int(max_tokens) if isinstance(max_tokens, int) else 0
+    return prompt_chars // _CHARS_PER_TOKEN + 1 + output_tokens
+
+
+class _TokenBucket:
+    """Bucket holding up to `capacity` units refilled at `capacity` per minute."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = float(capacity)
+        self.available = float(capacity)
+        self._rate = capacity / 60.0
+        self._updated = monotonic()
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self.available = min(self.capacity, self.available + elapsed * self._rate)
+
+    def wait_time(self, amount: float) -> float:
+        missing = min(amount, self.capacity) - self.available
+        return missing / self._rate if missing > 0 else 0.0
+
+
+class RateLimiter:
+    """Asyncio scheduler enforcing RPM and TPM budgets of a single deployment."""
+
+    def __init__(self, settings: RateLimitSettings) -> None:
+        self._max_wait_seconds = settings.max_wait_seconds
+        self._requests = (
+            _TokenBucket(settings.requests_per_minute) if settings.requests_per_minute else None
+        )
+        self._tokens = (
+            _TokenBucket(settings.tokens_per_minute) if settings.tokens_per_minute else None
+        )
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Wait until the request fits the budgets and reserve its estimated cost.
+
+        Raises `TimeoutError` when the request cannot be scheduled within
+        `max_wait_seconds`.
+        """
+        if self._requests is None and self._tokens is None:
+            return
+        deadline = monotonic() + self._max_wait_seconds
+        async with asyncio.timeout(self._max_wait_seconds):
+            async with self._lock:
+                while True:
+                    now = monotonic()
+                    wait = 0.0
+                    for bucket, amount in self._buckets(estimated_tokens):
+                        bucket.refill(now)
+                        wait = max(wait, bucket.wait_time(amount))
+                    if wait <= 0.0:
+                        for bucket, amount in self._buckets(estimated_tokens):
+                            bucket.available -= amount
+                        return
+                    if now + wait > deadline:
+                        raise TimeoutError("Rate limit budget not available in time")
+                    await asyncio.sleep(wait)
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Adjust the token budget once the provider reported the actual usage."""
+        if self._tokens is None:
+            return
+        self._tokens.refill(monotonic())
+        self._tokens.available = min(
+            self._tokens.capacity, self._tokens.available + estimated_tokens - actual_tokens
+        )
+
+    def _buckets(self, estimated_tokens: int) -> list[tuple[_TokenBucket, float]]:
+        buckets: list[tuple[_TokenBucket, float]] = []
+        if self._requests is not None:
+            buckets.append((self._requests, 1.0))
+        if self._tokens is not None:
+            buckets.append((self._tokens, float(estimated_tokens)))
+        return buckets
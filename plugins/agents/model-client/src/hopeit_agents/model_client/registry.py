@@ -0,0 +1,112 @@
+"""Process-wide registry of pooled model clients keyed by settings key.
+
+Clients keep a long-lived HTTP session so consecutive completions reuse open
+connections to the provider. To release connections when the hopeit app stops,
+register `ModelClientConnections` in the app `app_connections` section::
+
+    "app_connections": {
+      "model_client_pool": {
+        "name": "hopeit-agents-model-client",
+        "version": "0.1",
+        "client": "hopeit_agents.model_client.registry.ModelClientConnections"
+      }
+    }
+"""
+
+from hopeit.app.client import Client
+from hopeit.app.config import AppConfig
+
+from hopeit_agents.model_client.balancer import ModelEndpoint
+from hopeit_agents.model_client.cache import CompletionCache
+from hopeit_agents.model_client.client import AsyncModelClient, build_url
+from hopeit_agents.model_client.rate_limit import RateLimiter
+from hopeit_agents.model_client.settings import ModelClientSettings
+
+__all__ = ["get_client", "close_clients", "ModelClientConnections"]
+
+
+_clients: dict[str, tuple[ModelClientSettings, tuple[str | None, ...], AsyncModelClient]] = {}
+_retired: list[AsyncModelClient] = []
+
+
+def get_client(
+    settings_key: str,
+    settings: ModelClientSettings,
+    api_key: str | None,
+    endpoint_api_keys: list[str | None] | None = None,
+) -> AsyncModelClient:
+    """Return the shared client for `settings_key`, creating it when settings changed.
+
+    `endpoint_api_keys` are the API keys of `settings.endpoints`, in the same order.
+    """
+    if endpoint_api_keys is None:
+        endpoint_api_keys = [None] * len(settings.endpoints)
+    api_keys = (api_key, *endpoint_api_keys)
+    entry = _clients.get(settings_key)
+    if entry is not None:
+        cached_settings, cached_api_keys, client = entry
+        if cached_settings == settings and cached_api_keys == api_keys:
+            return client
+        # Replaced clients close their session once in-flight requests finish
+        client.retire()
+        _retired.append(client)
+        _retired[:] = [retired for retired in _retired if not retired.drained]
+
+    client = AsyncModelClient(
+        base_url=settings.api_base,
+        api_key=api_key,
+        timeout_seconds=settings.timeout_seconds,
+        default_headers=settings.extra_headers,
+        deployment_name=settings.deployment_name,
+        api_version=settings.api_version,
+        connection_pool=settings.connection_pool,
+        cache=CompletionCache(settings.completion_cache)
+        if settings.completion_cache.enabled
+        else None,
+        rate_limiter=RateLimiter(settings.rate_limit)
+        if settings.rate_limit.requests_per_minute or settings.rate_limit.tokens_per_minute
+        else None,
+        retry=settings.retry,
+        circuit_breaker=settings.circuit_breaker,
+        endpoints=[
+            ModelEndpoint(
+                url=build_url(endpoint.api_base, endpoint.deployment_name, endpoint.api_version),
+                api_key=endpoint_api_key,
+            )
+            for endpoint, endpoint_api_key in zip(
+                settings.endpoints, endpoint_api_keys, strict=True
+            )
+        ],
+        load_balancing=settings.load_balancing,
+    )
+    _clients[settings_key] = (settings, api_keys, client)
+    return client
+
+
+async def close_clients() -> None:
+    """Close every registered client and clear the registry."""
+    clients = [client for _, _, client in _clients.values()] + _retired
+    _clients.clear()
+    _retired.clear()
+    for client in clients:
+        await client.close()
+
+
+class ModelClientConnections(Client):
+    """hopeit app connection that ties pooled model clients to the app lifecycle.
+
+    The engine calls `start()` when the app starts and `stop()` when it stops,
+    closing every pooled session registered in this process.
+    """
+
+    def __init__(self, app_config: AppConfig, app_connection: str) -> None:
+        self.app_key = app_config.app_key()
+        self.app_connection = app_connection
+
+    async def start(self) -> "ModelClientConnections":
+        """Nothing to start: clients are created lazily on first completion."""
+        return self
+
+    async def stop(self) -> None:
+        """Release pooled connections."""
+        await close_clients()
@@ -0,0 +1,92 @@
+"""Retry backoff and circuit breaker helpers for calls to model providers."""
+
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from time import monotonic
+
+from hopeit_agents.model_client.settings import CircuitBreakerSettings, RetrySettings
+
+__all__ = ["CircuitBreaker", "backoff_delay", "parse_retry_after"]
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return seconds to wait from a `Retry-After` header in seconds or HTTP-date format."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def backoff_delay(settings: RetrySettings, attempt: int, retry_after: float | None) -> float:
+    """Return seconds to wait before retrying after the given failed attempt (1-based).
+
+    Exponential backoff with jitter between half and the full computed delay. A
+    `Retry-After` value from the provider is used as a lower bound.
+    """
+    delay = min(
+        settings.max_backoff_seconds,
+        settings.initial_backoff_seconds * settings.backoff_multiplier ** (attempt - 1),
+    )
+    if settings.jitter:
+        delay = random.uniform(delay / 2.0, delay)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+class CircuitBreaker:
+    """Consecutive-failures circuit breaker guarding a single endpoint.
+
+    After `failure_threshold` consecutive failures the circuit opens and requests are
+    rejected until `reset_timeout_seconds` elapsed. Then a single probe request is
+    allowed: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, settings: CircuitBreakerSettings) -> None:
+        self._failure_threshold = settings.failure_threshold
+        self._reset_timeout_seconds = settings.reset_timeout_seconds
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the circuit currently rejects requests."""
+        return self._opened_at is not None
+
+    def allow_request(self) -> bool:
+        """Return whether a request can be sent to the endpoint now."""
+        if self._opened_at is None:
+            return True
+        if self._probing or monotonic() - self._opened_at < self._reset_timeout_seconds:
+            return False
+        self._probing = True
+        return True
+
+    def release_probe(self) -> None:
+        """Allow a new probe when the probe request was abandoned without an outcome."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the circuit when the threshold is reached."""
+        self._failures += 1
+        if self._probing or self._failures >= self._failure_threshold:
+            self._opened_at = monotonic()
+        self._probing = False
@@ -11,6 +11,116 @@ from hopeit_agents.model_client.models import CompletionConfig
 SETTINGS_KEY = "model_client"
 
 
+@dataobject
+@dataclass
+class ConnectionPoolSettings:
+    """HTTP connection pool shared by all completions issued with the same settings key."""
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout_seconds: float = 30.0
+    dns_cache_ttl_seconds: int | None = 300
+
+
+@dataobject
+@dataclass
+class CompletionCacheSettings:
+    """Opt-in cache of completion responses keyed by a hash of the provider payload.
+
+    Entries are kept in memory up to `max_entries` (least recently used are evicted)
+    and expire after `ttl_seconds`. When `disk_path` is set, responses are also
+    persisted as JSON files in that folder and reused across processes.
+    """
+
+    enabled: bool = False
+    max_entries: int = 1024
+    ttl_seconds: float = 3600.0
+    disk_path: str | None = None
+
+
+@dataobject
+@dataclass
+class RateLimitSettings:
+    """Requests and tokens per minute budgets enforced before calling the provider.
+
+    Budgets left as `None` are not enforced. Requests that cannot be scheduled within
+    `max_wait_seconds` fail with a 429 `ModelClientError` instead of being sent.
+    """
+
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
+    max_wait_seconds: float = 30.0
+
+
+@dataobject
+@dataclass
+class RetrySettings:
+    """Retry policy applied to transient provider errors.
+
+    Requests failing with a status in `retryable_statuses`, or that could not reach
+    the provider, are attempted up to `max_attempts` times waiting an exponential
+    backoff with jitter, or the `Retry-After` time requested by the provider. Other
+    statuses fail immediately. Retries are not attempted when the provider asks to
+    wait longer than `max_backoff_seconds`.
+    """
+
+    max_attempts: int = 3
+    initial_backoff_seconds: float = 0.5
+    backoff_multiplier: float = 2.0
+    max_backoff_seconds: float = 20.0
+    jitter: bool = True
+    retryable_statuses: list[int] = field(
+        default_factory=lambda: [408, 409, 429, 500, 502, 503, 504]
+    )
+
+
+@dataobject
+@dataclass
+class CircuitBreakerSettings:
+    """Per endpoint circuit breaker failing fast while a provider is degraded.
+
+    Set `failure_threshold` to 0 to disable it.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout_seconds: float = 30.0
+
+
+@dataobject
+@dataclass
+class ModelEndpointSettings:
+    """Additional deployment or gateway serving the same model as `api_base`.
+
+    `api_key_env` defaults to the one configured in `ModelClientSettings`.
+    """
+
+    api_base: str
+    deployment_name: str | None = None
+    api_version: str | None = None
+    api_key_env: str | None = None
+
+
+@dataobject
+@dataclass
+class LoadBalancingSettings:
+    """Routing of requests when more than one endpoint is configured.
+
+    `ewma_alpha` is the weight of the latest request latency in the moving average
+    used to rank endpoints. Unhealthy endpoints are ejected and probed back in
+    according to `circuit_breaker` settings.
+    """
+
+    ewma_alpha: float = 0.3
+
+
+@dataobject
+@dataclass
+class BatchSettings:
+    """Defaults for batches of completions."""
+
+    max_concurrency: int = 8
+
+
 @dataobject
 @dataclass
 class ModelClientSettings:
@@ -23,18 +133,31 @@ class ModelClientSettings:
     api_version: str | None = None
     timeout_seconds: float = 30.0
     extra_headers: dict[str, str] = field(default_factory=dict)
+    connection_pool: ConnectionPoolSettings = field(default_factory=ConnectionPoolSettings)
+    completion_cache: CompletionCacheSettings = field(default_factory=CompletionCacheSettings)
+    rate_limit: RateLimitSettings = field(default_factory=RateLimitSettings)
+    retry: RetrySettings = field(default_factory=RetrySettings)
+    circuit_breaker: CircuitBreakerSettings = field(default_factory=CircuitBreakerSettings)
+    endpoints: list[ModelEndpointSettings] = field(default_factory=list)
+    load_balancing: LoadBalancingSettings = field(default_factory=LoadBalancingSettings)
+    batch: BatchSettings = field(default_factory=BatchSettings)
     default_config: CompletionConfig = field(
         default_factory=lambda: CompletionConfig(enable_tool_expansion=True)
     )
 
-    def resolve_api_key(self, env: Mapping[str, Any]) -> str | None:
+    def resolve_api_key(self, env: Mapping[str, Any], api_key_env: str | None = None) -> str | None:
         """Return the API key found in context env using api_key_env."""
-        if self.api_key_env is None:
+        api_key_env = api_key_env or self.api_key_env
+        if api_key_env is None:
             return None
-        api_key = env.get(self.api_key_env)
+        api_key = env.get(api_key_env)
         if isinstance(api_key, str) and api_key:
             return api_key
-        return os.getenv(self.api_key_env)
+        return os.getenv(api_key_env)
+
+    def resolve_endpoint_api_keys(self, env: Mapping[str, Any]) -> list[str | None]:
+        """Return the API key of each additional endpoint, in order."""
+        return [self.resolve_api_key(env, endpoint.api_key_env) for endpoint in self.endpoints]
 
 
 def merge_config(
@@ -0,0 +1,67 @@
+"""Process-wide cache of rendered OpenAI `tools` arrays.
+
+Agents usually send the same tool catalog on every completion of a loop, and
+several agents share catalogs. Catalogs are received again on every request when
+agents are called over HTTP, so the rendered `tools` array is cached by a hash of
+the catalog content: it is rendered once per catalog version and reused by every
+request sending it. Each request gets its own copy of the cached array, so
+requests cannot modify each other's payload or the cached descriptors.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any
+
+from hopeit_agents.mcp_client.models import ToolDescriptor
+
+__all__ = ["openai_tools_spec"]
+
+_MAX_CATALOGS = 256
+
+_catalogs: OrderedDict[str, tuple[dict[str, Any], ...]] = OrderedDict()
+
+
+def _catalog_key(tools: Sequence[ToolDescriptor]) -> str:
+    """Hash every field of the descriptors rendered in the OpenAI `tools` array."""
+    content = json.dumps(
+        [
+            [
+                tool.name,
+                tool.title,
+                tool.description,
+                tool.input_schema,
+                tool.output_schema,
+                tool.annotations,
+                tool.meta,
+            ]
+            for tool in tools
+        ],
+        sort_keys=True,
+        default=repr,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _copy(value: Any) -> Any:
+    """Return a deep copy of a JSON-like `value`."""
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    return value
+
+
+def openai_tools_spec(tools: Sequence[ToolDescriptor]) -> list[dict[str, Any]]:
+    """Return a copy of the OpenAI `tools` array rendered for the catalog `tools`."""
+    key = _catalog_key(tools)
+    spec = _catalogs.get(key)
+    if spec is None:
+        spec = tuple(_copy(tool.to_openai_dict()) for tool in tools)
+        _catalogs[key] = spec
+        if len(_catalogs) > _MAX_CATALOGS:
+            _catalogs.popitem(last=False)
+    else:
+        _catalogs.move_to_end(key)
+    return [_copy(tool) for tool in spec]
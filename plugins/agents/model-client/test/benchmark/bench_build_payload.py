@@ -0,0 +1,98 @@
+"""Benchmark per-iteration cost of building completion payloads in an agent loop.
+
+Each iteration of an agent loop appends a tool result to the conversation and builds
+the provider payload again. With memoized message serialization only the new message
+is serialized, so the per-iteration cost no longer grows with the serialization of
+the whole history.
+
+Run with::
+
+    python plugins/agents/model-client/test/benchmark/bench_build_payload.py
+"""
+
+import json
+from time import perf_counter
+
+from hopeit.dataobjects.payload import Payload
+
+from hopeit_agents.model_client.client import AsyncModelClient
+from hopeit_agents.model_client.models import (
+    CompletionConfig,
+    Conversation,
+    Message,
+    Role,
+    ToolCall,
+    ToolFunctionCall,
+)
+
+ITERATIONS = 50
+
+
+def _conversation(size: int) -> Conversation:
+    messages = [Message(role=Role.SYSTEM, content="You are a helpful assistant.")]
+    while len(messages) < size:
+        index = len(messages)
+        messages.append(
+            Message(
+                role=Role.ASSISTANT,
+                content="",
+                tool_calls=[
+                    ToolCall(
+                        id=f"call_{index}",
+                        type="function",
+                        function=ToolFunctionCall(
+                            name="search", arguments=json.dumps({"query": f"q{index}"})
+                        ),
+                    )
+                ],
+            )
+        )
+        messages.append(
+            Message(
+                role=Role.TOOL,
+                content=json.dumps({"results": [f"item {i}" for i in range(10)]}),
+                tool_call_id=f"call_{index}",
+                name="search",
+            )
+        )
+    return Conversation(conversation_id="bench", messages=messages[:size])
+
+
+def _tool_result(index: int) -> Message:
+    return Message(role=Role.TOOL, content=f"result {index}", tool_call_id=f"new_{index}")
+
+
+def _iteration_ms(client: AsyncModelClient, size: int, *, memoized: bool) -> float:
+    config = CompletionConfig(model="bench")
+    conversation = _conversation(size)
+    client._build_payload(conversation, config)
+    elapsed = 0.0
+    for index in range(ITERATIONS):
+        conversation = conversation.with_message(_tool_result(index))
+        started = perf_counter()
+        if memoized:
+            client._build_payload(conversation, config)
+        else:
+            # Baseline: serialize the whole history on every iteration
+            [Payload.to_obj(msg, exclude_none=True) for msg in conversation.messages]
+        elapsed += perf_counter() - started
+    return elapsed * 1000.0 / ITERATIONS
+
+
+def main() -> None:
+    client = AsyncModelClient(
+        base_url="http://localhost",
+        api_version=None,
+        deployment_name=None,
+        api_key=None,
+        timeout_seconds=1.0,
+    )
+    print(f"{'messages':>10} {'full ms/iter':>14} {'memoized ms/iter':>18} {'speedup':>9}")
+    for size in (10, 100, 1000):
+        full = _iteration_ms(client, size, memoized=False)
+        memoized = _iteration_ms(client, size, memoized=True)
+        print(f"{size:>10} {full:>14.3f} {memoized:>18.3f} {full / memoized:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Unit tests for latency-aware load balancing across model endpoints."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hopeit_agents.model_client import registry
+from hopeit_agents.model_client.balancer import LoadBalancer, ModelEndpoint
+from hopeit_agents.model_client.models import (
+    CompletionConfig,
+    CompletionRequest,
+    Conversation,
+    Message,
+    Role,
+)
+from hopeit_agents.model_client.settings import (
+    CircuitBreakerSettings,
+    ModelClientSettings,
+    ModelEndpointSettings,
+    RetrySettings,
+)
+
+
+@pytest.fixture(autouse=True)
+async def clean_registry() -> AsyncGenerator[None, None]:
+    yield
+    await registry.close_clients()
+
+
+async def _provider(name: str, *, status: int = 200, delay: float = 0.0) -> TestServer:
+    calls: list[dict[str, Any]] = []
+
+    async def chat_completions(request: web.Request) -> web.Response:
+        calls.append(dict(request.headers))
+        await asyncio.sleep(delay)
+        if status >= 400:
+            return web.json_response({"error": {"message": "down"}}, status=status)
+        return web.json_response(
+            {
+                "id": name,
+                "model": "test-model",
+                "choices": [
+                    {"message": {"role": "assistant", "content": name}, "finish_reason": "stop"}
+                ],
+            }
+        )
+
+    app = web.Application()
+    app.router.add_post("/chat/completions", chat_completions)
+    app["calls"] = calls
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+def _request() -> CompletionRequest:
+    return CompletionRequest(
+        conversation=Conversation(
+            conversation_id="conv-1", messages=[Message(role=Role.USER, content="hello")]
+        )
+    )
+
+
+def test_select_prefers_low_latency_and_idle_endpoints() -> None:
+    fast, slow = ModelEndpoint(url="http://fast"), ModelEndpoint(url="http://slow")
+    balancer = LoadBalancer([fast, slow])
+
+    assert balancer.select() == fast
+    assert balancer.select() == slow
+    balancer.record(fast, latency_ms=10.0, failed=False)
+    balancer.record(slow, latency_ms=25.0, failed=False)
+
+    assert balancer.select() == fast
+    assert balancer.select() == fast
+    assert balancer.select() == slow
+
+    stats = {item.url: item for item in balancer.stats()}
+    assert stats["http://fast"].selected == 3
+    assert stats["http://fast"].in_flight == 2
+    assert stats["http://slow"].ewma_latency_ms == 25.0
+
+
+def test_fast_failing_endpoint_does_not_win_selection() -> None:
+    healthy, failing = ModelEndpoint(url="http://healthy"), ModelEndpoint(url="http://failing")
+    balancer = LoadBalancer([healthy, failing])
+
+    assert balancer.select() == healthy
+    assert balancer.select() == failing
+    balancer.record(healthy, latency_ms=20.0, failed=False)
+    balancer.record(failing, latency_ms=1.0, failed=True)
+
+    assert balancer.select() == healthy
+    assert balancer.stats()[1].ewma_latency_ms == 40.0
+
+
+def test_unhealthy_endpoints_are_ejected_and_probed() -> None:
+    first, second = ModelEndpoint(url="http://first"), ModelEndpoint(url="http://second")
+    balancer = LoadBalancer(
+        [first, second],
+        circuit_breaker=CircuitBreakerSettings(failure_threshold=1, reset_timeout_seconds=0.0),
+    )
+
+    assert balancer.select() == first
+    assert balancer.select() == second
+    balancer.record(first, latency_ms=1.0, failed=True)
+    balancer.record(second, latency_ms=50.0, failed=False)
+    assert not balancer.stats()[0].healthy
+
+    # reset timeout elapsed: a single probe is allowed
+    assert balancer.select() == first
+    assert balancer.select() == second
+    balancer.record(first, latency_ms=1.0, failed=False)
+    assert balancer.stats()[0].healthy
+
+
+async def test_client_fails_over_to_healthy_endpoint() -> None:
+    failing = await _provider("failing", status=503)
+    healthy = await _provider("healthy", delay=0.01)
+    settings = ModelClientSettings(
+        api_base=str(failing.make_url("/")),
+        default_model="test-model",
+        retry=RetrySettings(max_attempts=2, initial_backoff_seconds=0.0),
+        circuit_breaker=CircuitBreakerSettings(failure_threshold=1, reset_timeout_seconds=60.0),
+        endpoints=[ModelEndpointSettings(api_base=str(healthy.make_url("/")))],
+    )
+    try:
+        client = registry.get_client("app.model_client", settings, "key-1", ["key-2"])
+        responses = [
+            await client.complete(_request(), CompletionConfig(model="m")) for _ in range(3)
+        ]
+    finally:
+        await failing.close()
+        await healthy.close()
+
+    assert [response.message.content for response in responses] == ["healthy"] * 3
+    assert len(failing.app["calls"]) == 1
+    assert failing.app["calls"][0]["api-key"] == "key-1"
+    assert [call["api-key"] for call in healthy.app["calls"]] == ["key-2"] * 3
+
+
+def test_released_probe_allows_a_new_probe() -> None:
+    endpoint = ModelEndpoint(url="http://first")
+    balancer = LoadBalancer(
+        [endpoint],
+        circuit_breaker=CircuitBreakerSettings(failure_threshold=1, reset_timeout_seconds=0.0),
+    )
+    assert balancer.select() == endpoint
+    balancer.record(endpoint, latency_ms=1.0, failed=True)
+
+    assert balancer.select() == endpoint
+    assert balancer.select() is None
+    balancer.release(endpoint)
+
+    assert balancer.select() == endpoint
+    assert balancer.stats()[0].in_flight == 1
+
+
+async def test_cancelled_completion_is_released_from_balancer() -> None:
+    slow = await _provider("slow", delay=1.0)
+    settings = ModelClientSettings(api_base=str(slow.make_url("/")), default_model="test-model")
+    try:
+        client = registry.get_client("app.model_client", settings, "key-1")
+        task = asyncio.create_task(client.complete(_request(), CompletionConfig(model="m")))
+        while not slow.app["calls"]:
+            await asyncio.sleep(0.01)
+        assert client.balancer.stats()[0].in_flight == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    finally:
+        await slow.close()
+
+    stats = client.balancer.stats()[0]
+    assert stats.in_flight == 0
+    assert stats.ewma_latency_ms is None
@@ -0,0 +1,148 @@
+"""Unit tests for batches of completions."""
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hopeit_agents.model_client.client import AsyncModelClient, ModelClientError
+from hopeit_agents.model_client.models import (
+    CompletionConfig,
+    CompletionRequest,
+    CompletionResponse,
+    Conversation,
+    Message,
+    Role,
+)
+
+
+def _completion_body(content: str) -> dict[str, object]:
+    return {
+        "id": f"resp-{content}",
+        "model": "test-model",
+        "choices": [
+            {"message": {"role": "assistant", "content": content}, "finish_reason": "stop"}
+        ],
+    }
+
+
+@pytest.fixture
+async def provider() -> AsyncGenerator[TestServer, None]:
+    in_flight = [0, 0]
+
+    async def chat_completions(request: web.Request) -> web.Response:
+        body = await request.json()
+        content = body["messages"][0]["content"]
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight[1], in_flight[0])
+        # later requests finish first to check results keep request order
+        await asyncio.sleep(0.05 / (int(content) + 1) if content.isdigit() else 0)
+        in_flight[0] -= 1
+        if content == "bad":
+            return web.json_response({"error": {"message": "invalid"}}, status=400)
+        return web.json_response(_completion_body(content))
+
+    app = web.Application()
+    app.router.add_post("/chat/completions", chat_completions)
+    app["in_flight"] = in_flight
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+def _item(content: str) -> tuple[CompletionRequest, CompletionConfig]:
+    request = CompletionRequest(
+        conversation=Conversation(
+            conversation_id=f"conv-{content}", messages=[Message(role=Role.USER, content=content)]
+        )
+    )
+    return request, CompletionConfig(model="test-model")
+
+
+async def test_complete_batch_keeps_order_and_item_errors(provider: TestServer) -> None:
+    items = [_item(str(index)) for index in range(6)] + [_item("bad")]
+
+    async with AsyncModelClient(
+        base_url=str(provider.make_url("/")),
+        api_version=None,
+        deployment_name=None,
+        api_key=None,
+        timeout_seconds=5.0,
+    ) as client:
+        results = await client.complete_batch(items, max_concurrency=3)
+
+    assert [
+        result.message.content for result in results if isinstance(result, CompletionResponse)
+    ] == [str(index) for index in range(6)]
+    error = results[-1]
+    assert isinstance(error, ModelClientError) and error.status == 400
+    assert provider.app["in_flight"][1] == 3
+
+
+def test_batch_jsonl_round_trip() -> None:
+    items = [_item("0"), _item("1"), _item("2")]
+    client = AsyncModelClient(
+        base_url="http://localhost:1",
+        api_version=None,
+        deployment_name=None,
+        api_key=None,
+        timeout_seconds=1.0,
+    )
+
+    lines = client.to_batch_jsonl(items).splitlines()
+    assert [json.loads(line)["custom_id"] for line in lines] == [
+        "request-0",
+        "request-1",
+        "request-2",
+    ]
+    assert json.loads(lines[1])["body"]["messages"][0]["content"] == "1"
+    assert json.loads(lines[0])["url"] == "/chat/completions"
+
+    output = [
+        json.dumps(
+            {
+                "custom_id": "request-1",
+                "response": {"status_code": 200, "body": _completion_body("one")},
+                "error": None,
+            }
+        ),
+        json.dumps({"custom_id": "request-0", "response": None, "error": {"message": "expired"}}),
+    ]
+    results = client.from_batch_jsonl(items, output)
+
+    assert isinstance(results[0], ModelClientError) and results[0].message == "expired"
+    assert isinstance(results[1], CompletionResponse)
+    assert results[1].conversation.conversation_id == "conv-1"
+    assert results[1].message.content == "one"
+    assert isinstance(results[2], ModelClientError) and results[2].status == 404
+    assert len(results) == 3
+
+
+def test_batch_jsonl_reports_unmatched_lines() -> None:
+    items = [_item("0")]
+    client = AsyncModelClient(
+        base_url="https://models.example.com/openai/deployments/{DEPLOYMENT_NAME}",
+        api_version="2024-06-01",
+        deployment_name="gpt",
+        api_key=None,
+        timeout_seconds=1.0,
+    )
+
+    line = json.loads(client.to_batch_jsonl(items))
+    output = [
+        json.dumps({"custom_id": custom_id, "response": None, "error": None})
+        for custom_id in ("request-7", "request-x", "0", None)
+    ]
+    results = client.from_batch_jsonl(items, [*output, "not json", "[]"])
+
+    assert line["url"] == "/openai/deployments/gpt/chat/completions?api-version=2024-06-01"
+    assert isinstance(results[0], ModelClientError) and results[0].status == 404
+    assert [
+        (error.status, (error.details or {}).get("line"))
+        for error in results[1:]
+        if isinstance(error, ModelClientError)
+    ] == [(400, line_number) for line_number in range(1, 7)]
@@ -0,0 +1,128 @@
+"""Unit tests for the completion response cache."""
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hopeit_agents.model_client.cache import CompletionCache, cache_key
+from hopeit_agents.model_client.client import AsyncModelClient
+from hopeit_agents.model_client.models import (
+    CompletionConfig,
+    CompletionRequest,
+    Conversation,
+    Message,
+    Role,
+)
+from hopeit_agents.model_client.settings import CompletionCacheSettings
+
+
+@pytest.fixture
+async def provider() -> AsyncGenerator[TestServer, None]:
+    calls: list[dict[str, Any]] = []
+
+    async def chat_completions(request: web.Request) -> web.Response:
+        calls.append(await request.json())
+        return web.json_response(
+            {
+                "id": f"resp-{len(calls)}",
+                "model": "test-model",
+                "created": 1700000000,
+                "choices": [
+                    {"message": {"role": "assistant", "content": "hi"}, "finish_reason": "stop"}
+                ],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            }
+        )
+
+    app = web.Application()
+    app.router.add_post("/chat/completions", chat_completions)
+    app["calls"] = calls
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+def _client(server: TestServer, cache: CompletionCache) -> AsyncModelClient:
+    return AsyncModelClient(
+        base_url=str(server.make_url("/")),
+        api_version=None,
+        deployment_name=None,
+        api_key=None,
+        timeout_seconds=5.0,
+        cache=cache,
+    )
+
+
+def _request(conversation_id: str, content: str = "hello") -> CompletionRequest:
+    return CompletionRequest(
+        conversation=Conversation(
+            conversation_id=conversation_id, messages=[Message(role=Role.USER, content=content)]
+        )
+    )
+
+
+def test_cache_key_is_canonical() -> None:
+    first = cache_key("http://x", {"model": "m", "temperature": 0, "messages": []})
+    second = cache_key("http://x", {"messages": [], "temperature": 0, "model": "m"})
+
+    assert first == second
+    assert first != cache_key("http://y", {"model": "m", "temperature": 0, "messages": []})
+
+
+async def test_cache_hit_matches_live_response(provider: TestServer) -> None:
+    cache = CompletionCache(CompletionCacheSettings(enabled=True))
+    config = CompletionConfig(model="test-model", temperature=0.0)
+
+    async with _client(provider, cache) as client:
+        request = _request("conv-1")
+        live = await client.complete(request, config)
+        cached = await client.complete(request, config)
+        other_conversation = await client.complete(_request("conv-2"), config)
+        await client.complete(_request("conv-1", "bye"), config)
+
+    assert len(provider.app["calls"]) == 2
+    assert cached == live
+    assert other_conversation.response_id == live.response_id
+    assert other_conversation.conversation.conversation_id == "conv-2"
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.memory_hits, stats.stores) == (2, 2, 2, 2)
+
+
+async def test_cache_evicts_least_recently_used() -> None:
+    cache = CompletionCache(CompletionCacheSettings(enabled=True, max_entries=2))
+
+    await cache.put("a", {"id": "a"})
+    await cache.put("b", {"id": "b"})
+    assert await cache.get("a") == {"id": "a"}
+    await cache.put("c", {"id": "c"})
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == {"id": "a"}
+    assert cache.stats.evictions == 1
+    assert cache.stats.entries == 2
+
+
+async def test_cache_expires_entries() -> None:
+    cache = CompletionCache(CompletionCacheSettings(enabled=True, ttl_seconds=0.0))
+
+    await cache.put("a", {"id": "a"})
+
+    assert await cache.get("a") is None
+    assert cache.stats.entries == 0
+
+
+async def test_cache_disk_tier_is_shared(tmp_path: Path) -> None:
+    settings = CompletionCacheSettings(enabled=True, disk_path=str(tmp_path / "cache"))
+    await CompletionCache(settings).put("abc", {"id": "abc"})
+
+    cache = CompletionCache(settings)
+
+    assert await cache.get("abc") == {"id": "abc"}
+    assert await cache.get("abc") == {"id": "abc"}
+    assert (cache.stats.disk_hits, cache.stats.memory_hits) == (1, 1)
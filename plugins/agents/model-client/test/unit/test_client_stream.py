@@ -0,0 +1,162 @@
+"""Unit tests for streaming completions in the model client."""
+
+import json
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hopeit_agents.model_client.client import AsyncModelClient, ModelClientError
+from hopeit_agents.model_client.models import (
+    CompletionChunk,
+    CompletionChunkType,
+    CompletionConfig,
+    CompletionRequest,
+    Conversation,
+    Message,
+    Role,
+)
+
+STREAM_EVENTS: list[dict[str, Any]] = [
+    {"id": "resp-1", "model": "test-model", "created": 1700000000, "choices": []},
+    {"choices": [{"index": 0, "delta": {"role": "assistant", "content": "Let me "}}]},
+    {"choices": [{"index": 0, "delta": {"content": "check."}}]},
+    {
+        "choices": [
+            {
+                "index": 0,
+                "delta": {
+                    "tool_calls": [
+                        {
+                            "index": 0,
+                            "id": "call_a",
+                            "type": "function",
+                            "function": {"name": "sum", "arguments": '{"a": '},
+                        }
+                    ]
+                },
+            }
+        ]
+    },
+    {
+        "choices": [
+            {
+                "index": 0,
+                "delta": {"tool_calls": [{"index": 0, "function": {"arguments": "1}"}}]},
+            }
+        ]
+    },
+    {
+        "choices": [
+            {
+                "index": 0,
+                "delta": {
+                    "tool_calls": [
+                        {
+                            "index": 1,
+                            "id": "call_b",
+                            "type": "function",
+                            "function": {"name": "random", "arguments": "{}"},
+                        }
+                    ]
+                },
+            }
+        ]
+    },
+    {"choices": [{"index": 0, "delta": {}, "finish_reason": "tool_calls"}]},
+    {"choices": [], "usage": {"prompt_tokens": 5, "completion_tokens": 7, "total_tokens": 12}},
+]
+
+
+@pytest.fixture
+async def provider() -> AsyncGenerator[TestServer, None]:
+    received: list[dict[str, Any]] = []
+
+    async def chat_completions(request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        received.append(body)
+        if body["messages"][0]["content"] == "fail":
+            return web.json_response({"error": {"message": "overloaded"}}, status=503)
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for event in STREAM_EVENTS:
+            await response.write(f"data: {json.dumps(event)}\n\n".encode())
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/chat/completions", chat_completions)
+    app["received"] = received
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+def _request(content: str = "add 1") -> CompletionRequest:
+    return CompletionRequest(
+        conversation=Conversation(
+            conversation_id="conv-1", messages=[Message(role=Role.USER, content=content)]
+        )
+    )
+
+
+async def test_complete_stream_yields_deltas_and_tool_calls(provider: TestServer) -> None:
+    async with AsyncModelClient(
+        base_url=str(provider.make_url("/")),
+        api_version=None,
+        deployment_name=None,
+        api_key=None,
+        timeout_seconds=5.0,
+    ) as client:
+        chunks: list[CompletionChunk] = [
+            chunk async for chunk in client.complete_stream(_request(), CompletionConfig(model="m"))
+        ]
+
+    assert provider.app["received"][0]["stream"] is True
+    assert [chunk.type for chunk in chunks] == [
+        CompletionChunkType.CONTENT,
+        CompletionChunkType.CONTENT,
+        CompletionChunkType.TOOL_CALL,
+        CompletionChunkType.TOOL_CALL,
+        CompletionChunkType.DONE,
+    ]
+    assert "".join(chunk.content or "" for chunk in chunks) == "Let me check."
+
+    first_call, second_call = chunks[2].tool_call, chunks[3].tool_call
+    assert first_call is not None and second_call is not None
+    assert first_call.function.name == "sum"
+    assert json.loads(first_call.function.arguments) == {"a": 1}
+    assert second_call.function.name == "random"
+
+    response = chunks[-1].response
+    assert response is not None
+    assert response.response_id == "resp-1"
+    assert response.finish_reason == "tool_calls"
+    assert response.message.content == "Let me check."
+    assert response.tool_calls == [first_call, second_call]
+    assert response.usage is not None and response.usage.total_tokens == 12
+    assert [msg.role for msg in response.conversation.messages] == [
+        Role.USER,
+        Role.ASSISTANT,
+        Role.ASSISTANT,
+    ]
+
+
+async def test_complete_stream_raises_provider_errors(provider: TestServer) -> None:
+    async with AsyncModelClient(
+        base_url=str(provider.make_url("/")),
+        api_version=None,
+        deployment_name=None,
+        api_key=None,
+        timeout_seconds=5.0,
+    ) as client:
+        with pytest.raises(ModelClientError) as exc_info:
+            async for _ in client.complete_stream(_request("fail"), CompletionConfig(model="m")):
+                pass
+
+    assert exc_info.value.status == 503
+    assert exc_info.value.message == "overloaded"
@@ -0,0 +1,51 @@
+"""Unit tests for append-only conversations."""
+
+from hopeit.dataobjects.payload import Payload
+
+from hopeit_agents.model_client.models import Conversation, Message, MessageHistory, Role
+
+
+def _message(content: str) -> Message:
+    return Message(role=Role.USER, content=content)
+
+
+def test_with_message_shares_storage_between_snapshots() -> None:
+    conversation = Conversation(conversation_id="conv-1", messages=[_message("0")])
+
+    snapshots = [conversation]
+    for index in range(1, 5):
+        snapshots.append(snapshots[-1].with_message(_message(str(index))))
+
+    histories = [snapshot.messages for snapshot in snapshots]
+    assert all(isinstance(history, MessageHistory) for history in histories)
+    assert len({id(history._items) for history in histories[1:]}) == 1  # type: ignore[attr-defined]
+    assert [len(history) for history in histories] == [1, 2, 3, 4, 5]
+    assert [msg.content for msg in snapshots[2].messages] == ["0", "1", "2"]
+    assert snapshots[4].messages[-1].content == "4"
+
+
+def test_appending_to_older_snapshot_does_not_change_newer_ones() -> None:
+    base = Conversation(conversation_id="conv-1", messages=[_message("a")])
+    left = base.with_message(_message("b"))
+    right = base.with_message(_message("c"))
+    shorter = left.drop_last_message()
+
+    assert [msg.content for msg in left.messages] == ["a", "b"]
+    assert [msg.content for msg in right.messages] == ["a", "c"]
+    assert shorter == base
+    assert [msg.content for msg in shorter.with_message(_message("d")).messages] == ["a", "d"]
+    assert [msg.content for msg in left.messages] == ["a", "b"]
+
+
+def test_conversation_serializes_as_plain_list() -> None:
+    messages = [_message("a"), _message("b")]
+    appended = Conversation(conversation_id="conv-1", messages=messages[:1]).with_message(
+        messages[1]
+    )
+    plain = Conversation(
+        conversation_id="conv-1", messages=messages, created_at=appended.created_at
+    )
+
+    assert Payload.to_json(appended) == Payload.to_json(plain)
+    assert appended == plain
+    assert Payload.from_json(Payload.to_json(appended), Conversation) == appended
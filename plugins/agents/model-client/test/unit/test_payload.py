@@ -0,0 +1,145 @@
+"""Unit tests for completion payload building."""
+
+import copy
+import pickle
+from typing import Any
+
+import pytest
+from hopeit.dataobjects.payload import Payload
+
+from hopeit_agents.mcp_client.models import ToolAnnotations, ToolDescriptor
+from hopeit_agents.model_client import tool_specs
+from hopeit_agents.model_client.client import AsyncModelClient
+from hopeit_agents.model_client.models import (
+    CompletionConfig,
+    Conversation,
+    Message,
+    Role,
+    message_to_openai_dict,
+)
+from hopeit_agents.model_client.tool_specs import openai_tools_spec
+
+
+def _client() -> AsyncModelClient:
+    return AsyncModelClient(
+        base_url="http://localhost",
+        api_version=None,
+        deployment_name=None,
+        api_key=None,
+        timeout_seconds=1.0,
+    )
+
+
+def test_message_serialization_is_memoized() -> None:
+    message = Message(role=Role.USER, content="hello")
+
+    first = message_to_openai_dict(message)
+
+    assert first == {"role": Role.USER, "content": "hello", "metadata": {}}
+    assert message_to_openai_dict(message) is first
+
+
+def test_message_memo_is_dropped_on_assignment() -> None:
+    message = Message(role=Role.USER, content="hello")
+    message_to_openai_dict(message)
+    copied = copy.copy(message)
+
+    copied.content = "changed"
+    message.name = "user-1"
+
+    assert message_to_openai_dict(copied)["content"] == "changed"
+    assert message_to_openai_dict(message) == {
+        "role": Role.USER,
+        "content": "hello",
+        "name": "user-1",
+        "metadata": {},
+    }
+
+
+def test_build_payload_only_serializes_new_messages() -> None:
+    client = _client()
+    config = CompletionConfig(model="m")
+    conversation = Conversation(
+        conversation_id="conv-1",
+        messages=[Message(role=Role.SYSTEM, content="sys"), Message(role=Role.USER, content="hi")],
+    )
+
+    first = client._build_payload(conversation, config)
+    extended = conversation.with_message(Message(role=Role.ASSISTANT, content="hello"))
+    second = client._build_payload(extended, config)
+
+    assert second["messages"][:2] == first["messages"]
+    assert all(a is b for a, b in zip(first["messages"], second["messages"], strict=False))
+    assert second["messages"][2] == {"role": Role.ASSISTANT, "content": "hello", "metadata": {}}
+
+
+def test_memoized_messages_keep_conversation_json() -> None:
+    conversation = Conversation(
+        conversation_id="conv-1", messages=[Message(role=Role.USER, content="hi")]
+    )
+    expected = Payload.to_json(conversation)
+
+    _client()._build_payload(conversation, CompletionConfig(model="m"))
+
+    assert Payload.to_json(conversation) == expected
+    assert Payload.from_json(expected, Conversation) == conversation
+
+
+def _tool(name: str) -> ToolDescriptor:
+    return ToolDescriptor(
+        name=name,
+        title=None,
+        description=f"{name} tool",
+        input_schema={"type": "object", "properties": {"x": {"type": "integer"}}},
+        output_schema=None,
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+
+
+def test_tools_spec_is_rendered_once_per_catalog(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Catalogs with the same content, also received again, reuse the rendered array."""
+    tool_specs._catalogs.clear()
+    rendered: list[str] = []
+    to_openai_dict = ToolDescriptor.to_openai_dict
+
+    def counting_to_openai_dict(tool: ToolDescriptor) -> dict[str, Any]:
+        rendered.append(tool.name)
+        return to_openai_dict(tool)
+
+    monkeypatch.setattr(ToolDescriptor, "to_openai_dict", counting_to_openai_dict)
+    client = _client()
+    conversation = Conversation(
+        conversation_id="conv-1", messages=[Message(role=Role.USER, content="hi")]
+    )
+    changed = _tool("b")
+    changed.input_schema = {"type": "object", "properties": {"z": {"type": "string"}}}
+
+    first = client._build_payload(
+        conversation, CompletionConfig(model="m", available_tools=[_tool("a"), _tool("b")])
+    )
+    again = client._build_payload(
+        conversation, CompletionConfig(model="m", available_tools=[_tool("a"), _tool("b")])
+    )
+    other = client._build_payload(
+        conversation, CompletionConfig(model="m", available_tools=[_tool("a"), changed])
+    )
+
+    assert rendered == ["a", "b", "a", "b"]
+    assert again["tools"] == first["tools"]
+    assert [tool["function"]["name"] for tool in first["tools"]] == ["a", "b"]
+    assert first["tools"][0]["function"]["annotations"]["readOnlyHint"] is True
+    assert other["tools"][1]["function"]["parameters"]["properties"] == {"z": {"type": "string"}}
+
+
+def test_tools_spec_copies_are_independent() -> None:
+    """Each payload gets its own tools array, so changes do not leak across requests."""
+    catalog = [_tool("a")]
+
+    first = openai_tools_spec(catalog)
+    first[0]["function"]["parameters"]["properties"]["y"] = {}
+    second = openai_tools_spec(catalog)
+
+    assert "y" not in second[0]["function"]["parameters"]["properties"]
+    assert "y" not in catalog[0].input_schema["properties"]
+    assert copy.deepcopy(second) == second
+    assert pickle.loads(pickle.dumps(second)) == second
@@ -0,0 +1,79 @@
+"""Unit tests for the client-side rate limiter."""
+
+from time import monotonic
+
+import pytest
+
+from hopeit_agents.model_client.client import AsyncModelClient, ModelClientError
+from hopeit_agents.model_client.models import (
+    CompletionConfig,
+    CompletionRequest,
+    Conversation,
+    Message,
+    Role,
+)
+from hopeit_agents.model_client.rate_limit import RateLimiter, estimate_tokens
+from hopeit_agents.model_client.settings import RateLimitSettings
+
+
+def test_estimate_tokens_includes_prompt_and_output() -> None:
+    payload = {"messages": [{"role": "user", "content": "x" * 400}], "max_tokens": 50}
+
+    estimated = estimate_tokens(payload)
+
+    assert 100 < estimated - 50 < 120
+
+
+async def test_acquire_waits_for_token_budget() -> None:
+    limiter = RateLimiter(RateLimitSettings(tokens_per_minute=6000, max_wait_seconds=5.0))
+
+    await limiter.acquire(6000)
+    started = monotonic()
+    await limiter.acquire(10)
+
+    assert 0.05 < monotonic() - started < 1.0
+
+
+async def test_acquire_fails_when_wait_exceeds_limit() -> None:
+    limiter = RateLimiter(RateLimitSettings(requests_per_minute=1, max_wait_seconds=0.1))
+
+    await limiter.acquire(1)
+    started = monotonic()
+    with pytest.raises(TimeoutError):
+        await limiter.acquire(1)
+
+    assert monotonic() - started < 0.1
+
+
+async def test_reconcile_returns_unused_tokens() -> None:
+    limiter = RateLimiter(RateLimitSettings(tokens_per_minute=6000, max_wait_seconds=0.0))
+
+    await limiter.acquire(6000)
+    limiter.reconcile(6000, 100)
+    await limiter.acquire(5000)
+
+    with pytest.raises(TimeoutError):
+        await limiter.acquire(5000)
+
+
+async def test_client_maps_exhausted_budget_to_429() -> None:
+    limiter = RateLimiter(RateLimitSettings(requests_per_minute=1, max_wait_seconds=0.0))
+    await limiter.acquire(1)
+    request = CompletionRequest(
+        conversation=Conversation(
+            conversation_id="conv-1", messages=[Message(role=Role.USER, content="hello")]
+        )
+    )
+
+    async with AsyncModelClient(
+        base_url="http://localhost:1",
+        api_version=None,
+        deployment_name=None,
+        api_key=None,
+        timeout_seconds=1.0,
+        rate_limiter=limiter,
+    ) as client:
+        with pytest.raises(ModelClientError) as exc_info:
+            await client.complete(request, CompletionConfig(model="m"))
+
+    assert exc_info.value.status == 429
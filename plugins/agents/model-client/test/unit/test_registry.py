@@ -0,0 +1,173 @@
+"""Unit tests for the pooled model client registry."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hopeit_agents.model_client import registry
+from hopeit_agents.model_client.models import (
+    CompletionConfig,
+    CompletionRequest,
+    Conversation,
+    Message,
+    Role,
+)
+from hopeit_agents.model_client.settings import ModelClientSettings
+
+
+def _completion_body() -> dict[str, Any]:
+    return {
+        "id": "resp-1",
+        "model": "test-model",
+        "created": 1700000000,
+        "choices": [
+            {"message": {"role": "assistant", "content": "hi"}, "finish_reason": "stop"},
+        ],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+
+
+@pytest.fixture(autouse=True)
+async def clean_registry() -> AsyncGenerator[None, None]:
+    yield
+    await registry.close_clients()
+
+
+@pytest.fixture
+async def provider() -> AsyncGenerator[TestServer, None]:
+    peers: list[Any] = []
+
+    async def chat_completions(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername") if request.transport else None)
+        return web.json_response(_completion_body())
+
+    app = web.Application()
+    app.router.add_post("/chat/completions", chat_completions)
+    app["peers"] = peers
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+def _settings(base_url: str, **kwargs: Any) -> ModelClientSettings:
+    return ModelClientSettings(api_base=base_url, default_model="test-model", **kwargs)
+
+
+def test_get_client_reuses_instance_per_settings_key() -> None:
+    settings = _settings("http://localhost:1")
+
+    first = registry.get_client("app.model_client", settings, "key")
+    second = registry.get_client("app.model_client", _settings("http://localhost:1"), "key")
+    other = registry.get_client("app.other_client", settings, "key")
+
+    assert first is second
+    assert first is not other
+
+
+def test_get_client_replaces_instance_when_settings_change() -> None:
+    first = registry.get_client("app.model_client", _settings("http://localhost:1"), "key")
+    second = registry.get_client(
+        "app.model_client", _settings("http://localhost:1", timeout_seconds=5.0), "key"
+    )
+    third = registry.get_client(
+        "app.model_client", _settings("http://localhost:1", timeout_seconds=5.0), "other-key"
+    )
+
+    assert first is not second
+    assert second is not third
+
+
+async def test_completions_reuse_pooled_connection(provider: TestServer) -> None:
+    client = registry.get_client(
+        "app.model_client", _settings(str(provider.make_url("/"))), api_key=None
+    )
+    request = CompletionRequest(
+        conversation=Conversation(
+            conversation_id="conv-1", messages=[Message(role=Role.USER, content="hello")]
+        )
+    )
+
+    for _ in range(3):
+        response = await client.complete(request, CompletionConfig(model="test-model"))
+        assert response.message.content == "hi"
+
+    peers = provider.app["peers"]
+    assert len(peers) == 3
+    assert len(set(peers)) == 1
+
+    session = client._session
+    assert session is not None and not session.closed
+
+    await registry.close_clients()
+
+    assert session.closed
+    assert client._session is None
+
+
+async def test_model_client_connections_stop_closes_clients(provider: TestServer) -> None:
+    client = registry.get_client(
+        "app.model_client", _settings(str(provider.make_url("/"))), api_key=None
+    )
+    session = client._get_session()
+
+    connections = registry.ModelClientConnections(MagicMock(), "model_client_pool")
+    assert await connections.start() is connections
+    await connections.stop()
+
+    assert session.closed
+    assert (
+        registry.get_client(
+            "app.model_client", _settings(str(provider.make_url("/"))), api_key=None
+        )
+        is not client
+    )
+
+
+async def test_replaced_clients_close_once_requests_finish() -> None:
+    release = asyncio.Event()
+
+    async def chat_completions(request: web.Request) -> web.Response:
+        await release.wait()
+        return web.json_response(_completion_body())
+
+    app = web.Application()
+    app.router.add_post("/chat/completions", chat_completions)
+    server = TestServer(app)
+    await server.start_server()
+    base_url = str(server.make_url("/"))
+    request = CompletionRequest(
+        conversation=Conversation(
+            conversation_id="conv-1", messages=[Message(role=Role.USER, content="hello")]
+        )
+    )
+    try:
+        idle = registry.get_client("app.idle_client", _settings(base_url), "key")
+        idle_session = idle._get_session()
+        busy = registry.get_client("app.model_client", _settings(base_url), "key")
+        task = asyncio.create_task(busy.complete(request, CompletionConfig(model="test-model")))
+        await asyncio.sleep(0.05)
+        busy_session = busy._session
+
+        registry.get_client("app.idle_client", _settings(base_url), "other-key")
+        registry.get_client("app.model_client", _settings(base_url), "other-key")
+        await asyncio.sleep(0.01)
+        assert idle_session.closed
+        assert busy_session is not None and not busy_session.closed
+        assert registry._retired == [busy]
+
+        release.set()
+        response = await task
+        await asyncio.sleep(0.01)
+    finally:
+        await server.close()
+
+    assert response.message.content == "hi"
+    assert busy_session.closed
+    registry.get_client("app.model_client", _settings(base_url), "key")
+    assert registry._retired == []
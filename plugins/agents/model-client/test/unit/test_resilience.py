@@ -0,0 +1,163 @@
+"""Unit tests for retries and circuit breaking of provider calls."""
+
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from typing import Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hopeit_agents.model_client.client import AsyncModelClient, ModelClientError
+from hopeit_agents.model_client.models import (
+    CompletionConfig,
+    CompletionRequest,
+    Conversation,
+    Message,
+    Role,
+)
+from hopeit_agents.model_client.rate_limit import RateLimiter
+from hopeit_agents.model_client.resilience import CircuitBreaker, backoff_delay, parse_retry_after
+from hopeit_agents.model_client.settings import (
+    CircuitBreakerSettings,
+    RateLimitSettings,
+    RetrySettings,
+)
+
+FAST_RETRY = RetrySettings(max_attempts=3, initial_backoff_seconds=0.01, max_backoff_seconds=1.0)
+
+
+@pytest.fixture
+async def provider() -> AsyncGenerator[TestServer, None]:
+    statuses: list[int] = []
+    calls: list[int] = []
+
+    async def chat_completions(request: web.Request) -> web.Response:
+        status = statuses.pop(0) if statuses else 200
+        calls.append(status)
+        if status == 502:
+            return web.Response(status=502, text="<html>Bad gateway</html>")
+        if status >= 400:
+            return web.json_response(
+                {"error": {"message": f"failed {status}"}},
+                status=status,
+                headers={"Retry-After": "0"},
+            )
+        return web.json_response(
+            {
+                "id": "resp-1",
+                "model": "test-model",
+                "choices": [
+                    {"message": {"role": "assistant", "content": "hi"}, "finish_reason": "stop"}
+                ],
+            }
+        )
+
+    app = web.Application()
+    app.router.add_post("/chat/completions", chat_completions)
+    app["statuses"] = statuses
+    app["calls"] = calls
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+def _client(server: TestServer, **kwargs: Any) -> AsyncModelClient:
+    return AsyncModelClient(
+        base_url=str(server.make_url("/")),
+        api_version=None,
+        deployment_name=None,
+        api_key=None,
+        timeout_seconds=5.0,
+        **kwargs,
+    )
+
+
+def _request() -> CompletionRequest:
+    return CompletionRequest(
+        conversation=Conversation(
+            conversation_id="conv-1", messages=[Message(role=Role.USER, content="hello")]
+        )
+    )
+
+
+def test_parse_retry_after_formats() -> None:
+    retry_at = datetime.now(UTC) + timedelta(seconds=30)
+
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert 25.0 < (parse_retry_after(format_datetime(retry_at, usegmt=True)) or 0.0) <= 30.0
+
+
+def test_backoff_delay_is_bounded_and_honors_retry_after() -> None:
+    settings = RetrySettings(initial_backoff_seconds=1.0, max_backoff_seconds=4.0)
+
+    assert 0.5 <= backoff_delay(settings, 1, None) <= 1.0
+    assert 2.0 <= backoff_delay(settings, 10, None) <= 4.0
+    assert backoff_delay(settings, 1, 3.0) == 3.0
+
+
+def test_circuit_breaker_opens_and_probes() -> None:
+    breaker = CircuitBreaker(CircuitBreakerSettings(failure_threshold=2, reset_timeout_seconds=0.0))
+
+    breaker.record_failure()
+    assert breaker.allow_request() and not breaker.is_open
+    breaker.record_failure()
+    assert breaker.is_open
+
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert not breaker.is_open and breaker.allow_request()
+
+
+async def test_retries_transient_errors(provider: TestServer) -> None:
+    provider.app["statuses"].extend([429, 502])
+
+    async with _client(provider, retry=FAST_RETRY) as client:
+        response = await client.complete(_request(), CompletionConfig(model="m"))
+
+    assert response.message.content == "hi"
+    assert provider.app["calls"] == [429, 502, 200]
+
+
+async def test_retries_take_rate_limit_budget(provider: TestServer) -> None:
+    provider.app["statuses"].extend([503, 503])
+    limiter = RateLimiter(RateLimitSettings(requests_per_minute=2, max_wait_seconds=0.0))
+
+    async with _client(provider, retry=FAST_RETRY, rate_limiter=limiter) as client:
+        with pytest.raises(ModelClientError) as exc_info:
+            await client.complete(_request(), CompletionConfig(model="m"))
+
+    assert exc_info.value.status == 429
+    assert provider.app["calls"] == [503, 503]
+
+
+async def test_fatal_errors_are_not_retried(provider: TestServer) -> None:
+    provider.app["statuses"].extend([400])
+
+    async with _client(provider, retry=FAST_RETRY) as client:
+        with pytest.raises(ModelClientError) as exc_info:
+            await client.complete(_request(), CompletionConfig(model="m"))
+
+    assert exc_info.value.status == 400
+    assert exc_info.value.message == "failed 400"
+    assert provider.app["calls"] == [400]
+
+
+async def test_circuit_breaker_fails_fast(provider: TestServer) -> None:
+    provider.app["statuses"].extend([503, 503, 503])
+
+    async with _client(
+        provider,
+        retry=FAST_RETRY,
+        circuit_breaker=CircuitBreakerSettings(failure_threshold=2, reset_timeout_seconds=60.0),
+    ) as client:
+        with pytest.raises(ModelClientError) as exc_info:
+            await client.complete(_request(), CompletionConfig(model="m"))
+
+    assert exc_info.value.message == "Model endpoint circuit breaker is open"
+    assert provider.app["calls"] == [503, 503]
@@ -19,6 +19,8 @@ from hopeit.server.logger import engine_logger
 from hopeit.server.names import spinalcase
 from pydantic import TypeAdapter
 
+from hopeit_agents.skills.models import SkillExecutionBackend
+
 logger = engine_logger()
 
 METHOD_MAPPING = {
@@ -35,9 +37,16 @@ def agent_skill(
     description: str | None = None,
     payload: PayloadDef,
     response: PayloadDef,
+    parallel: bool = True,
+    backend: SkillExecutionBackend = SkillExecutionBackend.INLINE,
 ) -> Callable[..., dict[str, Any]]:
-    """Build a deferred handler that renders the MCP spec for an event."""
-    return partial(_agent_skill, summary, description, payload, response)
+    """Build a deferred handler that renders the MCP spec for an event.
+
+    Set `parallel=False` for skills with side effects, so agents do not run them
+    concurrently with other skill calls. CPU-bound skills can set `backend` to run
+    in a thread or process pool instead of blocking the event loop.
+    """
+    return partial(_agent_skill, summary, description, payload, response, parallel, backend)
 
 
 def _agent_skill(
@@ -45,6 +54,8 @@ def _agent_skill(
     description: str | None,
     payload: PayloadDef,
     response: PayloadDef,
+    parallel: bool,
+    backend: SkillExecutionBackend,
     module: str,
     app_config: AppConfig,
     event_name: str,
@@ -54,6 +65,8 @@ def _agent_skill(
     method_spec: dict[str, Any] = {
         "summary": _method_summary(module, summary),
         "description": _method_description(module, description, summary),
+        "x-parallel": parallel,
+        "x-backend": backend.value,
     }
 
     event_config = app_config.events[event_name]
@@ -160,6 +173,10 @@ class SkillEventInfo:
     """An optional JSON Schema object defining the structure of the skill's output."""
     meta: dict[str, Any] | None = None
     """Additional optional metadata"""
+    parallel: bool = True
+    """Whether the skill can run concurrently with other skill calls"""
+    backend: SkillExecutionBackend = SkillExecutionBackend.INLINE
+    """Where the skill event runs"""
 
 
 def extract_app_skill_specs(
@@ -201,6 +218,8 @@ def extract_app_skill_specs(
                 output_schema=event_spec["responses"]["200"]["content"]["application/json"][
                     "schema"
                 ],
+                parallel=event_spec.get("x-parallel", True),
+                backend=SkillExecutionBackend(event_spec.get("x-backend", "inline")),
             )
 
 
@@ -0,0 +1,207 @@
+"""Thread and process pool backends running skill events off the event loop.
+
+Skills run inline on the event loop by default, so a CPU-bound skill blocks every
+other request served by the worker. Skills declaring a `thread` or `process`
+backend in their `__skill__` spec are executed by a warm executor instead: pools
+are created once per app and backend, and every worker keeps its own event loop
+and event handlers between calls. Payloads and results cross the executor
+boundary serialized as JSON with `Payload`.
+
+Events run in pool workers without the app engine, so they cannot write to
+streams, and in the process backend they cannot use app connections or state
+shared with the server process. To shut down the pools when the hopeit app stops,
+register `SkillExecutorsConnection` in the app `app_connections` section::
+
+    "app_connections": {
+      "skill_executors": {
+        "name": "hopeit-agents-skills",
+        "version": "0.1",
+        "client": "hopeit_agents.skills.executors.SkillExecutorsConnection"
+      }
+    }
+"""
+
+import asyncio
+import json
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any
+
+from hopeit.app.client import Client
+from hopeit.app.config import AppConfig, EventSettings
+from hopeit.app.context import EventContext
+from hopeit.dataobjects.payload import Payload
+from hopeit.server.events import EventHandler
+from hopeit.server.imports import find_event_handler
+from hopeit.server.steps import find_datatype_handler, split_event_stages
+
+from hopeit_agents.skills.api import SkillEventInfo
+from hopeit_agents.skills.models import SkillExecutionBackend, SkillsSettings
+
+__all__ = [
+    "execute_in_backend",
+    "shutdown_executors",
+    "SkillExecutorsConnection",
+]
+
+_executors: dict[tuple[SkillExecutionBackend, str], Executor] = {}
+
+# Worker state: apps available to the worker and event handlers built on first use
+_worker_apps: dict[str, AppConfig] = {}
+_worker_handlers: dict[tuple[str, str], tuple[EventHandler, type]] = {}
+_worker_local = threading.local()
+
+
+async def execute_in_backend(
+    skill_info: SkillEventInfo,
+    app_config: AppConfig,
+    payload: dict[str, Any],
+    context: EventContext,
+    settings: SkillsSettings,
+) -> dict[str, Any] | list[Any] | set[Any]:
+    """Execute a skill event in the executor of its backend and return the result.
+
+    The skill event runs with the event settings and tracking ids of `context`,
+    like inline skills. A process pool whose worker died is replaced on the next call.
+    """
+    key = (skill_info.backend, skill_info.app_key)
+    executor = _executors.get(key)
+    if executor is None:
+        executor = _create_executor(skill_info.backend, app_config, settings)
+        _executors[key] = executor
+    call = partial(
+        _execute_event,
+        skill_info.app_key,
+        skill_info.event_name,
+        Payload.to_json(payload),
+        context.settings,
+        context.track_ids,
+        context.auth_info,
+    )
+    try:
+        async with asyncio.timeout(context.settings.response_timeout):
+            result_json = await asyncio.get_running_loop().run_in_executor(executor, call)
+    except BrokenProcessPool:
+        if _executors.get(key) is executor:
+            del _executors[key]
+            executor.shutdown(wait=False)
+        raise
+    result: dict[str, Any] | list[Any] | set[Any] = json.loads(result_json)
+    return result
+
+
+def shutdown_executors() -> None:
+    """Shut down every executor, waiting for running skills to finish."""
+    executors = list(_executors.values())
+    _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _create_executor(
+    backend: SkillExecutionBackend, app_config: AppConfig, settings: SkillsSettings
+) -> Executor:
+    app_key = app_config.app_key()
+    if backend == SkillExecutionBackend.THREAD:
+        _init_worker(app_key, app_config)
+        return ThreadPoolExecutor(
+            max_workers=max(1, settings.thread_workers),
+            thread_name_prefix=f"skills-{app_key}",
+        )
+    if backend == SkillExecutionBackend.PROCESS:
+        workers = max(1, settings.process_workers)
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            # fork is unsafe with the threads of a running server
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(app_key, app_config),
+        )
+        # Start every worker now instead of on the first calls
+        for _ in range(workers):
+            executor.submit(_ready)
+        return executor
+    raise ValueError(f"Unsupported skill backend: {backend}")
+
+
+def _init_worker(app_key: str, app_config: AppConfig) -> None:
+    _worker_apps[app_key] = app_config
+
+
+def _ready() -> bool:
+    return True
+
+
+def _execute_event(
+    app_key: str,
+    event_name: str,
+    payload_json: str,
+    settings: EventSettings[Any],
+    track_ids: dict[str, str],
+    auth_info: dict[str, Any],
+) -> str:
+    """Run a skill event on the worker event loop, returning the result as JSON."""
+    app_config = _worker_apps[app_key]
+    handler, datatype = _event_handler(app_config, event_name)
+    context = EventContext(
+        app_config=app_config,
+        plugin_config=app_config,
+        event_name=event_name,
+        settings=settings,
+        track_ids=track_ids,
+        auth_info=auth_info,
+    )
+    loop: asyncio.AbstractEventLoop | None = getattr(_worker_local, "loop", None)
+    if loop is None:
+        loop = _worker_local.loop = asyncio.new_event_loop()
+    result = loop.run_until_complete(
+        _handle_event(handler, context, Payload.from_json(payload_json, datatype=datatype))
+    )
+    return Payload.to_json(result)
+
+
+def _event_handler(app_config: AppConfig, event_name: str) -> tuple[EventHandler, type]:
+    key = (app_config.app_key(), event_name)
+    entry = _worker_handlers.get(key)
+    if entry is None:
+        event_info = app_config.events[event_name]
+        impl = find_event_handler(
+            app_config=app_config, event_name=event_name, event_info=event_info
+        )
+        handler = EventHandler(
+            app_config=app_config,
+            plugins=[],
+            effective_events=split_event_stages(app_config.app, event_name, event_info, impl),
+            settings=app_config.effective_settings,  # type: ignore[arg-type]
+        )
+        datatype = find_datatype_handler(
+            app_config=app_config, event_name=event_name, event_info=event_info
+        )
+        entry = _worker_handlers.setdefault(key, (handler, datatype))
+    return entry
+
+
+async def _handle_event(handler: EventHandler, context: EventContext, payload: Any) -> Any:
+    result = None
+    async for item in handler.handle_async_event(context=context, query_args=None, payload=payload):
+        result = item
+    return result
+
+
+class SkillExecutorsConnection(Client):
+    """hopeit app connection that shuts down skill executors when the app stops."""
+
+    def __init__(self, app_config: AppConfig, app_connection: str) -> None:
+        self.app_key = app_config.app_key()
+        self.app_connection = app_connection
+
+    async def start(self) -> "SkillExecutorsConnection":
+        """Nothing to start: executors are created on the first skill call."""
+        return self
+
+    async def stop(self) -> None:
+        """Shut down skill executors."""
+        await asyncio.to_thread(shutdown_executors)
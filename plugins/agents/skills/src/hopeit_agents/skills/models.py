@@ -13,6 +13,14 @@ class SkillExecutionStatus(StrEnum):
     ERROR = "error"
 
 
+class SkillExecutionBackend(StrEnum):
+    """Where a skill event runs: on the event loop, a thread pool or a process pool."""
+
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
 @dataobject
 @dataclass
 class SkillDescriptor:
@@ -103,3 +111,5 @@ class SkillCallRecord:
 @dataclass
 class SkillsSettings:
     skills_generation_path: str = "./_skills"
+    thread_workers: int = 4
+    process_workers: int = 2
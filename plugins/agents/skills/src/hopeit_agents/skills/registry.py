@@ -1,16 +1,152 @@
+"""Process-wide registry of skills indexed by app key and skill name.
+
+Skills are registered once when an app starts (see `setup.init_skills`), but they
+are looked up and rendered on every agent request. The registry is kept as an
+immutable `SkillsSnapshot` replaced on each registration, so readers never copy
+it, and every entry holds its prompt description rendered at registration time.
+The snapshot `version` increases with every change and can key caches derived
+from the registered skills.
+
+The same skill name can be registered by several apps: entries are namespaced by
+app key, and lookups by name only return the skill registered first.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from hopeit.server.logger import engine_logger
+
 from hopeit_agents.skills.api import SkillEventInfo
 
-_skills: dict[str, SkillEventInfo] = {}
+__all__ = [
+    "RegisteredSkill",
+    "SkillsSnapshot",
+    "register_skill",
+    "snapshot",
+    "list_skills",
+    "find_skill",
+    "find_registered_skill",
+    "clear_skills",
+]
+
+logger = engine_logger()
+
+
+@dataclass(frozen=True)
+class RegisteredSkill:
+    """A registered skill with its prompt description rendered at registration time."""
+
+    info: SkillEventInfo
+    prompt_description: str
+    """Bullet line describing the skill in prompts, without its schema."""
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.info.app_key, self.info.skill_name
+
+
+@dataclass(frozen=True)
+class SkillsSnapshot:
+    """Immutable view of the registry at a given `version`."""
+
+    version: int = 0
+    skills: tuple[RegisteredSkill, ...] = ()
+    """Registered skills in registration order."""
+    by_key: Mapping[tuple[str, str], RegisteredSkill] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    by_name: Mapping[str, RegisteredSkill] = field(default_factory=lambda: MappingProxyType({}))
+    _selections: dict[tuple[str, ...] | None, tuple[SkillEventInfo, ...]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    def find(self, skill_name: str, *, app_key: str | None = None) -> RegisteredSkill | None:
+        """Return the skill registered as `skill_name`, by `app_key` when given."""
+        if app_key is None:
+            return self.by_name.get(skill_name)
+        return self.by_key.get((app_key, skill_name))
+
+    def select(self, skill_names: tuple[str, ...] | None = None) -> tuple[SkillEventInfo, ...]:
+        """Return the skills named in `skill_names` in registration order, or every skill.
+
+        Selections are memoized in the snapshot.
+        """
+        selection = self._selections.get(skill_names)
+        if selection is None:
+            names = None if skill_names is None else set(skill_names)
+            selection = tuple(
+                entry.info
+                for entry in self.skills
+                if names is None
+                or (entry.info.skill_name in names and self.by_name[entry.info.skill_name] is entry)
+            )
+            self._selections[skill_names] = selection
+        return selection
+
+
+_snapshot = SkillsSnapshot()
 
 
 def register_skill(skill_info: SkillEventInfo) -> None:
-    _skills[skill_info.skill_name] = skill_info
-    print(_skills)
+    """Add or replace the skill `skill_info.skill_name` of app `skill_info.app_key`."""
+    global _snapshot
+    entry = RegisteredSkill(
+        info=skill_info,
+        prompt_description=(
+            f"- {skill_info.skill_name}: "
+            f"{(skill_info.description or 'No description provided.').strip()}"
+        ),
+    )
+    current = _snapshot
+    by_key = dict(current.by_key)
+    replaced = by_key.get(entry.key)
+    by_key[entry.key] = entry
+    skills = tuple(entry if item is replaced else item for item in current.skills)
+    if replaced is None:
+        skills += (entry,)
+    by_name: dict[str, RegisteredSkill] = {}
+    for item in skills:
+        by_name.setdefault(item.info.skill_name, item)
+    if by_name[skill_info.skill_name] is not entry:
+        logger.warning(
+            __name__,
+            f"Skill {skill_info.skill_name} of app {skill_info.app_key} is already registered "
+            f"by app {by_name[skill_info.skill_name].info.app_key}, "
+            "lookups by name return the first one.",
+        )
+    _snapshot = SkillsSnapshot(
+        version=current.version + 1,
+        skills=skills,
+        by_key=MappingProxyType(by_key),
+        by_name=MappingProxyType(by_name),
+    )
+
+
+def snapshot() -> SkillsSnapshot:
+    """Return the current registry snapshot."""
+    return _snapshot
+
+
+def list_skills(app_key: str | None = None) -> tuple[SkillEventInfo, ...]:
+    """Return registered skills in registration order, of `app_key` when given."""
+    if app_key is None:
+        return _snapshot.select()
+    return tuple(entry.info for entry in _snapshot.skills if entry.info.app_key == app_key)
+
+
+def find_skill(skill_name: str, *, app_key: str | None = None) -> SkillEventInfo | None:
+    """Return the skill registered as `skill_name`, by `app_key` when given."""
+    entry = _snapshot.find(skill_name, app_key=app_key)
+    return None if entry is None else entry.info
 
 
-def list_skills() -> list[SkillEventInfo]:
-    return list(_skills.values())
+def find_registered_skill(skill_name: str, *, app_key: str | None = None) -> RegisteredSkill | None:
+    """Return the registry entry of `skill_name`, by `app_key` when given."""
+    return _snapshot.find(skill_name, app_key=app_key)
 
 
-def find_skill(skill_name: str) -> SkillEventInfo | None:
-    return _skills.get(skill_name)
+def clear_skills() -> None:
+    """Remove every registered skill."""
+    global _snapshot
+    _snapshot = SkillsSnapshot(version=_snapshot.version + 1)
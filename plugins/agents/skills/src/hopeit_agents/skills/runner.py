@@ -1,32 +1,133 @@
+"""Execution of skill events on the hopeit engine of the app implementing them.
+
+Skills are resolved once into a `SkillHandle` holding the app engine, a compiled
+validator for the payload datatype and a template of the skill `EventContext`, so
+executing a skill is a direct call to the event handler. `setup.init_skills`
+resolves the skills of an app when it starts; other skills are resolved on their
+first call.
+"""
+
+import asyncio
+import copy
+from datetime import UTC, datetime
 from typing import Any
 
+from hopeit.app.config import EventSettings
 from hopeit.app.context import EventContext
 from hopeit.dataobjects.payload import Payload
 from hopeit.server import runtime
 from hopeit.server.engine import AppEngine
 from hopeit.server.steps import find_datatype_handler
+from pydantic import TypeAdapter
 
+from hopeit_agents.skills import executors
 from hopeit_agents.skills.api import SkillEventInfo
+from hopeit_agents.skills.models import SkillExecutionBackend, SkillsSettings
+
+__all__ = ["SkillHandle", "resolve_skill", "execute_skill", "clear_skill_handles"]
+
+_TRACK_FIELDS = ("track.operation_id", "track.client_app_key", "track.client_event_name")
+
+
+class SkillHandle:
+    """Skill event resolved against its app engine, ready to be executed."""
+
+    def __init__(self, skill_info: SkillEventInfo, app_engine: AppEngine) -> None:
+        app_config = app_engine.app_config
+        self.skill_info = skill_info
+        self.app_engine = app_engine
+        self.datatype: type = find_datatype_handler(
+            app_config=app_config,
+            event_name=skill_info.event_name,
+            event_info=skill_info.event_info,
+        )
+        self.validator: TypeAdapter[Any] = TypeAdapter(self.datatype)
+        event_info = app_engine.effective_events.get(skill_info.event_name)
+        # Events writing to streams go through the engine, which writes the results
+        self.direct = event_info is not None and event_info.write_stream is None
+        self._track_fields = (*_TRACK_FIELDS, *app_config.engine.track_headers)
+        self._context = EventContext(
+            app_config=app_config,
+            plugin_config=app_config,
+            event_name=skill_info.event_name,
+            settings=EventSettings(),  # replaced by the caller settings
+            track_ids={},
+            auth_info={},
+        )
+
+    def context(self, context: EventContext) -> EventContext:
+        """Return the context of the skill event called from `context`.
+
+        Same as creating an `EventContext` for the skill event, reusing the fields
+        that do not change between calls.
+        """
+        skill_context = copy.copy(self._context)
+        skill_context.settings = context.settings
+        skill_context.creation_ts = datetime.now(tz=UTC)
+        skill_context.auth_info = context.auth_info
+        track_ids = context.track_ids
+        skill_context.track_ids = {
+            **{key: track_ids[key] for key in self._track_fields if key in track_ids},
+            **self._context.track_ids,
+        }
+        return skill_context
+
+    async def execute(self, payload: dict[str, Any], context: EventContext) -> Any:
+        """Validate `payload` and execute the skill event, returning its result."""
+        skill_context = self.context(context)
+        event_payload = self.validator.validate_python(payload)
+        if not self.direct:
+            return await self.app_engine.execute(
+                context=skill_context, query_args=None, payload=event_payload
+            )
+        event_handler = self.app_engine.event_handler
+        assert event_handler is not None, "event_handler not created. Call `start()`."
+        result = None
+        async with asyncio.timeout(skill_context.settings.response_timeout):
+            async for item in event_handler.handle_async_event(
+                context=skill_context, query_args=None, payload=event_payload
+            ):
+                result = item
+        return result
+
+
+_handles: dict[tuple[str, str], SkillHandle] = {}
+
+
+def resolve_skill(skill_info: SkillEventInfo, app_engine: AppEngine | None = None) -> SkillHandle:
+    """Resolve `skill_info` into a handle, replacing the previous one of the same event.
+
+    `app_engine` defaults to the running engine of `skill_info.app_key`.
+    """
+    if app_engine is None:
+        app_engine = runtime.server.app_engines[skill_info.app_key]
+    handle = SkillHandle(skill_info, app_engine)
+    _handles[(skill_info.app_key, skill_info.event_name)] = handle
+    return handle
 
 
 async def execute_skill(
-    skill_info: SkillEventInfo, payload: dict[str, Any], context: EventContext
+    skill_info: SkillEventInfo,
+    payload: dict[str, Any],
+    context: EventContext,
+    settings: SkillsSettings | None = None,
 ) -> dict[str, Any] | list[Any] | set[Any]:
-    app_engine: AppEngine = runtime.server.app_engines[skill_info.app_key]
-    datatype = find_datatype_handler(
-        app_config=app_engine.app_config,
-        event_name=skill_info.event_name,
-        event_info=skill_info.event_info,
-    )
-    skill_context = EventContext(
-        app_config=app_engine.app_config,
-        plugin_config=app_engine.app_config,
-        event_name=skill_info.event_name,
-        settings=context.settings,
-        track_ids=context.track_ids,
-        auth_info=context.auth_info,
-    )
-    result = await app_engine.execute(
-        context=skill_context, query_args=None, payload=Payload.from_obj(payload, datatype=datatype)
-    )
+    """Execute the skill event with `payload`, called from `context`."""
+    handle = _handles.get((skill_info.app_key, skill_info.event_name))
+    if handle is None or handle.skill_info is not skill_info:
+        handle = resolve_skill(skill_info)
+    if skill_info.backend != SkillExecutionBackend.INLINE:
+        return await executors.execute_in_backend(
+            skill_info,
+            handle.app_engine.app_config,
+            payload,
+            context,
+            settings or SkillsSettings(),
+        )
+    result = await handle.execute(payload, context)
     return Payload.to_obj(result)
+
+
+def clear_skill_handles() -> None:
+    """Forget resolved skill handles."""
+    _handles.clear()
@@ -2,7 +2,7 @@ from hopeit.app.context import EventContext
 from hopeit.app.logger import app_extra_logger
 from hopeit.server import runtime
 
-from hopeit_agents.skills import registry
+from hopeit_agents.skills import registry, runner
 from hopeit_agents.skills.api import extract_app_skill_specs
 
 __steps__ = ["init_skills"]
@@ -27,3 +27,4 @@ async def init_skills(payload: None, context: EventContext) -> None:
     specs = extract_app_skill_specs(app_config, plugin=None)
     for spec in specs:
         registry.register_skill(spec)
+        runner.resolve_skill(spec, app_engine)
@@ -0,0 +1,65 @@
+"""Unit tests for the skills registry."""
+
+from collections.abc import Iterator
+
+import pytest
+from hopeit.app.config import EventDescriptor, EventType
+
+from hopeit_agents.skills import registry
+from hopeit_agents.skills.api import SkillEventInfo
+
+
+@pytest.fixture(autouse=True)
+def empty_registry() -> Iterator[None]:
+    registry.clear_skills()
+    yield
+    registry.clear_skills()
+
+
+def _skill(app_key: str, skill_name: str, description: str = "Adds numbers. ") -> SkillEventInfo:
+    return SkillEventInfo(
+        app_key=app_key,
+        event_name=f"skills.{skill_name}",
+        event_info=EventDescriptor(type=EventType.POST),
+        skill_name=skill_name,
+        title=skill_name,
+        summary=None,
+        description=description,
+        input_schema={"type": "object"},
+    )
+
+
+def test_skills_are_namespaced_by_app_key() -> None:
+    first, second = _skill("app1", "sum"), _skill("app2", "sum")
+    registry.register_skill(first)
+    registry.register_skill(second)
+
+    assert registry.find_skill("sum") is first
+    assert registry.find_skill("sum", app_key="app2") is second
+    assert registry.list_skills() == (first, second)
+    assert registry.list_skills("app2") == (second,)
+    assert registry.snapshot().select(("sum", "missing")) == (first,)
+
+
+def test_snapshots_are_immutable_and_versioned() -> None:
+    registry.register_skill(_skill("app1", "sum"))
+    before = registry.snapshot()
+
+    replacement = _skill("app1", "sum", description="Adds two numbers.")
+    registry.register_skill(replacement)
+    after = registry.snapshot()
+
+    assert after.version == before.version + 1
+    assert before.find("sum") is not None and before.find("sum") is not after.find("sum")
+    assert registry.list_skills() == (replacement,)
+    with pytest.raises(TypeError):
+        after.by_key[("app1", "other")] = after.skills[0]  # type: ignore[index]
+
+
+def test_registered_skills_hold_prompt_descriptions() -> None:
+    registry.register_skill(_skill("app1", "sum"))
+
+    entry = registry.find_registered_skill("sum", app_key="app1")
+
+    assert entry is not None
+    assert entry.prompt_description == "- sum: Adds numbers."
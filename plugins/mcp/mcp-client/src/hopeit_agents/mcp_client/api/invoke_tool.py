@@ -1,5 +1,7 @@
 """Invoke an MCP tool and return its result."""
 
+from typing import Any
+
 from hopeit.app.api import event_api
 from hopeit.app.context import EventContext
 from hopeit.app.logger import app_extra_logger
@@ -41,9 +43,17 @@ async def invoke_tool(args: ToolInvocation, context: EventContext) -> ToolExecut
         )
         raise
 
+    metrics_extra: dict[str, Any] = {}
+    if client.result_cache is not None:
+        cache_stats = client.result_cache.stats
+        metrics_extra.update(
+            cache_hits=cache_stats.hits,
+            cache_misses=cache_stats.misses,
+            cache_saved_latency_ms=round(cache_stats.saved_latency_ms, 3),
+        )
     logger.info(
         context,
         "mcp_invoke_tool_success",
-        extra=extra(tool_name=args.tool_name, status=result.status.value),
+        extra=extra(tool_name=args.tool_name, status=result.status.value, **metrics_extra),
     )
     return result
@@ -0,0 +1,58 @@
+"""Invoke several MCP tools in one request and return their results.
+
+Calls run concurrently over the pooled sessions of the configured server, up to
+the requested concurrency. Results are returned in invocation order; failed calls
+are reported as error results instead of failing the whole batch.
+"""
+
+from time import monotonic
+
+from hopeit.app.api import event_api
+from hopeit.app.context import EventContext
+from hopeit.app.logger import app_extra_logger
+
+from hopeit_agents.mcp_client.client import MCPClient
+from hopeit_agents.mcp_client.models import (
+    MCPClientConfig,
+    ToolExecutionStatus,
+    ToolInvocationBatch,
+    ToolInvocationBatchResult,
+)
+from hopeit_agents.mcp_client.settings import build_environment
+
+__steps__ = ["invoke_tools"]
+
+__api__ = event_api(
+    summary="hopeit_agents MCP client: invoke tools",
+    payload=(ToolInvocationBatch, "Tool invocations and concurrency override"),
+    responses={
+        200: (ToolInvocationBatchResult, "Tool execution results in invocation order"),
+    },
+)
+
+logger, extra = app_extra_logger()
+
+
+async def invoke_tools(
+    payload: ToolInvocationBatch, context: EventContext
+) -> ToolInvocationBatchResult:
+    """Invoke the requested tools using MCP."""
+    config = context.settings(key="mcp_client", datatype=MCPClientConfig)
+    env = build_environment(config, context.env)
+    client = MCPClient(config=config, env=env)
+
+    max_concurrency = payload.max_concurrency or config.batch_max_concurrency
+    started = monotonic()
+    results = await client.call_tools(payload.invocations, max_concurrency=max_concurrency)
+
+    logger.info(
+        context,
+        "mcp_invoke_tools",
+        extra=extra(
+            invocations=len(results),
+            errors=sum(1 for result in results if result.status is ToolExecutionStatus.ERROR),
+            max_concurrency=max_concurrency,
+            total_ms=round((monotonic() - started) * 1000.0, 3),
+        ),
+    )
+    return ToolInvocationBatchResult(results=results)
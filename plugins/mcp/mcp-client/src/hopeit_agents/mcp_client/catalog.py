@@ -0,0 +1,93 @@
+"""Process-wide cache of MCP server tool catalogs keyed by server.
+
+Clients are created per request, so tool catalogs are cached at module scope to
+be shared by every client talking to the same server. Entries are fresh for
+`tool_cache_seconds`. After that, and for up to `tool_cache_stale_seconds` more,
+the cached catalog is served while a single background refresh updates it.
+Concurrent requests for a missing catalog share one `tools/list` request, and a
+`notifications/tools/list_changed` from the server drops the cached catalog.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import monotonic
+
+from hopeit_agents.mcp_client.models import MCPClientConfig, ToolDescriptor
+
+__all__ = ["get_tools", "invalidate_tools", "clear_tool_catalogs"]
+
+ToolsFetcher = Callable[[], Awaitable[list[ToolDescriptor]]]
+
+
+@dataclass
+class _CatalogEntry:
+    tools: list[ToolDescriptor]
+    fetched_at: float
+
+
+_entries: dict[str, _CatalogEntry] = {}
+_refreshing: dict[str, asyncio.Task[list[ToolDescriptor]]] = {}
+_generations: dict[str, int] = {}
+
+
+async def get_tools(key: str, config: MCPClientConfig, fetch: ToolsFetcher) -> list[ToolDescriptor]:
+    """Return the tool catalog of the server `key`, calling `fetch` when needed.
+
+    A `tool_cache_seconds` of zero or less disables caching.
+    """
+    if config.tool_cache_seconds <= 0:
+        return await fetch()
+
+    entry = _entries.get(key)
+    if entry is not None:
+        age = monotonic() - entry.fetched_at
+        if age < config.tool_cache_seconds:
+            return entry.tools
+        if age < config.tool_cache_seconds + config.tool_cache_stale_seconds:
+            _refresh(key, fetch)
+            return entry.tools
+    return await asyncio.shield(_refresh(key, fetch))
+
+
+def invalidate_tools(key: str) -> None:
+    """Drop the cached catalog of the server `key`, ignoring refreshes in progress."""
+    _entries.pop(key, None)
+    _generations[key] = _generations.get(key, 0) + 1
+    _refreshing.pop(key, None)
+
+
+async def clear_tool_catalogs() -> None:
+    """Drop every cached catalog and cancel background refreshes."""
+    tasks = list(_refreshing.values())
+    _entries.clear()
+    _refreshing.clear()
+    _generations.clear()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _refresh(key: str, fetch: ToolsFetcher) -> asyncio.Task[list[ToolDescriptor]]:
+    """Return the refresh in progress for `key`, starting one if needed."""
+    task = _refreshing.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_and_store(key, fetch, _generations.get(key, 0)))
+        _refreshing[key] = task
+        task.add_done_callback(lambda done: _refresh_done(key, done))
+    return task
+
+
+async def _fetch_and_store(key: str, fetch: ToolsFetcher, generation: int) -> list[ToolDescriptor]:
+    tools = await fetch()
+    # Skip storing a catalog listed before the server announced a change
+    if _generations.get(key, 0) == generation:
+        _entries[key] = _CatalogEntry(tools=tools, fetched_at=monotonic())
+    return tools
+
+
+def _refresh_done(key: str, task: asyncio.Task[list[ToolDescriptor]]) -> None:
+    if _refreshing.get(key) is task:
+        del _refreshing[key]
+    if not task.cancelled():
+        task.exception()  # background refresh errors keep serving the stale catalog
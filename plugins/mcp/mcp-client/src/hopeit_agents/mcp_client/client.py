@@ -1,24 +1,46 @@
 """Async client that delegates MCP tool operations to the official SDK."""
 
 import asyncio
+import hashlib
+import json
 import uuid
-from collections.abc import AsyncIterator, Mapping
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from itertools import islice
 from time import monotonic
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
+import anyio
 from mcp import ClientSession, McpError, StdioServerParameters, stdio_client, types
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.session import RequestResponder
 
+from hopeit_agents.mcp_client.catalog import get_tools, invalidate_tools
 from hopeit_agents.mcp_client.models import (
     MCPClientConfig,
     ToolAnnotations,
     ToolDescriptor,
     ToolExecutionResult,
     ToolExecutionStatus,
+    ToolInvocation,
+    ToolResultMode,
     Transport,
 )
+from hopeit_agents.mcp_client.pool import MCPSessionPool, get_pool
+from hopeit_agents.mcp_client.result_cache import (
+    ToolResultCache,
+    get_result_cache,
+    tool_result_key,
+)
+
+_T = TypeVar("_T")
+
+# Error code the SDK HTTP transport reports when the server no longer knows the session
+_SESSION_TERMINATED = 32600
+
+# Keys of structured objects looked up in text items before parsing them as JSON
+_CANDIDATE_KEYS = 8
 
 
 @dataclass
@@ -38,36 +60,31 @@ class MCPClient:
     def __init__(self, config: MCPClientConfig, env: Mapping[str, str] | None = None) -> None:
         self._config = config
         self._env = dict(env or {})
-        self._tools_cache: tuple[float, list[ToolDescriptor]] | None = None
 
     async def list_tools(self) -> list[ToolDescriptor]:
-        """Return cached list of tools when possible, otherwise query MCP server."""
-        cache = self._tools_cache
-        now = monotonic()
-        if cache and now - cache[0] < self._config.tool_cache_seconds:
-            return cache[1]
+        """Return the server tools from the shared catalog cache, listing them when needed."""
+        return await get_tools(self.server_key(), self._config, self._fetch_tools)
 
-        async with self._session() as session:
-            try:
-                result = await asyncio.wait_for(
-                    session.list_tools(),
-                    timeout=self._config.list_timeout_seconds,
-                )
-            except TimeoutError as exc:
-                raise MCPClientError("Timed out listing tools") from exc
-            except McpError as exc:  # pragma: no cover - depends on SDK runtime
-                raise MCPClientError(
-                    "MCP protocol error while listing tools",
-                    details={
-                        "code": exc.error.code,
-                        "message": exc.error.message,
-                        "data": exc.error.data,
-                    },
-                ) from exc
-
-        descriptors = [self._tool_from_mcp(tool) for tool in result.tools]
-        self._tools_cache = (monotonic(), descriptors)
-        return descriptors
+    async def _fetch_tools(self) -> list[ToolDescriptor]:
+        """Query the MCP server for its tools."""
+        try:
+            result = await self._request(
+                lambda session: session.list_tools(),
+                timeout=self._config.list_timeout_seconds,
+            )
+        except TimeoutError as exc:
+            raise MCPClientError("Timed out listing tools") from exc
+        except McpError as exc:  # pragma: no cover - depends on SDK runtime
+            raise MCPClientError(
+                "MCP protocol error while listing tools",
+                details={
+                    "code": exc.error.code,
+                    "message": exc.error.message,
+                    "data": exc.error.data,
+                },
+            ) from exc
+
+        return [self._tool_from_mcp(tool) for tool in result.tools]
 
     async def call_tool(
         self,
@@ -77,48 +94,200 @@ class MCPClient:
         call_id: str | None = None,
         session_id: str | None = None,
     ) -> ToolExecutionResult:
-        """Invoke a tool by name passing the provided arguments."""
+        """Invoke a tool by name passing the provided arguments.
+
+        When the result cache is enabled, results of cacheable tools are served from
+        the cache for identical arguments.
+        """
         call_id = call_id or str(uuid.uuid4())
 
-        async with self._session() as session:
+        cache = self.result_cache
+        ttl_seconds = 0.0 if cache is None else await self._result_ttl(tool_name)
+        cache_key = ""
+        if cache is not None and ttl_seconds > 0:
+            cache_key = tool_result_key(self.server_key(), tool_name, payload)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return replace(cached, call_id=call_id, session_id=session_id)
+
+        started = monotonic()
+        try:
+            result = await self._request(
+                lambda session: session.call_tool(tool_name, payload),
+                timeout=self._config.call_timeout_seconds,
+            )
+        except TimeoutError as exc:
+            raise MCPClientError(f"Timed out calling tool '{tool_name}'") from exc
+        except McpError as exc:  # pragma: no cover - depends on SDK runtime
+            raise MCPClientError(
+                f"MCP protocol error calling tool '{tool_name}'",
+                details={
+                    "code": exc.error.code,
+                    "message": exc.error.message,
+                    "data": exc.error.data,
+                },
+            ) from exc
+
+        tool_result = self._tool_result_from_mcp(
+            tool_name,
+            result,
+            call_id=call_id,
+            session_id=session_id,
+            mode=self._config.result_mode,
+        )
+        if cache is not None and ttl_seconds > 0 and not result.isError:
+            cache.put(
+                cache_key,
+                tool_result,
+                ttl_seconds=ttl_seconds,
+                latency_ms=(monotonic() - started) * 1000.0,
+            )
+        return tool_result
+
+    async def call_tools(
+        self,
+        invocations: list[ToolInvocation],
+        *,
+        max_concurrency: int,
+        session_id: str | None = None,
+    ) -> list[ToolExecutionResult]:
+        """Invoke several tools concurrently, returning results in invocation order.
+
+        At most `max_concurrency` calls are in flight at the same time; they are
+        multiplexed over the same pooled session up to the pool per-session limit.
+        A failed call is returned as an error result instead of failing the batch.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(invocation: ToolInvocation) -> ToolExecutionResult:
+            call_id = invocation.call_id or str(uuid.uuid4())
+            call_session_id = invocation.session_id or session_id
+            async with semaphore:
+                try:
+                    return await self.call_tool(
+                        invocation.tool_name,
+                        invocation.payload,
+                        call_id=call_id,
+                        session_id=call_session_id,
+                    )
+                except Exception as exc:
+                    return ToolExecutionResult(
+                        call_id=call_id,
+                        tool_name=invocation.tool_name,
+                        status=ToolExecutionStatus.ERROR,
+                        error_message=exc.message if isinstance(exc, MCPClientError) else repr(exc),
+                        session_id=call_session_id,
+                    )
+
+        return list(await asyncio.gather(*(run(invocation) for invocation in invocations)))
+
+    @property
+    def result_cache(self) -> ToolResultCache | None:
+        """The shared tool result cache of the configured server, when enabled."""
+        if not self._config.result_cache.enabled:
+            return None
+        return get_result_cache(self.server_key(), self._config.result_cache)
+
+    async def _result_ttl(self, tool_name: str) -> float:
+        """Return how long results of `tool_name` can be cached, 0 if they can't."""
+        settings = self._config.result_cache
+        ttl_seconds = settings.tool_ttl_seconds.get(tool_name)
+        if ttl_seconds is not None:
+            return ttl_seconds
+        try:
+            tools = await self.list_tools()
+        except MCPClientError:
+            return 0.0
+        for tool in tools:
+            if tool.name == tool_name:
+                hints = tool.annotations
+                # Idempotent writes must still run: they need an explicit per-tool TTL
+                if hints is not None and hints.readOnlyHint:
+                    return settings.ttl_seconds
+                break
+        return 0.0
+
+    async def _request(
+        self, operation: Callable[[ClientSession], Awaitable[_T]], *, timeout: float
+    ) -> _T:
+        """Run `operation` on a pooled session, or on a new session when pooling is off."""
+        pool = self._pool()
+        if pool is None:
+            async with self._session() as session:
+                return await asyncio.wait_for(operation(session), timeout=timeout)
+
+        async with pool.lease() as pooled:
             try:
-                result = await asyncio.wait_for(
-                    session.call_tool(tool_name, payload),
-                    timeout=self._config.call_timeout_seconds,
-                )
-            except TimeoutError as exc:
-                raise MCPClientError(f"Timed out calling tool '{tool_name}'") from exc
-            except McpError as exc:  # pragma: no cover - depends on SDK runtime
-                raise MCPClientError(
-                    f"MCP protocol error calling tool '{tool_name}'",
-                    details={
-                        "code": exc.error.code,
-                        "message": exc.error.message,
-                        "data": exc.error.data,
-                    },
-                ) from exc
-
-        return self._tool_result_from_mcp(tool_name, result, call_id=call_id, session_id=session_id)
+                return await asyncio.wait_for(operation(pooled.session), timeout=timeout)
+            except McpError as exc:
+                if exc.error.code not in (_SESSION_TERMINATED, types.CONNECTION_CLOSED):
+                    raise
+                pooled.discard()
+                if exc.error.code == types.CONNECTION_CLOSED:
+                    # The connection or server process died while handling the request,
+                    # which might have been executed: do not retry
+                    raise
+            except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+                # The transport closed before the request was sent, e.g. the server exited
+                pooled.discard()
+        # The request was not handled: retry once, initializing a new session if needed
+        pool.require_health_check()
+        async with pool.lease() as pooled:
+            return await asyncio.wait_for(operation(pooled.session), timeout=timeout)
+
+    def _pool(self) -> MCPSessionPool | None:
+        """Return the shared session pool for the configured server, if pooling applies."""
+        if not self._config.session_pool.enabled:
+            return None
+        return get_pool(self.server_key(), self._config, self._env, self._session)
+
+    def server_key(self) -> str:
+        """Identify the configured server to share sessions and tool catalogs."""
+        if self._config.transport is Transport.HTTP:
+            return self._http_url()
+        # Env values are hashed, so servers started with different secrets do not share
+        # caches and the secrets are not kept in cache keys
+        env_hash = hashlib.sha256(json.dumps(sorted(self._env.items())).encode("utf-8")).hexdigest()
+        return f"{self._config.transport.value}:" + json.dumps(
+            [self._config.command, self._config.args, self._config.cwd, env_hash]
+        )
+
+    async def _on_server_message(
+        self,
+        message: RequestResponder[types.ServerRequest, types.ClientResult]
+        | types.ServerNotification
+        | Exception,
+    ) -> None:
+        """Drop the cached tool catalog when the server announces tool changes."""
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            invalidate_tools(self.server_key())
+
+    def _http_url(self) -> str:
+        """Return the MCP endpoint URL for the HTTP transport."""
+        url = self._config.url
+        if not url:
+            host = self._config.host
+            port = self._config.port
+            if not host or port is None:
+                raise MCPClientError("HTTP transport requires either a URL or host and port")
+            url = f"http://{host}:{int(port)}/mcp"
+        return url
 
     @asynccontextmanager
     async def _session(self) -> AsyncIterator[ClientSession]:
         """Yield an initialised MCP client session using the configured transport."""
         transport = self._config.transport
         if transport is Transport.HTTP:
-            url = self._config.url
-            if not url:
-                host = self._config.host
-                port = self._config.port
-                if not host or port is None:
-                    raise MCPClientError("HTTP transport requires either a URL or host and port")
-                url = f"http://{host}:{int(port)}/mcp"
-
             async with streamablehttp_client(
-                url,
+                self._http_url(),
                 timeout=self._config.list_timeout_seconds,
                 sse_read_timeout=self._config.call_timeout_seconds,
             ) as (read_stream, write_stream, _):
-                async with ClientSession(read_stream, write_stream) as session:
+                async with ClientSession(
+                    read_stream, write_stream, message_handler=self._on_server_message
+                ) as session:
                     await session.initialize()
                     yield session
             return
@@ -138,7 +307,9 @@ class MCPClient:
         )
 
         async with stdio_client(params) as (read, write):
-            async with ClientSession(read, write) as session:
+            async with ClientSession(
+                read, write, message_handler=self._on_server_message
+            ) as session:
                 await session.initialize()
                 yield session
 
@@ -161,16 +332,18 @@ class MCPClient:
 
     @staticmethod
     def _tool_result_from_mcp(
-        tool_name: str, result: types.CallToolResult, *, call_id: str, session_id: str | None
+        tool_name: str,
+        result: types.CallToolResult,
+        *,
+        call_id: str,
+        session_id: str | None,
+        mode: ToolResultMode = ToolResultMode.FULL,
     ) -> ToolExecutionResult:
-        """Convert an MCP tool response into the high-level execution result schema."""
-        content: list[dict[str, Any]] = []
-        for item in result.content:
-            if hasattr(item, "model_dump"):
-                content.append(item.model_dump(mode="json"))
-            else:
-                content.append({"type": item.__class__.__name__})
+        """Convert an MCP tool response into the high-level execution result schema.
 
+        In lean mode `raw_result` is not set, and text content repeating the structured
+        content as JSON is dropped, so the tool output is held only once.
+        """
         structured: dict[str, Any] | list[Any] | None
         structured_raw = getattr(result, "structuredContent", None)
         if structured_raw is None:
@@ -180,6 +353,16 @@ class MCPClient:
         else:
             structured = cast(dict[str, Any] | list[Any], structured_raw)
 
+        lean = mode is ToolResultMode.LEAN
+        content: list[dict[str, Any]] = []
+        for item in result.content:
+            if lean and structured is not None and _repeats_structured(item, structured):
+                continue
+            if hasattr(item, "model_dump"):
+                content.append(item.model_dump(mode="json"))
+            else:
+                content.append({"type": item.__class__.__name__})
+
         error_message: str | None = None
         if result.isError:
             for item in result.content:
@@ -194,6 +377,28 @@ class MCPClient:
             content=content,
             structured_content=structured,
             error_message=error_message,
-            raw_result=result.model_dump(mode="json"),
+            raw_result=None if lean else result.model_dump(mode="json"),
             session_id=session_id,
         )
+
+
+def _repeats_structured(item: Any, structured: dict[str, Any] | list[Any]) -> bool:
+    """Whether a content item is the text rendering of the structured content.
+
+    Texts are only parsed when their brackets, and for objects their first keys,
+    match the structured content.
+    """
+    if not isinstance(item, types.TextContent):
+        return False
+    opening, closing = ("{", "}") if isinstance(structured, dict) else ("[", "]")
+    text = item.text
+    if not text.startswith(opening) or not text[-16:].rstrip().endswith(closing):
+        return False
+    if isinstance(structured, dict) and any(
+        json.dumps(key) not in text for key in islice(structured, _CANDIDATE_KEYS)
+    ):
+        return False
+    try:
+        return bool(json.loads(text) == structured)
+    except ValueError:
+        return False
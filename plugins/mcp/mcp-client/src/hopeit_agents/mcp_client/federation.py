@@ -0,0 +1,129 @@
+"""MCP client federating the tools of several MCP servers.
+
+`FederatedMCPClient` lists the tools of every configured server concurrently and
+merges them into a single catalog with a tool name to server index, so tool calls
+are routed to the server exposing the tool with a dictionary lookup. When two
+servers expose a tool with the same name, the server listed first wins.
+
+A server that fails to list its tools only degrades its own tools: the tools it
+listed before, if any, are kept, and the error is reported in `errors`.
+"""
+
+import asyncio
+from collections.abc import Mapping
+from typing import Any
+
+from hopeit_agents.mcp_client.client import MCPClient, MCPClientError
+from hopeit_agents.mcp_client.models import MCPClientConfig, ToolDescriptor, ToolExecutionResult
+from hopeit_agents.mcp_client.settings import build_environment
+
+__all__ = ["FederatedMCPClient", "get_federated_client", "clear_federated_clients"]
+
+
+class FederatedMCPClient:
+    """Routes tool calls to one of several MCP servers by tool name."""
+
+    def __init__(
+        self,
+        servers: Mapping[str, MCPClientConfig],
+        context_env: Mapping[str, Any] | None = None,
+    ) -> None:
+        self._clients = {
+            name: MCPClient(config=config, env=build_environment(config, context_env or {}))
+            for name, config in servers.items()
+        }
+        self._single = next(iter(self._clients)) if len(self._clients) == 1 else None
+        self._server_tools: dict[str, list[ToolDescriptor]] = {}
+        self._index: dict[str, str] = {}
+        self._errors: dict[str, MCPClientError] = {}
+
+    @property
+    def errors(self) -> dict[str, MCPClientError]:
+        """Errors of servers that failed the last tool listing, by server name."""
+        return dict(self._errors)
+
+    def server_for(self, tool_name: str) -> str | None:
+        """Return the name of the server exposing `tool_name`, if indexed."""
+        return self._index.get(tool_name)
+
+    async def list_tools(self) -> list[ToolDescriptor]:
+        """List the tools of every server concurrently and rebuild the routing index."""
+        names = list(self._clients)
+        results = await asyncio.gather(
+            *(self._clients[name].list_tools() for name in names), return_exceptions=True
+        )
+
+        errors: dict[str, MCPClientError] = {}
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, MCPClientError):
+                errors[name] = result
+            elif isinstance(result, BaseException):
+                errors[name] = MCPClientError(
+                    f"Failed listing tools of server '{name}'", details={"error": repr(result)}
+                )
+            else:
+                self._server_tools[name] = result
+
+        tools: list[ToolDescriptor] = []
+        index: dict[str, str] = {}
+        for name in names:
+            for tool in self._server_tools.get(name, []):
+                if tool.name not in index:
+                    index[tool.name] = name
+                    tools.append(tool)
+        self._index, self._errors = index, errors
+        return tools
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        payload: dict[str, Any] | None,
+        *,
+        call_id: str | None = None,
+        session_id: str | None = None,
+    ) -> ToolExecutionResult:
+        """Invoke a tool on the server exposing it.
+
+        The index is refreshed once when the tool is not indexed, in case it was
+        added to a server after the last listing. With a single server, calls are
+        sent to it without looking up the index.
+        """
+        server = self._single or self._index.get(tool_name)
+        if server is None:
+            await self.list_tools()
+            server = self._index.get(tool_name)
+            if server is None:
+                raise MCPClientError(
+                    f"Tool '{tool_name}' not found in any MCP server",
+                    details={"servers": list(self._clients)},
+                )
+        return await self._clients[server].call_tool(
+            tool_name, payload, call_id=call_id, session_id=session_id
+        )
+
+
+_federations: dict[str, tuple[dict[str, MCPClientConfig], dict[str, Any], FederatedMCPClient]] = {}
+
+
+def get_federated_client(
+    key: str,
+    servers: Mapping[str, MCPClientConfig],
+    context_env: Mapping[str, Any] | None = None,
+) -> FederatedMCPClient:
+    """Return the shared federated client for `key`, creating it when servers changed.
+
+    Sharing the client keeps its routing index across requests.
+    """
+    entry = _federations.get(key)
+    if entry is not None:
+        cached_servers, cached_env, federation = entry
+        if cached_servers == servers and cached_env == (context_env or {}):
+            return federation
+    federation = FederatedMCPClient(servers, context_env)
+    _federations[key] = (dict(servers), dict(context_env or {}), federation)
+    return federation
+
+
+def clear_federated_clients() -> None:
+    """Drop every shared federated client."""
+    _federations.clear()
@@ -14,6 +14,13 @@ class Transport(StrEnum):
     HTTP = "http"
 
 
+class ToolResultMode(StrEnum):
+    """How much of the MCP tool response is kept in tool execution results."""
+
+    FULL = "full"
+    LEAN = "lean"
+
+
 class ToolExecutionStatus(StrEnum):
     """Outcome of a tool invocation."""
 
@@ -149,6 +156,23 @@ class ToolExecutionResult:
     session_id: str | None = None
 
 
+@dataobject
+@dataclass
+class ToolInvocationBatch:
+    """Payload to invoke several tools in one request."""
+
+    invocations: list[ToolInvocation]
+    max_concurrency: int | None = None
+
+
+@dataobject
+@dataclass
+class ToolInvocationBatchResult:
+    """Results of a batch of tool invocations, in invocation order."""
+
+    results: list[ToolExecutionResult]
+
+
 @dataobject
 @dataclass
 class ToolCallRequestLog:
@@ -168,6 +192,39 @@ class ToolCallRecord:
     response: ToolExecutionResult
 
 
+@dataobject
+@dataclass
+class SessionPoolSettings:
+    """Pooling of initialized MCP sessions shared by requests to the same server.
+
+    For the stdio transport every session is a server process, so `max_size` is
+    the maximum number of processes started per server configuration.
+    """
+
+    enabled: bool = True
+    max_size: int = 4
+    max_concurrent_requests: int = 8
+    idle_timeout_seconds: float = 300.0
+    health_check_seconds: float = 30.0
+
+
+@dataobject
+@dataclass
+class ToolResultCacheSettings:
+    """Opt-in cache of tool results for identical calls to the same server.
+
+    Results of tools annotated `readOnlyHint` are cached for `ttl_seconds`.
+    `tool_ttl_seconds` overrides the TTL per tool name. It is the only way to cache
+    tools without that hint, such as idempotent writes. A TTL of 0 disables caching
+    for that tool.
+    """
+
+    enabled: bool = False
+    max_entries: int = 1024
+    ttl_seconds: float = 60.0
+    tool_ttl_seconds: dict[str, float] = field(default_factory=dict)
+
+
 @dataobject
 @dataclass
 class MCPClientConfig:
@@ -182,5 +239,22 @@ class MCPClientConfig:
     cwd: str | None = None
     env: dict[str, str] = field(default_factory=dict)
     tool_cache_seconds: float = 30.0
+    tool_cache_stale_seconds: float = 300.0
     list_timeout_seconds: float = 10.0
     call_timeout_seconds: float = 60.0
+    batch_max_concurrency: int = 8
+    result_mode: ToolResultMode = ToolResultMode.FULL
+    session_pool: SessionPoolSettings = field(default_factory=SessionPoolSettings)
+    result_cache: ToolResultCacheSettings = field(default_factory=ToolResultCacheSettings)
+
+
+@dataobject
+@dataclass
+class MCPClientConnectionsSettings:
+    """Settings of the `MCPClientConnections` app connection.
+
+    `warm_up` lists settings keys of `MCPClientConfig` sections whose tool catalogs
+    are listed, concurrently, when the app starts.
+    """
+
+    warm_up: list[str] = field(default_factory=list)
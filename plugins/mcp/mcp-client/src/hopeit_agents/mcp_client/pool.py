@@ -0,0 +1,378 @@
+"""Process-wide pools of initialized MCP client sessions keyed by server.
+
+Opening a transport and running the MCP `initialize` handshake for every request
+adds round trips to each tool call, and for the stdio transport it spawns a new
+server process. `MCPSessionPool` keeps initialized sessions (and their server
+processes) open and multiplexes requests over them. Idle sessions are closed after
+`idle_timeout_seconds` and pinged before reuse once `health_check_seconds` passed
+since they were last known to work; sessions whose transport died are replaced
+by new ones on the next request. To close pooled sessions, and stop stdio server
+processes, when the hopeit app stops, register `MCPClientConnections` in the app
+`app_connections` section::
+
+    "app_connections": {
+      "mcp_client_pool": {
+        "name": "hopeit-agents-mcp-client",
+        "version": "0.1",
+        "client": "hopeit_agents.mcp_client.pool.MCPClientConnections"
+      }
+    }
+
+Settings keys of MCP servers listed under `warm_up`, in a settings section named as
+the connection, have their tool catalogs listed concurrently when the app starts::
+
+    "settings": {
+      "mcp_client_pool": {"warm_up": ["mcp_client"]}
+    }
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from time import monotonic
+
+from hopeit.app.client import Client
+from hopeit.app.config import AppConfig
+from hopeit.dataobjects.payload import Payload
+from hopeit.server.logger import engine_logger
+from mcp import ClientSession, McpError
+
+from hopeit_agents.mcp_client.catalog import clear_tool_catalogs
+from hopeit_agents.mcp_client.models import (
+    MCPClientConfig,
+    MCPClientConnectionsSettings,
+    SessionPoolSettings,
+)
+from hopeit_agents.mcp_client.result_cache import clear_result_caches
+
+__all__ = [
+    "PooledSession",
+    "MCPSessionPool",
+    "get_pool",
+    "close_pools",
+    "MCPClientConnections",
+]
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[ClientSession]]
+
+_CLOSE_TIMEOUT_SECONDS = 5.0
+
+logger = engine_logger()
+
+
+class PooledSession:
+    """Initialized MCP session kept open by a task that owns its transport.
+
+    SDK transports run in anyio task groups that must be exited by the same task
+    that entered them, so every pooled session lives in its own task until closed.
+    """
+
+    def __init__(self, factory: SessionFactory) -> None:
+        self._factory = factory
+        self._closing = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._session: ClientSession | None = None
+        self.alive = False
+        self.discarded = False
+        self.in_use = 0
+        self.opening: asyncio.Task[None] | None = None
+        self.last_used = self.last_checked = monotonic()
+
+    @property
+    def session(self) -> ClientSession:
+        """The initialized MCP session."""
+        assert self._session is not None, "Session not opened"
+        return self._session
+
+    async def open(self, timeout: float) -> None:
+        """Start the owner task and wait until the session is initialized."""
+        ready: asyncio.Future[ClientSession] = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(ready))
+        try:
+            async with asyncio.timeout(timeout):
+                self._session = await ready
+        except BaseException:
+            await self.close()
+            raise
+        self.alive = True
+
+    def discard(self) -> None:
+        """Mark the session as unusable, so it is closed instead of returned to the pool."""
+        self.discarded = True
+        self.alive = False
+
+    async def close(self) -> None:
+        """Close the session and its transport."""
+        self.alive = False
+        self._closing.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._task, timeout=_CLOSE_TIMEOUT_SECONDS)
+            except TimeoutError:
+                pass  # wait_for already cancelled the owner task
+
+    async def _run(self, ready: asyncio.Future[ClientSession]) -> None:
+        try:
+            async with self._factory() as session:
+                if ready.done():  # open() gave up waiting
+                    return
+                ready.set_result(session)
+                await self._closing.wait()
+        except Exception as exc:
+            if not ready.done():
+                ready.set_exception(exc)
+        finally:
+            self.alive = False
+            if not ready.done():
+                ready.cancel()
+
+
+class MCPSessionPool:
+    """Bounded pool of initialized sessions to a single MCP server.
+
+    Up to `max_concurrent_requests` requests are multiplexed over each session, as
+    MCP matches responses to requests by id. A new session is opened only when all
+    open sessions are at that limit, up to `max_size` sessions.
+    """
+
+    def __init__(
+        self, factory: SessionFactory, settings: SessionPoolSettings, *, open_timeout: float
+    ) -> None:
+        self._factory = factory
+        self._settings = settings
+        self._open_timeout = open_timeout
+        self._sessions: list[PooledSession] = []
+        self._released = asyncio.Event()
+        self._closing: set[asyncio.Task[None]] = set()
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Number of open sessions, including those being initialized."""
+        return len(self._sessions)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[PooledSession]:
+        """Lease a session for one request and release it afterwards.
+
+        Sessions are discarded when the request fails with anything other than an
+        MCP protocol error or a timeout, since the transport state is unknown.
+        """
+        pooled = await self._checkout()
+        try:
+            yield pooled
+        except (McpError, TimeoutError):
+            self._release(pooled, healthy=False)
+            raise
+        except BaseException:
+            pooled.discard()
+            self._release(pooled, healthy=False)
+            raise
+        self._release(pooled, healthy=True)
+
+    def require_health_check(self) -> None:
+        """Ping every open session before its next use, e.g. after the server restarted."""
+        for pooled in self._sessions:
+            pooled.last_checked = float("-inf")
+
+    @property
+    def drained(self) -> bool:
+        """Whether the pool was retired and every session of it is closed."""
+        return self._closed and not self._sessions and not self._closing
+
+    def retire(self) -> None:
+        """Start closing idle sessions. Leased sessions are closed when released."""
+        self._closed = True
+        for pooled in list(self._sessions):
+            if pooled.in_use == 0:
+                self._remove(pooled)
+
+    async def close(self) -> None:
+        """Close idle sessions and wait for them. Leased sessions are closed when released."""
+        self.retire()
+        await asyncio.gather(*self._closing)
+
+    async def _checkout(self) -> PooledSession:
+        limit = max(1, self._settings.max_concurrent_requests)
+        while True:
+            self._evict()
+            available = [
+                pooled
+                for pooled in self._sessions
+                if pooled.in_use < limit
+                and (pooled.alive or (pooled.opening is not None and not pooled.opening.done()))
+            ]
+            if available:
+                # least loaded, then most recently used, so extra sessions age out
+                pooled = min(available, key=lambda item: (item.in_use, -item.last_used))
+                pooled.in_use += 1
+                if pooled.opening is not None:
+                    await self._wait_open(pooled)
+                    return pooled
+                if monotonic() - pooled.last_checked < self._settings.health_check_seconds:
+                    return pooled
+                try:
+                    healthy = await self._ping(pooled)
+                except BaseException:
+                    # Cancelled while pinging: give the capacity back
+                    self._release(pooled, healthy=False)
+                    raise
+                if healthy:
+                    return pooled
+                pooled.discard()
+                self._release(pooled, healthy=False)
+                continue
+            if len(self._sessions) < max(1, self._settings.max_size):
+                pooled = PooledSession(self._factory)
+                pooled.in_use = 1
+                pooled.opening = asyncio.create_task(pooled.open(self._open_timeout))
+                # Consume the error when every waiting request was cancelled
+                pooled.opening.add_done_callback(lambda task: task.cancelled() or task.exception())
+                self._sessions.append(pooled)
+                await self._wait_open(pooled)
+                return pooled
+            released = self._released
+            await released.wait()
+
+    async def _wait_open(self, pooled: PooledSession) -> None:
+        """Wait for a session being opened, shared by requests arriving meanwhile."""
+        assert pooled.opening is not None
+        try:
+            await asyncio.shield(pooled.opening)
+        except BaseException:
+            self._release(pooled, healthy=False)
+            raise
+        pooled.opening = None
+        self._notify()
+
+    async def _ping(self, pooled: PooledSession) -> bool:
+        try:
+            await asyncio.wait_for(pooled.session.send_ping(), timeout=self._open_timeout)
+        except Exception:
+            return False
+        pooled.last_checked = monotonic()
+        return True
+
+    def _release(self, pooled: PooledSession, *, healthy: bool) -> None:
+        now = monotonic()
+        pooled.in_use -= 1
+        pooled.last_used = now
+        if healthy:
+            pooled.last_checked = now
+        if self._closed or pooled.discarded or not pooled.alive:
+            # No new requests are routed to it; close once in-flight requests finish
+            pooled.discard()
+            if pooled.in_use == 0:
+                self._remove(pooled)
+        self._notify()
+
+    def _evict(self) -> None:
+        """Close sessions that died, or stayed idle for longer than the idle timeout."""
+        deadline = monotonic() - self._settings.idle_timeout_seconds
+        for pooled in list(self._sessions):
+            if pooled.in_use == 0 and (not pooled.alive or pooled.last_used <= deadline):
+                self._remove(pooled)
+
+    def _remove(self, pooled: PooledSession) -> None:
+        if pooled in self._sessions:
+            self._sessions.remove(pooled)
+            task = asyncio.create_task(pooled.close())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+            self._notify()
+
+    def _notify(self) -> None:
+        """Wake up requests waiting for a session."""
+        self._released.set()
+        self._released = asyncio.Event()
+
+
+_pools: dict[str, tuple[MCPClientConfig, dict[str, str], MCPSessionPool]] = {}
+_retired: list[MCPSessionPool] = []
+
+
+def get_pool(
+    key: str, config: MCPClientConfig, env: Mapping[str, str], factory: SessionFactory
+) -> MCPSessionPool:
+    """Return the shared pool for the server `key`, creating it when config changed.
+
+    `factory` opens and initializes a new session to the server described by `config`.
+    """
+    entry = _pools.get(key)
+    if entry is not None:
+        cached_config, cached_env, pool = entry
+        if cached_config == config and cached_env == env:
+            return pool
+        # Sessions in use by in-flight requests are closed when released
+        pool.retire()
+        _retired.append(pool)
+        _retired[:] = [retired for retired in _retired if not retired.drained]
+
+    pool = MCPSessionPool(factory, config.session_pool, open_timeout=config.list_timeout_seconds)
+    _pools[key] = (config, dict(env), pool)
+    return pool
+
+
+async def close_pools() -> None:
+    """Close every registered pool and clear the registry."""
+    pools = [pool for _, _, pool in _pools.values()] + _retired
+    _pools.clear()
+    _retired.clear()
+    for pool in pools:
+        await pool.close()
+
+
+class MCPClientConnections(Client):
+    """hopeit app connection that ties pooled MCP sessions to the app lifecycle.
+
+    The engine calls `start()` when the app starts and `stop()` when it stops,
+    closing every pooled session registered in this process. Tool catalogs of the
+    servers listed in the `warm_up` setting of the connection are listed when the
+    app starts, see `MCPClientConnectionsSettings`.
+    """
+
+    def __init__(self, app_config: AppConfig, app_connection: str) -> None:
+        self.app_key = app_config.app_key()
+        self.app_connection = app_connection
+        settings_key = app_config.app_connections[app_connection].settings or app_connection
+        settings = Payload.from_obj(
+            app_config.settings.get(settings_key, {}), datatype=MCPClientConnectionsSettings
+        )
+        self._warm_up_servers = {
+            key: Payload.from_obj(app_config.settings[key], datatype=MCPClientConfig)
+            for key in settings.warm_up
+        }
+        self._env = app_config.env
+        self._warm_up: asyncio.Task[None] | None = None
+
+    async def start(self) -> "MCPClientConnections":
+        """Start listing the tools of `warm_up` servers in the background.
+
+        Sessions are opened lazily on first request.
+        """
+        if self._warm_up_servers:
+            self._warm_up = asyncio.create_task(self._list_tools())
+        return self
+
+    async def stop(self) -> None:
+        """Close pooled sessions and drop cached tool catalogs, results and federations."""
+        # Imported here: the federated client depends on the client, which uses pools
+        from hopeit_agents.mcp_client.federation import clear_federated_clients
+
+        if self._warm_up is not None:
+            self._warm_up.cancel()
+            await asyncio.gather(self._warm_up, return_exceptions=True)
+            self._warm_up = None
+        clear_federated_clients()
+        await clear_tool_catalogs()
+        clear_result_caches()
+        await close_pools()
+
+    async def _list_tools(self) -> None:
+        """List the tool catalogs of every `warm_up` server concurrently."""
+        from hopeit_agents.mcp_client.federation import FederatedMCPClient
+
+        federation = FederatedMCPClient(self._warm_up_servers, self._env)
+        await federation.list_tools()
+        for key, error in federation.errors.items():
+            logger.warning(__name__, f"Failed warming up tool catalog of MCP server {key}: {error}")
@@ -0,0 +1,119 @@
+"""Process-wide cache of MCP tool results keyed by server, tool and arguments.
+
+Results are keyed by a canonical hash of the server identity, the tool name and
+the call arguments, so identical calls to read-only tools, or to tools given a
+TTL in the settings, are answered without calling the server again. Every hit
+adds the latency of the original call to `saved_latency_ms`. Results are copied in
+and out of the cache, so callers modifying a result cannot change cached entries.
+Servers get a cache per distinct settings, shared by the clients using them.
+"""
+
+import copy
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
+from time import monotonic
+from typing import Any
+
+from hopeit.dataobjects import dataclass, dataobject
+from hopeit.dataobjects.payload import Payload
+
+from hopeit_agents.mcp_client.models import ToolExecutionResult, ToolResultCacheSettings
+
+__all__ = [
+    "ToolResultCache",
+    "ToolResultCacheStats",
+    "tool_result_key",
+    "get_result_cache",
+    "clear_result_caches",
+]
+
+
+@dataobject
+@dataclass
+class ToolResultCacheStats:
+    """Hit and miss counters of a tool result cache."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    entries: int = 0
+    saved_latency_ms: float = 0.0
+
+
+def tool_result_key(server_key: str, tool_name: str, arguments: Mapping[str, Any] | None) -> str:
+    """Return the canonical hash identifying a tool call."""
+    canonical_json = json.dumps(
+        {"server": server_key, "tool": tool_name, "arguments": arguments or {}},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+
+class ToolResultCache:
+    """In-memory LRU cache of successful tool results with per-entry TTL."""
+
+    def __init__(self, settings: ToolResultCacheSettings) -> None:
+        self._max_entries = settings.max_entries
+        # key -> (expires_at, latency_ms, result)
+        self._entries: OrderedDict[str, tuple[float, float, ToolExecutionResult]] = OrderedDict()
+        self._stats = ToolResultCacheStats()
+
+    @property
+    def stats(self) -> ToolResultCacheStats:
+        """Return a snapshot of cache counters."""
+        return ToolResultCacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            stores=self._stats.stores,
+            evictions=self._stats.evictions,
+            entries=len(self._entries),
+            saved_latency_ms=self._stats.saved_latency_ms,
+        )
+
+    def get(self, key: str) -> ToolExecutionResult | None:
+        """Return a copy of the cached result for `key` if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, latency_ms, result = entry
+            if monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                self._stats.saved_latency_ms += latency_ms
+                return copy.deepcopy(result)
+            del self._entries[key]
+        self._stats.misses += 1
+        return None
+
+    def put(
+        self, key: str, result: ToolExecutionResult, *, ttl_seconds: float, latency_ms: float
+    ) -> None:
+        """Store a copy of a successful tool result, taking `latency_ms` to call the tool."""
+        self._entries[key] = (monotonic() + ttl_seconds, latency_ms, copy.deepcopy(result))
+        self._entries.move_to_end(key)
+        self._stats.stores += 1
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+
+_caches: dict[tuple[str, str], ToolResultCache] = {}
+
+
+def get_result_cache(server_key: str, settings: ToolResultCacheSettings) -> ToolResultCache:
+    """Return the result cache shared by clients of a server using the same settings."""
+    key = (server_key, Payload.to_json(settings))
+    cache = _caches.get(key)
+    if cache is None:
+        cache = _caches[key] = ToolResultCache(settings)
+    return cache
+
+
+def clear_result_caches() -> None:
+    """Drop every cached tool result."""
+    _caches.clear()
@@ -0,0 +1,59 @@
+"""Benchmark memory retained by tool execution results for large tool outputs.
+
+MCP servers returning structured content usually repeat it as JSON text content,
+and the full result mode also keeps a `raw_result` dump of the whole response, so
+a large tool output is held three times. Lean mode keeps it once.
+
+Run with::
+
+    python plugins/mcp/mcp-client/test/benchmark/bench_result_memory.py
+"""
+
+import json
+import tracemalloc
+
+from mcp import types
+
+from hopeit_agents.mcp_client.client import MCPClient
+from hopeit_agents.mcp_client.models import ToolExecutionResult, ToolResultMode
+
+RESULTS = 20
+
+
+def _call_tool_result(rows: int) -> types.CallToolResult:
+    structured = {
+        "rows": [{"id": i, "name": f"row {i}", "tags": ["a", "b", "c"]} for i in range(rows)]
+    }
+    return types.CallToolResult(
+        content=[types.TextContent(type="text", text=json.dumps(structured))],
+        structuredContent=structured,
+    )
+
+
+def _retained_kib(rows: int, mode: ToolResultMode) -> float:
+    tracemalloc.start()
+    responses = [_call_tool_result(rows) for _ in range(RESULTS)]
+    results: list[ToolExecutionResult] = [
+        MCPClient._tool_result_from_mcp(
+            "bench", response, call_id=f"call_{i}", session_id=None, mode=mode
+        )
+        for i, response in enumerate(responses)
+    ]
+    # Responses are dropped once converted, as in `MCPClient.call_tool`
+    del responses
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(results) == RESULTS
+    return retained / 1024.0 / RESULTS
+
+
+def main() -> None:
+    print(f"{'rows':>8} {'full KiB/result':>16} {'lean KiB/result':>16} {'saved':>7}")
+    for rows in (10, 1000, 10000):
+        full = _retained_kib(rows, ToolResultMode.FULL)
+        lean = _retained_kib(rows, ToolResultMode.LEAN)
+        print(f"{rows:>8} {full:>16.1f} {lean:>16.1f} {1.0 - lean / full:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -31,6 +31,8 @@ async def test_invoke_tool_returns_execution_result(monkeypatch: pytest.MonkeyPa
         return {"ENV_FLAG": "invoke"}
 
     class FakeClient:
+        result_cache = None
+
         def __init__(
             self,
             *,
@@ -0,0 +1,57 @@
+"""Integration tests for the invoke_tools API event."""
+
+import pytest
+from hopeit.testing.apps import config, execute_event
+
+from hopeit_agents.mcp_client.api import invoke_tools as invoke_tools_module
+from hopeit_agents.mcp_client.models import (
+    MCPClientConfig,
+    ToolExecutionResult,
+    ToolExecutionStatus,
+    ToolInvocation,
+    ToolInvocationBatch,
+    ToolInvocationBatchResult,
+)
+
+
+@pytest.mark.asyncio
+async def test_invoke_tools_returns_results_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """invoke_tools event should pass every invocation to the MCP client."""
+
+    captured: dict[str, object] = {}
+
+    class FakeClient:
+        def __init__(self, *, config: MCPClientConfig, env: dict[str, str]) -> None:
+            captured["client_config"] = config
+
+        async def call_tools(
+            self, invocations: list[ToolInvocation], *, max_concurrency: int
+        ) -> list[ToolExecutionResult]:
+            captured["max_concurrency"] = max_concurrency
+            return [
+                ToolExecutionResult(
+                    call_id=invocation.call_id or "",
+                    tool_name=invocation.tool_name,
+                    status=ToolExecutionStatus.ERROR
+                    if invocation.tool_name == "missing"
+                    else ToolExecutionStatus.SUCCESS,
+                )
+                for invocation in invocations
+            ]
+
+    monkeypatch.setattr(invoke_tools_module, "MCPClient", FakeClient)
+
+    app_config = config("plugins/mcp/mcp-client/config/plugin-config.json")
+    payload = ToolInvocationBatch(
+        invocations=[
+            ToolInvocation(tool_name="demo/tool.sum", payload={"a": 1}, call_id="call-1"),
+            ToolInvocation(tool_name="missing", call_id="call-2"),
+        ]
+    )
+
+    response = await execute_event(app_config, "api.invoke_tools", payload)
+
+    assert isinstance(response, ToolInvocationBatchResult)
+    assert [result.call_id for result in response.results] == ["call-1", "call-2"]
+    assert response.results[1].status is ToolExecutionStatus.ERROR
+    assert captured["max_concurrency"] == 8
@@ -0,0 +1,124 @@
+"""Unit tests for the shared tool catalog cache."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+from mcp import types
+
+from hopeit_agents.mcp_client import catalog
+from hopeit_agents.mcp_client.client import MCPClient, MCPClientError
+from hopeit_agents.mcp_client.models import MCPClientConfig, ToolDescriptor, Transport
+
+
+@pytest.fixture(autouse=True)
+async def reset_catalogs() -> AsyncGenerator[None, None]:
+    yield
+    await catalog.clear_tool_catalogs()
+
+
+def _config(cache_seconds: float = 30.0, stale_seconds: float = 300.0) -> MCPClientConfig:
+    return MCPClientConfig(
+        transport=Transport.HTTP,
+        url="http://127.0.0.1:8765/mcp",
+        tool_cache_seconds=cache_seconds,
+        tool_cache_stale_seconds=stale_seconds,
+    )
+
+
+class FakeServer:
+    """Counts `tools/list` requests, answering with numbered catalogs."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.fail = False
+
+    async def fetch(self) -> list[ToolDescriptor]:
+        self.requests += 1
+        version = self.requests
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise MCPClientError("unreachable")
+        return [
+            ToolDescriptor(
+                name=f"tool-v{version}",
+                title=None,
+                description=None,
+                input_schema={},
+                output_schema=None,
+            )
+        ]
+
+
+def _names(tools: list[ToolDescriptor]) -> list[str]:
+    return [tool.name for tool in tools]
+
+
+async def test_concurrent_requests_share_one_listing() -> None:
+    server = FakeServer()
+
+    results = await asyncio.gather(
+        *(catalog.get_tools("server", _config(), server.fetch) for _ in range(5))
+    )
+
+    assert server.requests == 1
+    assert all(_names(tools) == ["tool-v1"] for tools in results)
+    assert _names(await catalog.get_tools("server", _config(), server.fetch)) == ["tool-v1"]
+    assert server.requests == 1
+
+
+async def test_stale_catalog_is_served_while_refreshing() -> None:
+    server = FakeServer()
+    config = _config(cache_seconds=0.01)
+    await catalog.get_tools("server", config, server.fetch)
+    await asyncio.sleep(0.02)
+
+    stale = await asyncio.gather(
+        *(catalog.get_tools("server", config, server.fetch) for _ in range(3))
+    )
+    await asyncio.sleep(0.02)
+
+    assert all(_names(tools) == ["tool-v1"] for tools in stale)
+    assert server.requests == 2
+    assert _names(await catalog.get_tools("server", _config(), server.fetch)) == ["tool-v2"]
+
+
+async def test_failed_refresh_keeps_stale_catalog() -> None:
+    server = FakeServer()
+    config = _config(cache_seconds=0.01)
+    await catalog.get_tools("server", config, server.fetch)
+    await asyncio.sleep(0.02)
+    server.fail = True
+
+    assert _names(await catalog.get_tools("server", config, server.fetch)) == ["tool-v1"]
+    await asyncio.sleep(0.02)
+    assert _names(await catalog.get_tools("server", config, server.fetch)) == ["tool-v1"]
+
+
+async def test_expired_catalog_is_listed_again() -> None:
+    server = FakeServer()
+    config = _config(cache_seconds=0.01, stale_seconds=0.0)
+    await catalog.get_tools("server", config, server.fetch)
+    await asyncio.sleep(0.02)
+
+    assert _names(await catalog.get_tools("server", config, server.fetch)) == ["tool-v2"]
+
+
+async def test_tool_list_changed_notification_invalidates_catalog() -> None:
+    server = FakeServer()
+    client = MCPClient(config=_config())
+    key = client.server_key()
+    await catalog.get_tools(key, _config(cache_seconds=0.01), server.fetch)
+    await asyncio.sleep(0.02)
+    # starts a background refresh that completes after the notification
+    await catalog.get_tools(key, _config(cache_seconds=0.01), server.fetch)
+
+    await client._on_server_message(
+        types.ServerNotification(
+            types.ToolListChangedNotification(method="notifications/tools/list_changed")
+        )
+    )
+    await asyncio.sleep(0.02)
+
+    assert _names(await catalog.get_tools(key, _config(), server.fetch)) == ["tool-v3"]
+    assert server.requests == 3
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
@@ -9,8 +10,16 @@ from typing import Any
 import pytest
 from mcp import types
 
+from hopeit_agents.mcp_client import catalog, pool
 from hopeit_agents.mcp_client.client import MCPClient
-from hopeit_agents.mcp_client.models import MCPClientConfig, Transport
+from hopeit_agents.mcp_client.models import MCPClientConfig, ToolResultMode, Transport
+
+
+@pytest.fixture(autouse=True)
+async def reset_pools() -> AsyncGenerator[None, None]:
+    yield
+    await catalog.clear_tool_catalogs()
+    await pool.close_pools()
 
 
 def _client_config() -> MCPClientConfig:
@@ -73,3 +82,63 @@ async def test_list_tools_uses_cache(monkeypatch: pytest.MonkeyPatch) -> None:
     assert tools_first == tools_second
     assert len(session_holder) == 1
     assert session_holder[0].list_calls == 1
+
+
+def _structured_result() -> types.CallToolResult:
+    structured = {"rows": [{"id": i, "name": f"row {i}"} for i in range(3)]}
+    return types.CallToolResult(
+        content=[
+            types.TextContent(type="text", text=json.dumps(structured)),
+            types.TextContent(type="text", text="3 rows found"),
+        ],
+        structuredContent=structured,
+    )
+
+
+def test_full_result_mode_keeps_raw_result() -> None:
+    result = MCPClient._tool_result_from_mcp(
+        "demo", _structured_result(), call_id="c1", session_id=None
+    )
+
+    assert result.raw_result is not None
+    assert len(result.content) == 2
+
+
+def test_lean_result_mode_stores_tool_output_once() -> None:
+    result = MCPClient._tool_result_from_mcp(
+        "demo",
+        _structured_result(),
+        call_id="c1",
+        session_id=None,
+        mode=ToolResultMode.LEAN,
+    )
+
+    assert result.raw_result is None
+    assert result.structured_content == {"rows": [{"id": i, "name": f"row {i}"} for i in range(3)]}
+    assert [item["text"] for item in result.content] == ["3 rows found"]
+
+
+def test_lean_result_mode_only_parses_candidate_texts(monkeypatch: pytest.MonkeyPatch) -> None:
+    parsed: list[str] = []
+    loads = json.loads
+
+    def counting_loads(text: str) -> Any:
+        parsed.append(text)
+        return loads(text)
+
+    structured = {"rows": [1, 2]}
+    texts = [json.dumps(structured), '{"other": 1}', "[1, 2]", "{not json", "{} trailer"]
+    monkeypatch.setattr(json, "loads", counting_loads)
+    result = MCPClient._tool_result_from_mcp(
+        "demo",
+        types.CallToolResult(
+            content=[types.TextContent(type="text", text=text) for text in texts],
+            structuredContent=structured,
+        ),
+        call_id="c1",
+        session_id=None,
+        mode=ToolResultMode.LEAN,
+    )
+
+    assert parsed == [json.dumps(structured)]
+    assert [item["text"] for item in result.content] == texts[1:]
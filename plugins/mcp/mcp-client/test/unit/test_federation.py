@@ -0,0 +1,154 @@
+"""Unit tests for the federated MCP client."""
+
+import asyncio
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from hopeit.app.config import AppConfig, AppConnection, AppDescriptor
+
+from hopeit_agents.mcp_client import federation
+from hopeit_agents.mcp_client.client import MCPClient, MCPClientError
+from hopeit_agents.mcp_client.federation import FederatedMCPClient
+from hopeit_agents.mcp_client.models import (
+    MCPClientConfig,
+    ToolDescriptor,
+    ToolExecutionResult,
+    ToolExecutionStatus,
+    Transport,
+)
+from hopeit_agents.mcp_client.pool import MCPClientConnections
+
+
+def _tool(name: str) -> ToolDescriptor:
+    return ToolDescriptor(
+        name=name, title=None, description=None, input_schema={}, output_schema=None
+    )
+
+
+class FakeServers:
+    """Tool catalogs and recorded calls of fake servers, by URL."""
+
+    def __init__(self) -> None:
+        self.catalogs: dict[str, list[str]] = {
+            "http://agents/mcp": ["ask_expert", "search"],
+            "http://tools/mcp": ["search", "sum"],
+            "http://down/mcp": ["report"],
+        }
+        self.down: set[str] = set()
+        self.listing: list[str] = []
+        self.calls: list[tuple[str, str]] = []
+
+
+@pytest.fixture
+def servers(monkeypatch: pytest.MonkeyPatch) -> Generator[FakeServers, None, None]:
+    fake = FakeServers()
+
+    async def list_tools(self: MCPClient) -> list[ToolDescriptor]:
+        url = str(self._config.url)
+        fake.listing.append(url)
+        await asyncio.sleep(0.01)
+        if url in fake.down:
+            raise MCPClientError(f"{url} unreachable")
+        return [_tool(name) for name in fake.catalogs[url]]
+
+    async def call_tool(
+        self: MCPClient, tool_name: str, payload: dict[str, Any] | None, **kwargs: Any
+    ) -> ToolExecutionResult:
+        fake.calls.append((str(self._config.url), tool_name))
+        return ToolExecutionResult(
+            call_id=kwargs["call_id"] or "call",
+            tool_name=tool_name,
+            status=ToolExecutionStatus.SUCCESS,
+        )
+
+    monkeypatch.setattr(MCPClient, "list_tools", list_tools)
+    monkeypatch.setattr(MCPClient, "call_tool", call_tool)
+    yield fake
+    federation.clear_federated_clients()
+
+
+def _servers(*names: str) -> dict[str, MCPClientConfig]:
+    return {
+        name: MCPClientConfig(transport=Transport.HTTP, url=f"http://{name}/mcp") for name in names
+    }
+
+
+async def test_catalogs_are_merged_and_calls_routed(servers: FakeServers) -> None:
+    client = FederatedMCPClient(_servers("agents", "tools"))
+
+    tools = await client.list_tools()
+    await client.call_tool("sum", {"a": 1}, call_id="c1")
+    await client.call_tool("search", {})
+
+    assert [tool.name for tool in tools] == ["ask_expert", "search", "sum"]
+    assert client.server_for("search") == "agents"
+    assert servers.calls == [("http://tools/mcp", "sum"), ("http://agents/mcp", "search")]
+    assert len(servers.listing) == 2
+
+
+async def test_failing_server_only_degrades_its_tools(servers: FakeServers) -> None:
+    client = FederatedMCPClient(_servers("down", "tools"))
+    await client.list_tools()
+    servers.down.add("http://down/mcp")
+
+    tools = await client.list_tools()
+
+    assert [tool.name for tool in tools] == ["report", "search", "sum"]
+    assert list(client.errors) == ["down"]
+
+    fresh = FederatedMCPClient(_servers("down", "tools"))
+    assert [tool.name for tool in await fresh.list_tools()] == ["search", "sum"]
+    await fresh.call_tool("sum", {})
+    with pytest.raises(MCPClientError):
+        await fresh.call_tool("report", {})
+
+
+async def test_unknown_tool_refreshes_index_once(servers: FakeServers) -> None:
+    client = federation.get_federated_client("agent", _servers("agents", "tools"))
+    await client.list_tools()
+    servers.catalogs["http://tools/mcp"].append("new_tool")
+
+    await federation.get_federated_client("agent", _servers("agents", "tools")).call_tool(
+        "new_tool", {}
+    )
+    with pytest.raises(MCPClientError):
+        await client.call_tool("missing", {})
+
+    assert servers.calls == [("http://tools/mcp", "new_tool")]
+    assert len(servers.listing) == 6
+
+
+async def test_single_server_receives_every_call(servers: FakeServers) -> None:
+    client = FederatedMCPClient(_servers("tools"))
+
+    await client.call_tool("new_tool", {})
+
+    assert servers.calls == [("http://tools/mcp", "new_tool")]
+    assert servers.listing == []
+
+
+async def test_connections_warm_up_catalogs_and_clear_federations(servers: FakeServers) -> None:
+    app_config = AppConfig(
+        app=AppDescriptor(name="test-app", version="0.1"),
+        app_connections={
+            "mcp_client_pool": AppConnection(
+                name="hopeit-agents-mcp-client",
+                version="0.1",
+                client="hopeit_agents.mcp_client.pool.MCPClientConnections",
+            )
+        },
+        settings={
+            "mcp_client_pool": {"warm_up": ["agents", "tools"]},
+            "agents": {"transport": "http", "url": "http://agents/mcp"},
+            "tools": {"transport": "http", "url": "http://tools/mcp"},
+        },
+    )
+    federated = federation.get_federated_client("agent", _servers("tools"))
+    connections = await MCPClientConnections(app_config, "mcp_client_pool").start()
+
+    await asyncio.sleep(0.05)
+    await connections.stop()
+
+    assert sorted(servers.listing) == ["http://agents/mcp", "http://tools/mcp"]
+    assert federation.get_federated_client("agent", _servers("tools")) is not federated
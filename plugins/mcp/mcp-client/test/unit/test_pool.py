@@ -0,0 +1,276 @@
+"""Unit tests for pooled MCP sessions."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import anyio
+import pytest
+from mcp import McpError, types
+
+from hopeit_agents.mcp_client import pool
+from hopeit_agents.mcp_client.client import MCPClient, MCPClientError
+from hopeit_agents.mcp_client.models import (
+    MCPClientConfig,
+    SessionPoolSettings,
+    ToolExecutionStatus,
+    ToolInvocation,
+    Transport,
+)
+
+
+class FakeSession:
+    """MCP session stub recording requests and whether it was closed."""
+
+    def __init__(self, servers: "FakeServer") -> None:
+        self.server = servers
+        self.closed = False
+        self.calls = 0
+
+    async def list_tools(self) -> types.ListToolsResult:
+        self.calls += 1
+        return types.ListToolsResult(tools=[])
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None) -> types.CallToolResult:
+        self.calls += 1
+        if self.server.expired is self:
+            raise McpError(types.ErrorData(code=32600, message="Session terminated"))
+        if self.server.exited is self:
+            raise anyio.ClosedResourceError
+        if name == "broken":
+            raise McpError(types.ErrorData(code=types.INVALID_PARAMS, message="bad arguments"))
+        if self.server.crash_on_call:
+            raise McpError(types.ErrorData(code=types.CONNECTION_CLOSED, message="closed"))
+        self.server.in_flight += 1
+        self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        await asyncio.sleep(0.01)
+        self.server.in_flight -= 1
+        return types.CallToolResult(content=[types.TextContent(type="text", text=name)])
+
+    async def send_ping(self) -> types.EmptyResult:
+        if self.server.ping_hangs:
+            await asyncio.sleep(10.0)
+        if self.server.ping_fails:
+            raise McpError(types.ErrorData(code=types.CONNECTION_CLOSED, message="closed"))
+        return types.EmptyResult()
+
+
+class FakeServer:
+    """Tracks sessions opened through the patched `MCPClient._session`."""
+
+    def __init__(self) -> None:
+        self.sessions: list[FakeSession] = []
+        self.expired: FakeSession | None = None
+        self.exited: FakeSession | None = None
+        self.crash_on_call = False
+        self.ping_fails = False
+        self.ping_hangs = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+@pytest.fixture
+async def server(monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[FakeServer, None]:
+    fake_server = FakeServer()
+
+    @asynccontextmanager
+    async def fake_session(self: MCPClient) -> AsyncGenerator[FakeSession, None]:
+        session = FakeSession(fake_server)
+        fake_server.sessions.append(session)
+        try:
+            yield session
+        finally:
+            session.closed = True
+
+    monkeypatch.setattr(MCPClient, "_session", fake_session)
+    yield fake_server
+    await pool.close_pools()
+
+
+def _config(**pool_settings: Any) -> MCPClientConfig:
+    return MCPClientConfig(
+        transport=Transport.HTTP,
+        url="http://127.0.0.1:8765/mcp",
+        tool_cache_seconds=0.0,
+        session_pool=SessionPoolSettings(**pool_settings),
+    )
+
+
+def _stdio_config(command: str = "demo-server") -> MCPClientConfig:
+    return MCPClientConfig(transport=Transport.STDIO, command=command, tool_cache_seconds=0.0)
+
+
+async def test_sessions_are_reused_across_clients(server: FakeServer) -> None:
+    config = _config()
+
+    await MCPClient(config=config).list_tools()
+    await MCPClient(config=config).call_tool("demo", {})
+    await MCPClient(config=config).list_tools()
+
+    assert len(server.sessions) == 1
+    assert server.sessions[0].calls == 3
+    assert not server.sessions[0].closed
+
+
+async def test_pool_size_bounds_concurrent_sessions(server: FakeServer) -> None:
+    config = _config(max_size=2, max_concurrent_requests=1)
+
+    results = await asyncio.gather(
+        *(MCPClient(config=config).call_tool(f"tool-{i}", {}) for i in range(6))
+    )
+
+    assert [result.content[0]["text"] for result in results] == [f"tool-{i}" for i in range(6)]
+    assert len(server.sessions) == 2
+    assert server.max_in_flight == 2
+
+
+async def test_idle_sessions_are_evicted(server: FakeServer) -> None:
+    config = _config(idle_timeout_seconds=0.0)
+
+    await MCPClient(config=config).list_tools()
+    await MCPClient(config=config).list_tools()
+    await asyncio.sleep(0)
+
+    assert len(server.sessions) == 2
+    assert server.sessions[0].closed
+
+
+async def test_unhealthy_session_is_reinitialized(server: FakeServer) -> None:
+    config = _config(health_check_seconds=0.0)
+
+    await MCPClient(config=config).list_tools()
+    server.ping_fails = True
+    await MCPClient(config=config).list_tools()
+    await asyncio.sleep(0)
+
+    assert len(server.sessions) == 2
+    assert server.sessions[0].closed
+    assert server.sessions[1].calls == 1
+
+
+async def test_cancelled_health_check_releases_session(server: FakeServer) -> None:
+    config = _config(max_size=1, max_concurrent_requests=1, health_check_seconds=0.0)
+
+    await MCPClient(config=config).list_tools()
+    server.ping_hangs = True
+    task = asyncio.create_task(MCPClient(config=config).list_tools())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    server.ping_hangs = False
+
+    await asyncio.wait_for(MCPClient(config=config).list_tools(), timeout=1.0)
+    assert len(server.sessions) == 1
+
+
+async def test_expired_session_is_retried_on_new_session(server: FakeServer) -> None:
+    config = _config()
+    await MCPClient(config=config).list_tools()
+    server.expired = server.sessions[0]
+
+    result = await MCPClient(config=config).call_tool("demo", {})
+    await asyncio.sleep(0)
+
+    assert result.content[0]["text"] == "demo"
+    assert len(server.sessions) == 2
+    assert server.sessions[0].closed
+
+
+async def test_replaced_pool_closes_its_idle_sessions(server: FakeServer) -> None:
+    await MCPClient(config=_config()).list_tools()
+    await MCPClient(config=_config(), env={"TOKEN": "b"}).list_tools()
+    await asyncio.sleep(0.01)
+    await MCPClient(config=_config()).list_tools()
+
+    assert len(server.sessions) == 3
+    assert [session.closed for session in server.sessions] == [True, True, False]
+    assert len(pool._retired) == 1
+
+
+async def test_pooling_can_be_disabled(server: FakeServer) -> None:
+    config = _config(enabled=False)
+
+    await MCPClient(config=config).list_tools()
+    await MCPClient(config=config).list_tools()
+
+    assert len(server.sessions) == 2
+    assert all(session.closed for session in server.sessions)
+
+
+async def test_requests_are_multiplexed_over_a_session(server: FakeServer) -> None:
+    config = _config(max_size=2, max_concurrent_requests=4)
+
+    await asyncio.gather(*(MCPClient(config=config).call_tool(f"tool-{i}", {}) for i in range(4)))
+
+    assert len(server.sessions) == 1
+    assert server.max_in_flight == 4
+
+
+async def test_stdio_server_processes_are_kept_per_command(server: FakeServer) -> None:
+    await MCPClient(config=_stdio_config()).call_tool("demo", {})
+    await MCPClient(config=_stdio_config()).call_tool("demo", {})
+    await MCPClient(config=_stdio_config("other-server")).call_tool("demo", {})
+
+    assert len(server.sessions) == 2
+    assert server.sessions[0].calls == 2
+
+
+async def test_stdio_server_processes_are_kept_per_env_values(server: FakeServer) -> None:
+    tenant_a = MCPClient(config=_stdio_config(), env={"TOKEN": "tenant-a"})
+    tenant_b = MCPClient(config=_stdio_config(), env={"TOKEN": "tenant-b"})
+    await tenant_a.call_tool("demo", {})
+    await tenant_b.call_tool("demo", {})
+    await tenant_a.call_tool("demo", {})
+
+    assert tenant_a.server_key() != tenant_b.server_key()
+    assert "tenant-a" not in tenant_a.server_key()
+    assert [session.calls for session in server.sessions] == [2, 1]
+    assert not any(session.closed for session in server.sessions)
+
+
+async def test_exited_server_is_restarted(server: FakeServer) -> None:
+    await MCPClient(config=_stdio_config()).call_tool("demo", {})
+    server.exited = server.sessions[0]
+
+    result = await MCPClient(config=_stdio_config()).call_tool("demo", {})
+    await asyncio.sleep(0)
+
+    assert result.content[0]["text"] == "demo"
+    assert len(server.sessions) == 2
+    assert server.sessions[0].closed
+
+
+async def test_crash_during_call_is_not_retried(server: FakeServer) -> None:
+    await MCPClient(config=_stdio_config()).list_tools()
+    server.crash_on_call = True
+
+    with pytest.raises(MCPClientError):
+        await MCPClient(config=_stdio_config()).call_tool("demo", {})
+    server.crash_on_call = False
+    await MCPClient(config=_stdio_config()).call_tool("demo", {})
+    await asyncio.sleep(0)
+
+    assert len(server.sessions) == 2
+    assert server.sessions[0].closed
+
+
+async def test_call_tools_share_a_session_and_report_failures(server: FakeServer) -> None:
+    invocations = [
+        ToolInvocation(tool_name=name, call_id=f"c{i}")
+        for i, name in enumerate(["a", "broken", "b", "c", "d"])
+    ]
+
+    results = await MCPClient(config=_config()).call_tools(
+        invocations, max_concurrency=3, session_id="s"
+    )
+
+    assert [result.call_id for result in results] == ["c0", "c1", "c2", "c3", "c4"]
+    assert [result.status for result in results] == [ToolExecutionStatus.SUCCESS] + [
+        ToolExecutionStatus.ERROR
+    ] + [ToolExecutionStatus.SUCCESS] * 3
+    assert results[1].error_message == "MCP protocol error calling tool 'broken'"
+    assert all(result.session_id == "s" for result in results)
+    assert len(server.sessions) == 1
+    assert server.max_in_flight == 3
@@ -0,0 +1,161 @@
+"""Unit tests for the MCP tool result cache."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+from mcp import types
+
+from hopeit_agents.mcp_client import catalog, pool, result_cache
+from hopeit_agents.mcp_client.client import MCPClient
+from hopeit_agents.mcp_client.models import (
+    MCPClientConfig,
+    ToolExecutionStatus,
+    ToolResultCacheSettings,
+    Transport,
+)
+
+
+class FakeSession:
+    """MCP session stub exposing tools with different hints."""
+
+    def __init__(self, calls: list[tuple[str, dict[str, Any] | None]]) -> None:
+        self.calls = calls
+
+    async def list_tools(self) -> types.ListToolsResult:
+        return types.ListToolsResult(
+            tools=[
+                types.Tool(
+                    name=name,
+                    inputSchema={"type": "object"},
+                    annotations=annotations,
+                )
+                for name, annotations in [
+                    ("search", types.ToolAnnotations(readOnlyHint=True)),
+                    ("upsert", types.ToolAnnotations(idempotentHint=True)),
+                    ("send", types.ToolAnnotations(readOnlyHint=False)),
+                ]
+            ]
+        )
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None) -> types.CallToolResult:
+        self.calls.append((name, arguments))
+        await asyncio.sleep(0.005)
+        return types.CallToolResult(
+            content=[types.TextContent(type="text", text=f"{name} {len(self.calls)}")],
+            isError=bool(arguments and arguments.get("fail")),
+        )
+
+
+@pytest.fixture
+async def calls(monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[list[Any], None]:
+    server_calls: list[tuple[str, dict[str, Any] | None]] = []
+
+    @asynccontextmanager
+    async def fake_session(self: MCPClient) -> AsyncGenerator[FakeSession, None]:
+        yield FakeSession(server_calls)
+
+    monkeypatch.setattr(MCPClient, "_session", fake_session)
+    yield server_calls
+    result_cache.clear_result_caches()
+    await catalog.clear_tool_catalogs()
+    await pool.close_pools()
+
+
+def _client(**cache_settings: Any) -> MCPClient:
+    return MCPClient(
+        config=MCPClientConfig(
+            transport=Transport.HTTP,
+            url="http://127.0.0.1:8765/mcp",
+            result_cache=ToolResultCacheSettings(enabled=True, **cache_settings),
+        )
+    )
+
+
+def _text(result: Any) -> str:
+    return str(result.content[0]["text"])
+
+
+async def test_read_only_results_are_cached(calls: list[Any]) -> None:
+    client = _client()
+
+    first = await client.call_tool("search", {"q": "a", "n": 1}, call_id="c1")
+    second = await _client().call_tool("search", {"n": 1, "q": "a"}, call_id="c2", session_id="s")
+    await client.call_tool("upsert", {"id": 1})
+    await client.call_tool("upsert", {"id": 1})
+    other = await client.call_tool("search", {"q": "b", "n": 1})
+
+    assert calls == [
+        ("search", {"q": "a", "n": 1}),
+        ("upsert", {"id": 1}),
+        ("upsert", {"id": 1}),
+        ("search", {"q": "b", "n": 1}),
+    ]
+    assert _text(second) == _text(first) == "search 1"
+    assert (second.call_id, second.session_id) == ("c2", "s")
+    assert first.call_id == "c1"
+    assert _text(other) == "search 4"
+    assert client.result_cache is not None
+    stats = client.result_cache.stats
+    assert (stats.hits, stats.misses, stats.stores, stats.entries) == (1, 2, 2, 2)
+    assert stats.saved_latency_ms > 0
+
+
+async def test_per_tool_ttl_overrides_hints(calls: list[Any]) -> None:
+    client = _client(tool_ttl_seconds={"send": 60.0, "upsert": 60.0, "search": 0.0})
+
+    for _ in range(2):
+        await client.call_tool("send", {"to": "x"})
+        await client.call_tool("upsert", {"id": 1})
+        await client.call_tool("search", {"q": "a"})
+
+    assert [name for name, _ in calls] == ["send", "upsert", "search", "search"]
+
+
+async def test_tools_without_hints_and_errors_are_not_cached(calls: list[Any]) -> None:
+    client = _client()
+
+    for _ in range(2):
+        await client.call_tool("send", {"to": "x"})
+        result = await client.call_tool("search", {"fail": True})
+
+    assert result.status is ToolExecutionStatus.ERROR
+    assert [name for name, _ in calls] == ["send", "search", "send", "search"]
+
+
+async def test_least_recently_used_results_are_evicted(calls: list[Any]) -> None:
+    client = _client(max_entries=2)
+
+    for query in ["a", "b", "a", "c", "a", "b"]:
+        await client.call_tool("search", {"q": query})
+
+    assert [args["q"] for _, args in calls] == ["a", "b", "c", "b"]
+    assert client.result_cache is not None
+    assert client.result_cache.stats.evictions == 2
+
+
+async def test_cached_results_are_not_shared_with_callers(calls: list[Any]) -> None:
+    client = _client()
+
+    first = await client.call_tool("search", {"q": "a"})
+    first.content[0]["text"] = "changed"
+    second = await client.call_tool("search", {"q": "a"})
+    second.content.append({"type": "text", "text": "extra"})
+    third = await client.call_tool("search", {"q": "a"})
+
+    assert len(calls) == 1
+    assert _text(third) == "search 1"
+    assert len(third.content) == 1
+
+
+async def test_clients_with_different_settings_keep_their_caches(calls: list[Any]) -> None:
+    default, small = _client(), _client(max_entries=1)
+
+    await default.call_tool("search", {"q": "a"})
+    await small.call_tool("search", {"q": "b"})
+    await default.call_tool("search", {"q": "a"})
+
+    assert [args["q"] for _, args in calls] == ["a", "b"]
+    assert default.result_cache is not small.result_cache